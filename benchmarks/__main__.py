@@ -0,0 +1,7 @@
+"""Allow running the benchmark suite with ``python -m benchmarks``."""
+
+import sys
+
+from benchmarks.run import main
+
+sys.exit(main())
@@ -0,0 +1,215 @@
+"""
+Synthetic Catalog Generator
+
+Produces seeded, realistic-looking courses, summaries, preparation
+materials, qualifications and technologies at configurable scales.
+The same seed and scale always produce the same catalog.
+"""
+
+import random
+from datetime import date, timedelta
+
+from mcthelper import (
+    CourseDetails,
+    SummaryInfo,
+    LecturePreparation,
+    QualificationManager,
+    TechLearning
+)
+from mcthelper.modules.clock import ManualClock
+
+
+COURSE_PREFIXES = ['AZ', 'AI', 'DP', 'SC', 'MS', 'PL', 'MB', 'MD']
+LEVELS = ['Beginner', 'Intermediate', 'Advanced']
+CATEGORIES = ['Cloud', 'AI', 'DevOps', 'Security', 'Data', 'Networking']
+STATUSES = ['active', 'active', 'active', 'pending', 'expired']
+SUBJECTS = [
+    'Azure', 'Cloud', 'Security', 'Identity', 'Networking', 'Storage',
+    'Compute', 'Data', 'Analytics', 'Machine Learning', 'DevOps',
+    'Kubernetes', 'Governance', 'Compliance', 'Monitoring', 'Power Platform',
+    'Dynamics 365', 'Microsoft 365', 'Copilot', 'Databases',
+]
+ROLES = ['Fundamentals', 'Administrator', 'Developer', 'Engineer',
+         'Architect', 'Specialist', 'Analyst', 'Consultant']
+VERBS = ['Understand', 'Configure', 'Deploy', 'Secure', 'Monitor',
+         'Design', 'Implement', 'Troubleshoot', 'Optimize', 'Automate']
+AUDIENCES = ['IT professionals', 'developers', 'data engineers',
+             'security engineers', 'solution architects', 'administrators',
+             'business analysts', 'students new to cloud computing']
+RESOURCES = ['Microsoft Learn', 'Azure Documentation', 'GitHub Samples',
+             'Microsoft Tech Community', 'Product Blog', 'Exam Skills Outline']
+
+
+def course_ids(scale):
+    """
+    Build the deterministic list of course IDs for a scale.
+
+    Args:
+        scale (int): Number of courses
+
+    Returns:
+        list: Course IDs such as 'AZ-100'
+    """
+    return [f'{COURSE_PREFIXES[i % len(COURSE_PREFIXES)]}-{100 + i // len(COURSE_PREFIXES)}'
+            for i in range(scale)]
+
+
+class CatalogGenerator:
+    """Generates a reproducible synthetic catalog."""
+
+    def __init__(self, scale=1000, seed=42, today=None):
+        """
+        Initialize the generator.
+
+        Args:
+            scale (int): Number of courses; other record counts derive from it
+            seed (int): Random seed
+            today (date): Reference date for qualification dates
+        """
+        self.scale = scale
+        self.seed = seed
+        self.today = today or date(2025, 1, 1)
+        self.course_ids = course_ids(scale)
+        self.trainer_count = max(1, scale // 10)
+        self.tech_count = max(1, scale // 10)
+
+    def _rng(self, stream):
+        return random.Random(f'{self.seed}:{stream}')
+
+    def courses(self):
+        """
+        Generate course records.
+
+        Yields:
+            tuple: (course_id, course_info)
+        """
+        rng = self._rng('courses')
+        for course_id in self.course_ids:
+            subject = rng.choice(SUBJECTS)
+            role = rng.choice(ROLES)
+            topics = rng.sample(SUBJECTS, rng.randint(2, 6))
+            yield course_id, {
+                'name': f'Microsoft {subject} {role}',
+                'description': (f'{rng.choice(VERBS)} {subject.lower()} solutions '
+                                f'covering {", ".join(t.lower() for t in topics)}.'),
+                'duration': rng.randint(1, 5),
+                'level': rng.choice(LEVELS),
+                'topics': topics,
+            }
+
+    def summaries(self):
+        """
+        Generate summary records, one per course.
+
+        Yields:
+            tuple: (course_id, summary_data)
+        """
+        rng = self._rng('summaries')
+        for index, course_id in enumerate(self.course_ids):
+            subject = rng.choice(SUBJECTS)
+            prerequisites = ['Basic understanding of IT concepts']
+            if index and rng.random() < 0.3:
+                prerequisites.append(self.course_ids[rng.randrange(index)])
+            yield course_id, {
+                'overview': (f'This course provides {rng.choice(LEVELS).lower()} '
+                             f'knowledge of {subject} and related services.'),
+                'key_points': [f'{rng.choice(VERBS)} {rng.choice(SUBJECTS)}'
+                               for _ in range(rng.randint(3, 6))],
+                'prerequisites': prerequisites,
+                'target_audience': rng.choice(AUDIENCES),
+            }
+
+    def prep_materials(self):
+        """
+        Generate preparation materials, one per course.
+
+        Yields:
+            tuple: (course_id, materials)
+        """
+        rng = self._rng('prep')
+        for course_id in self.course_ids:
+            modules = rng.randint(2, 6)
+            yield course_id, {
+                'slides': [f'Module {m}: {rng.choice(SUBJECTS)}' for m in range(1, modules + 1)],
+                'labs': [f'Lab {m}: {rng.choice(VERBS)} {rng.choice(SUBJECTS)}'
+                         for m in range(1, rng.randint(1, modules) + 1)],
+                'demos': [f'Demo {m}: {rng.choice(SUBJECTS)} walkthrough'
+                          for m in range(1, rng.randint(1, 3) + 1)],
+                'resources': rng.sample(RESOURCES, rng.randint(1, 3)),
+                'timing': {f'Module {m}': f'{rng.randint(1, 4)} hours'
+                           for m in range(1, modules + 1)},
+            }
+
+    def qualifications(self):
+        """
+        Generate qualification records for synthetic trainers.
+
+        Yields:
+            tuple: (trainer_id, course_id, qualification_data)
+        """
+        rng = self._rng('qualifications')
+        per_trainer = min(len(self.course_ids), 10)
+        for t in range(self.trainer_count):
+            trainer_id = f'TRAINER-{t:06d}'
+            for course_id in rng.sample(self.course_ids, rng.randint(1, per_trainer)):
+                certified = self.today - timedelta(days=rng.randint(0, 700))
+                expiry = certified + timedelta(days=365)
+                yield trainer_id, course_id, {
+                    'certification_date': certified.isoformat(),
+                    'expiry_date': expiry.isoformat(),
+                    'status': rng.choice(STATUSES),
+                }
+
+    def technologies(self):
+        """
+        Generate technology records.
+
+        Yields:
+            tuple: (tech_id, tech_info)
+        """
+        rng = self._rng('technologies')
+        for t in range(self.tech_count):
+            subject = rng.choice(SUBJECTS)
+            yield f'tech-{t:06d}', {
+                'name': f'{subject} Service {t}',
+                'category': rng.choice(CATEGORIES),
+                'description': f'{rng.choice(VERBS)} {subject.lower()} workloads',
+                'latest_version': f'{rng.randint(2020, 2025)}.{rng.randint(1, 12)}',
+                'resources': rng.sample(RESOURCES, rng.randint(1, 4)),
+            }
+
+    def build(self, intern_pool=None, compressor=None):
+        """
+        Populate a fresh set of managers with the generated catalog.
+
+        The qualification manager's clock is fixed at the generator's
+        reference date, so qualification status does not depend on when
+        the catalog is built.
+
+        Args:
+            intern_pool (InternPool): Optional pool shared by the managers
+            compressor (FieldCompressor): Optional compressor for large text
+                fields of courses and summaries
+
+        Returns:
+            dict: Managers keyed by 'course_details', 'summary_info',
+                'lecture_prep', 'qual_manager' and 'tech_learning'
+        """
+        catalog = {
+            'course_details': CourseDetails(intern_pool=intern_pool, compressor=compressor),
+            'summary_info': SummaryInfo(intern_pool=intern_pool, compressor=compressor),
+            'lecture_prep': LecturePreparation(intern_pool=intern_pool),
+            'qual_manager': QualificationManager(clock=ManualClock(self.today)),
+            'tech_learning': TechLearning(intern_pool=intern_pool),
+        }
+        for course_id, info in self.courses():
+            catalog['course_details'].add_course(course_id, info)
+        for course_id, summary in self.summaries():
+            catalog['summary_info'].add_summary(course_id, summary)
+        for course_id, materials in self.prep_materials():
+            catalog['lecture_prep'].add_prep_material(course_id, materials)
+        for trainer_id, course_id, qual in self.qualifications():
+            catalog['qual_manager'].add_qualification(trainer_id, course_id, qual)
+        for tech_id, info in self.technologies():
+            catalog['tech_learning'].add_technology(tech_id, info)
+        return catalog
@@ -0,0 +1,151 @@
+"""
+Memory Report
+
+Measures the memory held by catalog records with and without shared
+value storage.
+
+Usage:
+    python -m benchmarks.memory --scale 10000
+"""
+
+import argparse
+import json
+import sys
+
+from benchmarks.generator import CatalogGenerator
+from mcthelper.modules.compression import FieldCompressor
+from mcthelper.modules.interning import InternPool
+
+
+def deep_sizeof(obj, seen=None):
+    """
+    Estimate the memory held by a container and everything it references.
+
+    Objects reachable through several paths are counted once, so shared
+    values are measured as shared.
+
+    Args:
+        obj: Object to measure
+        seen (set): IDs of objects already counted
+
+    Returns:
+        int: Size in bytes
+    """
+    if seen is None:
+        seen = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif hasattr(type(current), '__slots__'):
+            stack.extend(getattr(current, slot) for slot in type(current).__slots__
+                         if hasattr(current, slot))
+    return total
+
+
+STORES = {
+    'course_details': ['courses'],
+    'summary_info': ['summaries'],
+    'lecture_prep': ['prep_materials'],
+    'tech_learning': ['technologies', 'learning_paths'],
+}
+
+
+def measure_catalog(scale=1000, seed=42, intern=False, compress_threshold=None):
+    """
+    Build a synthetic catalog and measure the memory held by its records.
+
+    Args:
+        scale (int): Catalog scale passed to CatalogGenerator
+        seed (int): Random seed
+        intern (bool): Whether managers share an InternPool
+        compress_threshold (int): Compress text fields at least this many
+            bytes long; no compression when None
+
+    Returns:
+        dict: 'retained_bytes' and, when interning, the pool's memory report
+    """
+    pool = InternPool() if intern else None
+    compressor = None
+    if compress_threshold is not None:
+        compressor = FieldCompressor(threshold=compress_threshold)
+    catalog = CatalogGenerator(scale=scale, seed=seed).build(intern_pool=pool,
+                                                             compressor=compressor)
+    seen = set()
+    retained = 0
+    for manager_name, attributes in STORES.items():
+        for attribute in attributes:
+            retained += deep_sizeof(getattr(catalog[manager_name], attribute), seen)
+    result = {'retained_bytes': retained}
+    if pool is not None:
+        result['pool'] = pool.memory_report()
+    return result
+
+
+def memory_report(scale=1000, seed=42, compress_threshold=None):
+    """
+    Compare catalog memory with and without interning.
+
+    Args:
+        scale (int): Catalog scale
+        seed (int): Random seed
+        compress_threshold (int): Also measure compressed text fields at
+            this threshold when given
+
+    Returns:
+        dict: Plain and interned (and optionally compressed) measurements
+            plus 'saved_bytes' by interning
+    """
+    plain = measure_catalog(scale, seed, intern=False)
+    interned = measure_catalog(scale, seed, intern=True)
+    report = {
+        'scale': scale,
+        'plain': plain,
+        'interned': interned,
+        'saved_bytes': plain['retained_bytes'] - interned['retained_bytes'],
+    }
+    if compress_threshold is not None:
+        report['compressed'] = measure_catalog(scale, seed, intern=True,
+                                               compress_threshold=compress_threshold)
+    return report
+
+
+def main(argv=None):
+    """Memory report CLI entry point."""
+    parser = argparse.ArgumentParser(description='MCTHelper catalog memory report')
+    parser.add_argument('--scale', type=int, default=1000, help='Number of synthetic courses')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    parser.add_argument('--compress-threshold', type=int,
+                        help='Also measure compressed text fields of at least this many bytes')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    args = parser.parse_args(argv)
+
+    report = memory_report(args.scale, args.seed, args.compress_threshold)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+    plain = report['plain']['retained_bytes']
+    interned = report['interned']['retained_bytes']
+    print(f"Scale:            {args.scale}")
+    print(f"Without interning {plain / 1024:12.1f} KiB")
+    print(f"With interning    {interned / 1024:12.1f} KiB")
+    print(f"Saved             {report['saved_bytes'] / 1024:12.1f} KiB "
+          f"({report['saved_bytes'] / plain:.1%})")
+    if 'compressed' in report:
+        compressed = report['compressed']['retained_bytes']
+        print(f"Interned+compress {compressed / 1024:12.1f} KiB")
+    print(f"Distinct values   {report['interned']['pool']['distinct_values']:12d}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
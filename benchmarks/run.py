@@ -0,0 +1,176 @@
+"""
+Benchmark Runner
+
+Usage:
+    python -m benchmarks run --scale 10000 --output results.json
+    python -m benchmarks compare baseline.json results.json --threshold 0.1
+"""
+
+import argparse
+import datetime
+import fnmatch
+import json
+import platform
+import statistics
+import sys
+import time
+
+from benchmarks.generator import CatalogGenerator
+from benchmarks.suite import BENCHMARKS
+
+
+def time_operation(func, repeat=5, min_time=0.05):
+    """
+    Time a callable, calibrating the loop count so each sample takes at
+    least ``min_time`` seconds.
+
+    Args:
+        func (callable): Zero-argument operation
+        repeat (int): Number of samples
+        min_time (float): Minimum duration of one sample in seconds
+
+    Returns:
+        dict: Per-call 'min', 'median' and 'max' seconds plus 'loops'
+    """
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or loops >= 1 << 20:
+            break
+        loops *= 2 if elapsed == 0 else max(2, min(10, int(min_time / elapsed) + 1))
+
+    samples = [elapsed / loops]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        samples.append((time.perf_counter() - start) / loops)
+    return {
+        'min': min(samples),
+        'median': statistics.median(samples),
+        'max': max(samples),
+        'loops': loops,
+    }
+
+
+def run_benchmarks(scale=1000, seed=42, repeat=5, min_time=0.05, pattern='*'):
+    """
+    Build a synthetic catalog and time every matching benchmark.
+
+    Args:
+        scale (int): Catalog scale passed to CatalogGenerator
+        seed (int): Random seed
+        repeat (int): Samples per benchmark
+        min_time (float): Minimum sample duration in seconds
+        pattern (str): fnmatch pattern selecting benchmark names
+
+    Returns:
+        dict: Result document with 'meta' and 'results'
+    """
+    generator = CatalogGenerator(scale=scale, seed=seed)
+    start = time.perf_counter()
+    catalog = generator.build()
+    build_seconds = time.perf_counter() - start
+
+    results = {}
+    for name in sorted(BENCHMARKS):
+        if not fnmatch.fnmatch(name, pattern):
+            continue
+        operation = BENCHMARKS[name](catalog, generator)
+        results[name] = time_operation(operation, repeat=repeat, min_time=min_time)
+
+    return {
+        'meta': {
+            'scale': scale,
+            'seed': seed,
+            'repeat': repeat,
+            'build_seconds': build_seconds,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        },
+        'results': results,
+    }
+
+
+def compare_results(baseline, current, threshold=0.1, metric='median'):
+    """
+    Compare two result documents.
+
+    Args:
+        baseline (dict): Earlier result document
+        current (dict): Newer result document
+        threshold (float): Allowed relative slowdown before flagging
+        metric (str): Timing statistic to compare
+
+    Returns:
+        list: One dict per shared benchmark with 'name', 'baseline',
+            'current', 'ratio' and 'regression'
+    """
+    rows = []
+    for name in sorted(set(baseline['results']) & set(current['results'])):
+        old = baseline['results'][name][metric]
+        new = current['results'][name][metric]
+        ratio = new / old if old else float('inf')
+        rows.append({
+            'name': name,
+            'baseline': old,
+            'current': new,
+            'ratio': ratio,
+            'regression': ratio > 1 + threshold,
+        })
+    return rows
+
+
+def _load(path):
+    with open(path, encoding='utf-8') as handle:
+        return json.load(handle)
+
+
+def main(argv=None):
+    """Benchmark CLI entry point."""
+    parser = argparse.ArgumentParser(description='MCTHelper benchmark suite')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='Run benchmarks and save JSON results')
+    run_parser.add_argument('--scale', type=int, default=1000, help='Number of synthetic courses')
+    run_parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    run_parser.add_argument('--repeat', type=int, default=5, help='Samples per benchmark')
+    run_parser.add_argument('--min-time', type=float, default=0.05,
+                            help='Minimum seconds per sample')
+    run_parser.add_argument('--filter', default='*', help='Benchmark name pattern')
+    run_parser.add_argument('--output', help='Write results to this JSON file')
+
+    compare_parser = subparsers.add_parser('compare', help='Flag regressions between two runs')
+    compare_parser.add_argument('baseline', help='Baseline results JSON')
+    compare_parser.add_argument('current', help='Current results JSON')
+    compare_parser.add_argument('--threshold', type=float, default=0.1,
+                                help='Allowed relative slowdown (default 0.1 = 10%%)')
+    compare_parser.add_argument('--metric', default='median', choices=['min', 'median', 'max'])
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        document = run_benchmarks(args.scale, args.seed, args.repeat, args.min_time, args.filter)
+        for name, result in document['results'].items():
+            print(f"{name:45s} {result['median'] * 1e6:12.2f} us")
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as handle:
+                json.dump(document, handle, indent=2)
+        return 0
+
+    rows = compare_results(_load(args.baseline), _load(args.current), args.threshold, args.metric)
+    regressions = 0
+    for row in rows:
+        flag = 'REGRESSION' if row['regression'] else ''
+        regressions += row['regression']
+        print(f"{row['name']:45s} {row['baseline'] * 1e6:12.2f} us "
+              f"{row['current'] * 1e6:12.2f} us {row['ratio']:7.2f}x {flag}")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
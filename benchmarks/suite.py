@@ -0,0 +1,268 @@
+"""
+Benchmark Definitions
+
+Each benchmark receives the populated catalog and its generator and
+returns a zero-argument callable that performs one operation.
+"""
+
+import atexit
+import os
+import random
+import shutil
+import tempfile
+from datetime import timedelta
+
+from mcthelper import (
+    CourseDetails, LecturePreparation, QualificationManager, SummaryInfo, TechLearning)
+from mcthelper.modules.assignment import TrainerAssigner
+from mcthelper.modules.cache import CachedManager
+from mcthelper.modules.columnar import read_qualification_columns, write_qualification_columns
+from mcthelper.modules.completion import CompletionCache
+from mcthelper.modules.course_graph import CoursePrerequisiteGraph
+from mcthelper.modules.importer import CatalogImporter, export_catalog
+from mcthelper.modules.metrics import MetricsRegistry
+from mcthelper.modules.query import QueryEngine
+from mcthelper.modules.similarity import CourseSimilarity
+
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """
+    Register a benchmark setup function under a name.
+
+    Args:
+        name (str): Benchmark name used in result files
+
+    Returns:
+        callable: Decorator registering the setup function
+    """
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+def _sample_ids(generator, count=64):
+    rng = random.Random(generator.seed)
+    return [rng.choice(generator.course_ids) for _ in range(count)]
+
+
+@benchmark('course_details.get_course')
+def bench_get_course(catalog, generator):
+    cd = catalog['course_details']
+    ids = _sample_ids(generator)
+
+    def run():
+        for course_id in ids:
+            cd.get_course(course_id)
+    return run
+
+
+@benchmark('metrics.disabled_get_course')
+def bench_disabled_metrics(catalog, generator):
+    # Compare with course_details.get_course: disabled wrappers must cost nothing
+    registry = MetricsRegistry()
+    cd = registry.instrument(catalog['course_details'])
+    registry.disable()
+    ids = _sample_ids(generator)
+
+    def run():
+        for course_id in ids:
+            cd.get_course(course_id)
+    return run
+
+
+@benchmark('cache.get_course')
+def bench_cached_get_course(catalog, generator):
+    cached = CachedManager(catalog['course_details'], max_entries=4096)
+    ids = _sample_ids(generator)
+
+    def run():
+        for course_id in ids:
+            cached.get_course(course_id)
+    return run
+
+
+@benchmark('course_details.search_courses')
+def bench_search_courses(catalog, generator):
+    cd = catalog['course_details']
+    return lambda: cd.search_courses('Security')
+
+
+@benchmark('course_details.list_all_courses')
+def bench_list_all_courses(catalog, generator):
+    cd = catalog['course_details']
+    return cd.list_all_courses
+
+
+@benchmark('summary_info.get_summary')
+def bench_get_summary(catalog, generator):
+    si = catalog['summary_info']
+    ids = _sample_ids(generator)
+
+    def run():
+        for course_id in ids:
+            si.get_summary(course_id)
+    return run
+
+
+@benchmark('lecture_prep.get_checklist')
+def bench_get_checklist(catalog, generator):
+    lp = catalog['lecture_prep']
+    ids = _sample_ids(generator)
+
+    def run():
+        for course_id in ids:
+            lp.get_checklist(course_id)
+    return run
+
+
+@benchmark('qual_manager.check_expiry')
+def bench_check_expiry(catalog, generator):
+    qm = catalog['qual_manager']
+    pairs = [(trainer_id, course_id)
+             for trainer_id, courses in list(qm.qualifications.items())[:64]
+             for course_id in courses]
+
+    def run():
+        for trainer_id, course_id in pairs:
+            qm.check_expiry(trainer_id, course_id)
+    return run
+
+
+@benchmark('qual_manager.get_trainers_qualified_for_all')
+def bench_qualified_for_all(catalog, generator):
+    # Bootcamps of three courses one trainer currently holds, so every
+    # intersection is non-empty and no bitset operation short-circuits
+    qm = catalog['qual_manager']
+    bootcamps = []
+    for trainer_id, courses in qm.qualifications.items():
+        held = [course_id for course_id in sorted(courses)
+                if trainer_id in qm.get_qualified_trainers(course_id)]
+        if len(held) >= 3:
+            bootcamps.append(held[:3])
+            if len(bootcamps) == 64:
+                break
+
+    def run():
+        found = 0
+        for course_ids in bootcamps:
+            found += len(qm.get_trainers_qualified_for_all(course_ids))
+            found += len(qm.get_trainers_missing_one(course_ids))
+        return found
+    return run
+
+
+@benchmark('tech_learning.get_by_category')
+def bench_get_by_category(catalog, generator):
+    tl = catalog['tech_learning']
+    return lambda: tl.get_by_category('Security')
+
+
+@benchmark('tech_learning.get_latest_updates')
+def bench_get_latest_updates(catalog, generator):
+    tl = catalog['tech_learning']
+    return tl.get_latest_updates
+
+
+@benchmark('summary_info.search')
+def bench_summary_search(catalog, generator):
+    si = catalog['summary_info']
+    return lambda: si.search('"data engineers"', limit=20)
+
+
+@benchmark('summary_info.search_prerequisites')
+def bench_summary_search_prerequisites(catalog, generator):
+    si = catalog['summary_info']
+    return lambda: si.search('"IT concepts"', fields=['prerequisites'], limit=20)
+
+
+@benchmark('course_graph.all_prerequisites')
+def bench_course_graph_closure(catalog, generator):
+    graph = CoursePrerequisiteGraph(catalog['summary_info'], catalog['course_details'])
+    ids = _sample_ids(generator, count=1000)
+
+    def run():
+        for course_id in ids:
+            graph.all_prerequisites(course_id)
+            graph.unlocked_by(course_id)
+    return run
+
+
+@benchmark('assignment.assign')
+def bench_assign_trainers(catalog, generator):
+    # 10k sessions; run with --scale 50000 for 5k trainers
+    qm = catalog['qual_manager']
+    assigner = TrainerAssigner(qm, catalog['lecture_prep'])
+    rng = random.Random(generator.seed)
+    taught = sorted({course_id for courses in qm.qualifications.values() for course_id in courses})
+    sessions = [
+        {
+            'session_id': f'S-{i:05d}',
+            'course_id': rng.choice(taught),
+            'date': (generator.today + timedelta(days=rng.randint(0, 60))).isoformat(),
+        }
+        for i in range(10000)
+    ]
+    return lambda: assigner.assign(sessions, capacity=2)
+
+
+@benchmark('query.execute')
+def bench_query(catalog, generator):
+    engine = QueryEngine(catalog['course_details'], catalog['summary_info'],
+                         catalog['qual_manager'], catalog['lecture_prep'])
+    query = engine.query('level = Intermediate and topic = Security '
+                         'and summary ~ compliance and trainers >= 1')
+    return query.execute
+
+
+@benchmark('importer.import_file')
+def bench_import(catalog, generator):
+    # Parses with one worker per CPU; compare runs with different core counts
+    handle, path = tempfile.mkstemp(suffix='.jsonl')
+    os.close(handle)
+    atexit.register(os.remove, path)
+    export_catalog(path, **catalog)
+
+    def run():
+        CatalogImporter(CourseDetails(), SummaryInfo(), LecturePreparation(),
+                        QualificationManager(), TechLearning()).import_file(path)
+    return run
+
+
+@benchmark('columnar.read_qualification_columns')
+def bench_read_columns(catalog, generator):
+    handle, path = tempfile.mkstemp(suffix='.col')
+    os.close(handle)
+    atexit.register(os.remove, path)
+    write_qualification_columns(catalog['qual_manager'], path)
+    return lambda: read_qualification_columns(path)
+
+
+@benchmark('similarity.similar')
+def bench_similar(catalog, generator):
+    similarity = CourseSimilarity(catalog['course_details'], catalog['summary_info'])
+    ids = _sample_ids(generator, count=8)
+
+    def run():
+        for course_id in ids:
+            # Bypass the result cache so every call is scored
+            similarity.clear_cache()
+            similarity.similar(course_id)
+    return run
+
+
+@benchmark('completion.complete')
+def bench_complete(catalog, generator):
+    cache = CompletionCache(tempfile.mkdtemp())
+    atexit.register(shutil.rmtree, cache.directory, True)
+    cache.attach('courses', catalog['course_details'])
+    cache.refresh()
+    prefixes = [course_id[:4] for course_id in _sample_ids(generator, count=16)]
+
+    def run():
+        for prefix in prefixes:
+            cache.complete('courses', prefix)
+    return run
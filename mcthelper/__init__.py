@@ -16,6 +16,18 @@ from .modules.summary_info import SummaryInfo
 from .modules.lecture_prep import LecturePreparation
 from .modules.qualifications import QualificationManager
 from .modules.tech_learning import TechLearning
+from .modules.metrics import MetricsRegistry
+from .modules.course_bundle import CourseCatalog
+from .modules.renewal_scheduler import RenewalScheduler
+from .modules.course_graph import CoursePrerequisiteGraph
+from .modules.assignment import TrainerAssigner
+from .modules.cache import CachedManager
+from .modules.tenancy import TenantCatalog
+from .modules.localization import LocalizedCatalog
+from .modules.versioning import VersionHistory
+from .modules.query import QueryEngine
+from .modules.importer import CatalogImporter
+from .modules.similarity import CourseSimilarity
 
 __all__ = [
     'CourseDetails',
@@ -23,4 +35,16 @@ __all__ = [
     'LecturePreparation',
     'QualificationManager',
     'TechLearning',
+    'MetricsRegistry',
+    'CourseCatalog',
+    'RenewalScheduler',
+    'CoursePrerequisiteGraph',
+    'TrainerAssigner',
+    'CachedManager',
+    'TenantCatalog',
+    'LocalizedCatalog',
+    'VersionHistory',
+    'QueryEngine',
+    'CatalogImporter',
+    'CourseSimilarity',
 ]
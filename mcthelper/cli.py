@@ -6,6 +6,7 @@ This CLI provides quick access to all MCTHelper features.
 
 import argparse
 import sys
+from contextlib import nullcontext
 from mcthelper import (
     CourseDetails,
     SummaryInfo,
@@ -13,19 +14,67 @@ from mcthelper import (
     QualificationManager,
     TechLearning
 )
+from mcthelper.modules.completion import SHELLS, CompletionCache, completion_script
+from mcthelper.modules.metrics import MetricsRegistry
+from mcthelper.modules.profiling import Profiler, read_methods
+from mcthelper.modules.query import QueryEngine, QueryError
+from mcthelper.modules.resource_checker import check_resources
+
+
+# Commands whose argument is completed from a cache file, and its kind
+COMPLETED_ARGUMENTS = {
+    'course-details': 'courses',
+    'summary': 'courses',
+    'prep-checklist': 'courses',
+}
 
 
 class MCTHelperCLI:
     """Command-line interface for MCTHelper."""
     
-    def __init__(self):
-        """Initialize CLI with all modules."""
+    def __init__(self, metrics=None, profiler=None, completion_cache=None):
+        """
+        Initialize CLI with all modules.
+        
+        Args:
+            metrics (MetricsRegistry): Optional registry used to instrument
+                the managers and the CLI commands
+            profiler (Profiler): Optional profiler attributing time to the
+                loading, indexing, querying and rendering phases
+            completion_cache (CompletionCache): Optional shell completion
+                cache kept in step with the course and technology IDs
+        """
         self.course_details = CourseDetails()
         self.summary_info = SummaryInfo()
         self.lecture_prep = LecturePreparation()
         self.qual_manager = QualificationManager()
         self.tech_learning = TechLearning()
+        self.metrics = metrics
+        if metrics is not None:
+            for manager in (self.course_details, self.summary_info, self.lecture_prep,
+                            self.qual_manager, self.tech_learning):
+                metrics.instrument(manager)
+            metrics.instrument(self, prefix='cli', outcomes=False)
+        self.profiler = profiler
+        if profiler is not None:
+            for manager in (self.course_details, self.summary_info, self.lecture_prep,
+                            self.qual_manager, self.tech_learning):
+                profiler.instrument(manager, 'querying', read_methods(manager))
+            profiler.instrument(self.summary_info.search_index, 'indexing',
+                                ['add_document', 'remove_document'])
+            profiler.instrument(self, 'loading', ['_load_sample_data'])
+            profiler.instrument(self, 'rendering')
         self._load_sample_data()
+        self.completion_cache = completion_cache
+        if completion_cache is not None:
+            completion_cache.attach('courses', self.course_details)
+            completion_cache.attach('technologies', self.tech_learning)
+    
+    def _phase(self, name):
+        """Attribute a block to a profiling phase when profiling."""
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.phase(name)
     
     def _load_sample_data(self):
         """Load sample data for demonstration."""
@@ -129,6 +178,46 @@ class MCTHelperCLI:
         for i, item in enumerate(checklist, 1):
             print(f"{i}. {item}")
     
+    def check_resources(self, timeout=10.0):
+        """Check that preparation and technology resource URLs are reachable."""
+        with self._phase('querying'):
+            report = check_resources(self.lecture_prep, self.tech_learning, timeout=timeout)
+        print("\n=== Resource Check ===")
+        print(f"Checked: {len(report['results'])} URLs")
+        print(f"Skipped (not URLs): {len(report['skipped'])}")
+        if not report['broken']:
+            print("All checked resources are accessible.")
+            return
+        print("\nBroken resources:")
+        for owner, url in report['broken']:
+            result = report['results'][url]
+            print(f"  - {owner}: {url} ({result['status'] or result['error']})")
+    
+    def run_query(self, text, explain=False):
+        """Show courses matching a query such as 'level = Beginner and trainers >= 1'."""
+        with self._phase('indexing'):
+            engine = QueryEngine(self.course_details, self.summary_info,
+                                 self.qual_manager, self.lecture_prep)
+        try:
+            plan = engine.query(text).plan()
+        except QueryError as exc:
+            print(f"Invalid query: {exc}")
+            return
+        with self._phase('querying'):
+            course_ids = plan.execute()
+        print("\n=== Query Results ===")
+        if not course_ids:
+            print("No matching courses.")
+        for course_id in course_ids:
+            print(f"{course_id}: {self.course_details.get_course(course_id)['name']}")
+        if explain:
+            print(f"\n{plan.explain()}")
+    
+    def show_completion(self, shell, commands):
+        """Print a shell completion script for the given subcommands."""
+        directory = self.completion_cache.directory if self.completion_cache else None
+        print(completion_script(shell, commands, COMPLETED_ARGUMENTS, directory), end='')
+    
     def show_latest_tech(self):
         """Show latest technology updates."""
         updates = self.tech_learning.get_latest_updates()
@@ -149,6 +238,15 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
     
+    parser.add_argument('--metrics', metavar='PATH',
+                        help='Write call metrics to PATH (.prom for Prometheus text, JSON otherwise)')
+    parser.add_argument('--profile', metavar='PATH',
+                        help='Profile the command, write the profile to PATH and print '
+                             'a phase breakdown')
+    parser.add_argument('--profile-mode', choices=['cprofile', 'sample'], default='cprofile',
+                        help='cprofile writes pstats output, sample writes collapsed stacks '
+                             'for flame graphs (default: cprofile)')
+    
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
     # List courses command
@@ -169,13 +267,36 @@ def main():
     # Latest tech command
     subparsers.add_parser('latest-tech', help='Show latest technology updates')
     
+    # Resource check command
+    check_parser = subparsers.add_parser('check-resources',
+                                         help='Check that resource URLs are accessible')
+    check_parser.add_argument('--timeout', type=float, default=10.0,
+                              help='Seconds allowed per request (default: 10)')
+    
+    # Query command
+    query_parser = subparsers.add_parser('query', help='Find courses matching a query')
+    query_parser.add_argument('expression',
+                              help="Conditions joined by 'and', e.g. \"level = Beginner and trainers >= 1\"")
+    query_parser.add_argument('--explain', action='store_true',
+                              help='Show the query plan with estimated and actual row counts')
+    
+    # Shell completion command
+    completion_parser = subparsers.add_parser('completion',
+                                              help='Print a shell completion script')
+    completion_parser.add_argument('shell', choices=SHELLS,
+                                   help='Shell to complete for, e.g. eval "$(mcthelper completion bash)"')
+    
     args = parser.parse_args()
     
     if not args.command:
         parser.print_help()
         return
     
-    cli = MCTHelperCLI()
+    metrics = MetricsRegistry() if args.metrics else None
+    profiler = Profiler(mode=args.profile_mode) if args.profile else None
+    if profiler is not None:
+        profiler.start()
+    cli = MCTHelperCLI(metrics=metrics, profiler=profiler, completion_cache=CompletionCache())
     
     if args.command == 'list-courses':
         cli.list_courses()
@@ -187,6 +308,27 @@ def main():
         cli.show_prep_checklist(args.course_id)
     elif args.command == 'latest-tech':
         cli.show_latest_tech()
+    elif args.command == 'check-resources':
+        cli.check_resources(timeout=args.timeout)
+    elif args.command == 'query':
+        cli.run_query(args.expression, explain=args.explain)
+    elif args.command == 'completion':
+        commands = {action.dest: action.help for action in subparsers._choices_actions}
+        cli.show_completion(args.shell, commands)
+    
+    try:
+        cli.completion_cache.refresh()
+    except OSError:
+        pass  # Completion is best effort; never fail a command over it
+    
+    if profiler is not None:
+        profiler.stop()
+        profiler.write(args.profile)
+        print(profiler.format_breakdown(), file=sys.stderr)
+        print(f"Profile written to {args.profile}", file=sys.stderr)
+    
+    if metrics is not None:
+        metrics.write(args.metrics)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,266 @@
+"""
+Assignment Module
+
+Staffs scheduled course deliveries with qualified trainers using maximum
+bipartite matching with per-trainer capacities. A trainer never delivers
+two sessions whose days overlap.
+"""
+
+import math
+from bisect import bisect_left
+from collections import deque
+from datetime import datetime
+
+
+class TrainerAssigner:
+    """
+    Assigns trainers to sessions so that as many sessions as possible are
+    staffed.
+
+    A trainer can deliver a session if they hold an active qualification for
+    the course that does not expire before the session's last day, they
+    have capacity left, and they are not delivering another session on any
+    of its days. Session length in days is derived from the module timing in
+    LecturePreparation.
+    """
+
+    def __init__(self, qual_manager, lecture_prep=None, hours_per_day=8):
+        """
+        Initialize the TrainerAssigner.
+
+        Args:
+            qual_manager (QualificationManager): Source of qualifications
+            lecture_prep (LecturePreparation): Optional source of module
+                timing used to derive session length
+            hours_per_day (int): Teaching hours in one delivery day
+        """
+        self.qual_manager = qual_manager
+        self.lecture_prep = lecture_prep
+        self.hours_per_day = hours_per_day
+        self._candidates = None
+        qual_manager.subscribe(self._on_change)
+
+    def session_days(self, course_id):
+        """
+        Get the number of delivery days for a course.
+
+        Args:
+            course_id (str): Unique identifier for the course
+
+        Returns:
+            int: Days needed to cover all modules, at least 1
+        """
+        minutes = self.lecture_prep.get_total_minutes(course_id) if self.lecture_prep else None
+        if not minutes:
+            return 1
+        return max(1, math.ceil(minutes / (self.hours_per_day * 60)))
+
+    def eligible_trainers(self, course_id, session_date, days=None):
+        """
+        Get trainers qualified to deliver a session.
+
+        Args:
+            course_id (str): Unique identifier for the course
+            session_date (date | str): First day of the session (YYYY-MM-DD)
+            days (int): Session length, defaults to ``session_days()``
+
+        Returns:
+            list: Trainer IDs ordered by expiry date, latest first
+        """
+        expiries, trainers = self._candidate_index().get(course_id, ([], []))
+        end = self._end_ordinal(session_date, days or self.session_days(course_id))
+        return trainers[bisect_left(expiries, end):][::-1]
+
+    def assign(self, sessions, capacity=1):
+        """
+        Assign trainers to sessions.
+
+        Sessions are first assigned greedily to the eligible trainer whose
+        qualification runs longest; augmenting paths then move earlier
+        assignments around until no further session can be staffed. The
+        result is a maximum matching when no sessions overlap. Overlapping
+        sessions make the problem NP-hard, and the search is then a
+        heuristic: a trainer can take a session by giving up every session
+        it overlaps, each of which must find a new trainer, but a session is
+        moved at most once per search phase.
+
+        Args:
+            sessions (list): Session dictionaries with
+                - session_id: Unique identifier for the session
+                - course_id: Course being delivered
+                - date: First day of the session (YYYY-MM-DD)
+                - days: Optional session length overriding the module timing
+            capacity (int | dict): Maximum non-overlapping sessions per
+                trainer, or a mapping of trainer ID to capacity (trainers not
+                listed get 1)
+
+        Returns:
+            dict: Assignment result
+                - assignments: Mapping of session ID to trainer ID
+                - unassigned: Session IDs that could not be staffed
+        """
+        index = self._candidate_index()
+        trainer_ids = []
+        trainer_index = {}
+        candidates = []
+        spans = []
+        days_by_course = {}
+        for session in sessions:
+            course_id = session['course_id']
+            expiries, trainers = index.get(course_id, ([], []))
+            days = session.get('days')
+            if days is None:
+                days = days_by_course.get(course_id)
+                if days is None:
+                    days = days_by_course[course_id] = self.session_days(course_id)
+            first_day = self._start_ordinal(session['date'])
+            last_day = first_day + days - 1
+            spans.append((first_day, last_day))
+            start = bisect_left(expiries, last_day)
+            eligible = []
+            # Latest expiry first, so the greedy pass prefers safe qualifications
+            for trainer_id in reversed(trainers[start:]):
+                position = trainer_index.get(trainer_id)
+                if position is None:
+                    position = trainer_index[trainer_id] = len(trainer_ids)
+                    trainer_ids.append(trainer_id)
+                eligible.append(position)
+            candidates.append(eligible)
+
+        if isinstance(capacity, dict):
+            limits = [capacity.get(trainer_id, 1) for trainer_id in trainer_ids]
+        else:
+            limits = [capacity] * len(trainer_ids)
+
+        match = [-1] * len(sessions)
+        assigned = [set() for _ in trainer_ids]
+        for session, eligible in enumerate(candidates):
+            for trainer in eligible:
+                if (len(assigned[trainer]) < limits[trainer]
+                        and not self._conflicts(session, assigned[trainer], spans)):
+                    match[session] = trainer
+                    assigned[trainer].add(session)
+                    break
+
+        # Repeat phases of augmenting-path searches until a phase finds none.
+        # Sessions moved in a phase are not moved again, which keeps each
+        # phase linear in the size of the graph.
+        improved = True
+        while improved:
+            improved = False
+            visited = set()
+            for session in range(len(sessions)):
+                if match[session] == -1 and self._augment(
+                        session, candidates, spans, match, assigned, limits, visited):
+                    improved = True
+
+        assignments = {}
+        unassigned = []
+        for session, trainer in zip(sessions, match):
+            if trainer == -1:
+                unassigned.append(session['session_id'])
+            else:
+                assignments[session['session_id']] = trainer_ids[trainer]
+        return {'assignments': assignments, 'unassigned': unassigned}
+
+    @staticmethod
+    def _conflicts(session, trainer_sessions, spans):
+        first_day, last_day = spans[session]
+        return [other for other in trainer_sessions
+                if spans[other][0] <= last_day and first_day <= spans[other][1]]
+
+    @classmethod
+    def _augment(cls, root, candidates, spans, match, assigned, limits, visited):
+        # Depth-first search for a way to staff root, run on an explicit
+        # stack of _place() generators so long paths cannot hit the
+        # recursion limit. Each generator yields the sessions it displaced
+        # and is sent back whether they found a new trainer.
+        journal = []
+        stack = [cls._place(root, candidates, spans, match, assigned, limits, visited, journal)]
+        placed = None
+        while stack:
+            try:
+                session = stack[-1].send(placed)
+            except StopIteration as stop:
+                stack.pop()
+                placed = stop.value
+            else:
+                stack.append(cls._place(session, candidates, spans, match, assigned, limits,
+                                        visited, journal))
+                placed = None
+        return placed
+
+    @classmethod
+    def _place(cls, session, candidates, spans, match, assigned, limits, visited, journal):
+        # Give an unassigned session a trainer: one with capacity and free
+        # days, or one that gives up the sessions it overlaps (or, with no
+        # overlap, any one session) for them to be placed in turn. Failed
+        # attempts are rolled back through the journal.
+        visited.add(session)
+        for trainer in candidates[session]:
+            conflicts = cls._conflicts(session, assigned[trainer], spans)
+            if not conflicts and len(assigned[trainer]) < limits[trainer]:
+                cls._move(session, trainer, match, assigned, journal)
+                return True
+            options = [conflicts] if conflicts else [[other] for other in sorted(assigned[trainer])]
+            for displaced in options:
+                if any(other in visited for other in displaced):
+                    continue
+                mark = len(journal)
+                for other in displaced:
+                    cls._move(other, -1, match, assigned, journal)
+                cls._move(session, trainer, match, assigned, journal)
+                for other in displaced:
+                    if not (yield other):
+                        break
+                else:
+                    return True
+                while len(journal) > mark:
+                    other, previous = journal.pop()
+                    cls._move(other, previous, match, assigned)
+        return False
+
+    @staticmethod
+    def _move(session, trainer, match, assigned, journal=None):
+        previous = match[session]
+        if previous != -1:
+            assigned[previous].discard(session)
+        if trainer != -1:
+            assigned[trainer].add(session)
+        match[session] = trainer
+        if journal is not None:
+            journal.append((session, previous))
+
+    def _candidate_index(self):
+        if self._candidates is None:
+            by_course = {}
+            for trainer_id, courses in self.qual_manager.qualifications.items():
+                for course_id, qual in courses.items():
+                    if qual.get('status') != 'active':
+                        continue
+                    try:
+                        expiry = datetime.strptime(qual['expiry_date'], '%Y-%m-%d').date()
+                    except (ValueError, KeyError, TypeError):
+                        continue
+                    by_course.setdefault(course_id, []).append((expiry.toordinal(), trainer_id))
+            index = {}
+            for course_id, entries in by_course.items():
+                entries.sort()
+                index[course_id] = ([e for e, _ in entries], [t for _, t in entries])
+            self._candidates = index
+        return self._candidates
+
+    @classmethod
+    def _end_ordinal(cls, session_date, days):
+        return cls._start_ordinal(session_date) + days - 1
+
+    @staticmethod
+    def _start_ordinal(session_date):
+        if isinstance(session_date, str):
+            session_date = datetime.strptime(session_date, '%Y-%m-%d').date()
+        elif isinstance(session_date, datetime):
+            session_date = session_date.date()
+        return session_date.toordinal()
+
+    def _on_change(self, key):
+        self._candidates = None
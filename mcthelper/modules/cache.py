@@ -0,0 +1,307 @@
+"""
+Cache Module
+
+Bounded LRU/TTL record cache and a caching proxy that can sit in front of
+any MCTHelper manager, including managers backed by slow storage.
+"""
+
+import sys
+import time
+from collections import OrderedDict
+
+
+# Read methods cached per manager class; each takes the record ID first
+CACHED_METHODS = {
+    'CourseDetails': ('get_course',),
+    'SummaryInfo': ('get_summary', 'get_key_points', 'get_prerequisites'),
+    'LecturePreparation': ('get_prep_materials', 'get_checklist', 'get_timing_guide'),
+    'QualificationManager': ('get_qualifications',),
+    'TechLearning': ('get_technology', 'get_learning_path'),
+}
+
+_MISSING = object()
+
+
+def estimate_size(value):
+    """
+    Estimate the memory used by a record, following containers.
+
+    Args:
+        value: Record or field value
+
+    Returns:
+        int: Approximate size in bytes
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += estimate_size(key) + estimate_size(item)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += estimate_size(item)
+    return size
+
+
+def record_id(key):
+    """
+    Get the ID used to invalidate cached reads from a change notification key.
+
+    Qualification notifications carry (trainer_id, course_id) and are cached
+    per trainer; technology notifications carry (kind, id).
+
+    Args:
+        key: Key passed to subscribers
+
+    Returns:
+        str: ID passed as the first argument of the cached read methods
+    """
+    if isinstance(key, tuple):
+        if key and key[0] in ('technology', 'learning_path'):
+            return key[1]
+        return key[0]
+    return key
+
+
+class LRUCache:
+    """
+    Least-recently-used cache with optional time-to-live and byte budget.
+
+    Misses can be cached too (negative caching) with their own, usually
+    shorter, time-to-live.
+    """
+
+    def __init__(self, max_entries=1024, ttl=None, negative_ttl=None, max_bytes=None,
+                 clock=time.monotonic, sizeof=estimate_size, on_discard=None):
+        """
+        Initialize the LRUCache.
+
+        Args:
+            max_entries (int): Maximum number of cached entries
+            ttl (float): Seconds an entry stays fresh, None for no expiry
+            negative_ttl (float): Seconds a cached miss stays fresh, defaults
+                to ``ttl``; 0 disables negative caching
+            max_bytes (int): Approximate memory budget for cached values,
+                None for no limit
+            clock (callable): Monotonic clock returning seconds
+            sizeof (callable): Function estimating the size of a value
+            on_discard (callable): Called with the key of every entry that
+                is evicted, expires or is invalidated
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.negative_ttl = ttl if negative_ttl is None else negative_ttl
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self.sizeof = sizeof
+        self.on_discard = on_discard
+        self.bytes = 0
+        self._entries = OrderedDict()
+        self.reset_stats()
+
+    def __len__(self):
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def __contains__(self, key):
+        """Check whether a fresh entry exists without touching LRU order."""
+        entry = self._entries.get(key)
+        return entry is not None and not self._expired(entry)
+
+    def get(self, key, default=None):
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is not cached
+
+        Returns:
+            Cached value (None for a cached miss) or ``default``
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        if self._expired(entry):
+            self._drop(key)
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        if entry[2]:
+            self.negative_hits += 1
+        else:
+            self.hits += 1
+        return entry[0]
+
+    def put(self, key, value, negative=False):
+        """
+        Cache a value.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            negative (bool): Whether the value represents a miss
+
+        Returns:
+            bool: True if cached, False if the value does not fit the budget
+                or negative caching is disabled
+        """
+        ttl = self.negative_ttl if negative else self.ttl
+        if negative and ttl == 0:
+            return False
+        size = self.sizeof(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return False
+        self._drop(key)
+        expires = None if ttl is None else self.clock() + ttl
+        self._entries[key] = (value, expires, negative, size)
+        self.bytes += size
+        while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self.bytes > self.max_bytes):
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+            self.evictions += 1
+        return True
+
+    def invalidate(self, key):
+        """
+        Remove a cached entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            bool: True if an entry was removed
+        """
+        return self._drop(key)
+
+    def clear(self):
+        """Remove all cached entries."""
+        for key in list(self._entries):
+            self._drop(key)
+
+    def reset_stats(self):
+        """Reset hit, miss and eviction counters."""
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def stats(self):
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: Counters, size and hit rate (cached misses count as hits)
+        """
+        lookups = self.hits + self.negative_hits + self.misses
+        return {
+            'hits': self.hits,
+            'negative_hits': self.negative_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'entries': len(self._entries),
+            'bytes': self.bytes,
+            'hit_rate': (self.hits + self.negative_hits) / lookups if lookups else 0.0,
+        }
+
+    def _expired(self, entry):
+        return entry[1] is not None and self.clock() >= entry[1]
+
+    def _drop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self.bytes -= entry[3]
+        if self.on_discard is not None:
+            self.on_discard(key)
+        return True
+
+
+class CachedManager:
+    """
+    Caching proxy for a manager.
+
+    Cached read methods are served from an LRUCache; every other attribute is
+    passed through. Entries are invalidated through the manager's change
+    notifications when it has them, and otherwise expire by TTL.
+    """
+
+    def __init__(self, manager, methods=None, **cache_options):
+        """
+        Initialize the CachedManager.
+
+        Args:
+            manager: Manager to wrap
+            methods (iterable): Read methods to cache, defaults to the
+                entry in CACHED_METHODS for the manager's class or its
+                nearest base class
+            **cache_options: Keyword arguments for LRUCache
+        """
+        self.manager = manager
+        self.cache = LRUCache(on_discard=self._forget, **cache_options)
+        if methods is None:
+            methods = next((CACHED_METHODS[cls.__name__] for cls in type(manager).__mro__
+                            if cls.__name__ in CACHED_METHODS), ())
+        self.cached_methods = tuple(methods)
+        self._keys_by_record = {}
+        for name in self.cached_methods:
+            setattr(self, name, self._cached(name, getattr(manager, name)))
+        if hasattr(manager, 'subscribe'):
+            manager.subscribe(self._on_change)
+
+    def __getattr__(self, name):
+        """Pass attributes that are not cached through to the manager."""
+        return getattr(self.manager, name)
+
+    def invalidate(self, record_key):
+        """
+        Drop every cached read for a record.
+
+        Args:
+            record_key: Record ID, or a change notification key
+        """
+        for key in list(self._keys_by_record.get(record_id(record_key), ())):
+            self.cache.invalidate(key)
+
+    def stats(self):
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: Statistics from the underlying LRUCache
+        """
+        return self.cache.stats()
+
+    def _cached(self, name, method):
+        cache = self.cache
+
+        def cached(*args, **kwargs):
+            if kwargs or not args:
+                return method(*args, **kwargs)
+            key = (name, args)
+            value = cache.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+            value = method(*args)
+            negative = value is None or (isinstance(value, (dict, list)) and not value)
+            if cache.put(key, value, negative=negative):
+                self._keys_by_record.setdefault(args[0], set()).add(key)
+            return value
+
+        cached.__name__ = name
+        cached.__doc__ = method.__doc__
+        return cached
+
+    def _forget(self, key):
+        keys = self._keys_by_record.get(key[1][0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_record[key[1][0]]
+
+    def _on_change(self, key):
+        self.invalidate(key)
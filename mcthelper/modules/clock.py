@@ -0,0 +1,85 @@
+"""
+Clock Module
+
+Clocks used by date-dependent features. SystemClock reads the real date;
+ManualClock can be set and fast-forwarded in tests.
+"""
+
+from datetime import date, datetime, timedelta
+
+
+class SystemClock:
+    """Clock backed by the system date and time."""
+
+    def now(self):
+        """
+        Get the current date and time.
+
+        Returns:
+            datetime: Current local date and time
+        """
+        return datetime.now()
+
+    def today(self):
+        """
+        Get the current date.
+
+        Returns:
+            date: Current local date
+        """
+        return date.today()
+
+
+class ManualClock:
+    """Clock that only moves when told to."""
+
+    def __init__(self, start=None):
+        """
+        Initialize the ManualClock.
+
+        Args:
+            start (date | datetime | str): Initial time, defaults to now;
+                strings use the YYYY-MM-DD format
+        """
+        self.set(start if start is not None else datetime.now())
+
+    def set(self, value):
+        """
+        Move the clock to a specific time.
+
+        Args:
+            value (date | datetime | str): New time
+        """
+        if isinstance(value, str):
+            value = datetime.strptime(value, '%Y-%m-%d')
+        elif not isinstance(value, datetime):
+            value = datetime(value.year, value.month, value.day)
+        self._now = value
+
+    def advance(self, days=0, **kwargs):
+        """
+        Fast-forward the clock.
+
+        Args:
+            days (int): Number of days to move forward
+            **kwargs: Additional timedelta arguments such as hours
+        """
+        self._now += timedelta(days=days, **kwargs)
+
+    def now(self):
+        """
+        Get the clock's current date and time.
+
+        Returns:
+            datetime: Current clock time
+        """
+        return self._now
+
+    def today(self):
+        """
+        Get the clock's current date.
+
+        Returns:
+            date: Current clock date
+        """
+        return self._now.date()
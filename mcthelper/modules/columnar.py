@@ -0,0 +1,330 @@
+"""
+Columnar Module
+
+Compact binary export of qualification data for analytics. Trainer and
+course IDs are dictionary-encoded, dates are stored as int32 day ordinals
+and statuses as a uint8 enum, one column per field. Reading a file decodes
+each column straight into an ``array`` without creating per-row objects.
+
+File layout:
+    8 bytes   magic b'MCTQCOL1'
+    4 bytes   header length (little-endian uint32)
+    header    UTF-8 JSON describing the sections that follow
+    sections  dictionaries (NUL-separated UTF-8 strings) and columns
+              (little-endian arrays), each optionally zlib-compressed
+
+Compressed columns are byte-shuffled first (all first bytes, then all
+second bytes, ...), so the slowly varying high bytes of ordinals and codes
+compress to almost nothing.
+"""
+
+import json
+import struct
+import sys
+import zlib
+from array import array
+from collections import Counter
+from datetime import date, datetime
+from itertools import compress
+
+from .qualifications import QualificationManager
+
+
+MAGIC = b'MCTQCOL1'
+FORMAT_VERSION = 1
+
+# Stored for dates that are missing or not YYYY-MM-DD; real ordinals start at 1
+NO_DATE = 0
+
+_HEADER_LENGTH = struct.Struct('<I')
+_SEPARATOR = '\x00'
+_DATE_TYPE = 'i'
+
+
+def write_qualification_columns(qual_manager, path, compress=True):
+    """
+    Export qualifications to a columnar file.
+
+    Only certification_date, expiry_date and status are exported. Dates that
+    cannot be parsed are stored as missing and non-string statuses as ''.
+
+    Args:
+        qual_manager (QualificationManager): Qualifications to export
+        path (str): Output file path
+        compress (bool): zlib-compress each section
+
+    Returns:
+        int: Number of rows written
+
+    Raises:
+        ValueError: If an ID contains a NUL character or there are more
+            than 256 distinct statuses
+    """
+    trainer_codes = {}
+    course_codes = {}
+    status_codes = {}
+    ordinals = {}
+    trainer_column = array('i')
+    course_column = array('i')
+    certified_column = array(_DATE_TYPE)
+    expiry_column = array(_DATE_TYPE)
+    status_column = array('B')
+
+    for trainer_id, courses in qual_manager.qualifications.items():
+        trainer_code = trainer_codes.setdefault(trainer_id, len(trainer_codes))
+        for course_id, qual in courses.items():
+            trainer_column.append(trainer_code)
+            course_column.append(course_codes.setdefault(course_id, len(course_codes)))
+            certified_column.append(_ordinal(qual.get('certification_date'), ordinals))
+            expiry_column.append(_ordinal(qual.get('expiry_date'), ordinals))
+            status = qual.get('status')
+            status = status if isinstance(status, str) else ''
+            code = status_codes.get(status)
+            if code is None:
+                if len(status_codes) == 256:
+                    raise ValueError('More than 256 distinct qualification statuses')
+                code = status_codes[status] = len(status_codes)
+            status_column.append(code)
+
+    sections = [
+        ('trainers', 'dictionary', _encode_dictionary(trainer_codes)),
+        ('courses', 'dictionary', _encode_dictionary(course_codes)),
+        ('statuses', 'dictionary', _encode_dictionary(status_codes)),
+        ('trainer', 'column', _narrowest(trainer_column, len(trainer_codes))),
+        ('course', 'column', _narrowest(course_column, len(course_codes))),
+        ('certification_date', 'column', certified_column),
+        ('expiry_date', 'column', expiry_column),
+        ('status', 'column', status_column),
+    ]
+    header = {
+        'format': 'mcthelper-qualifications',
+        'version': FORMAT_VERSION,
+        'rows': len(status_column),
+        'sections': [],
+    }
+    payloads = []
+    for name, kind, value in sections:
+        if kind == 'dictionary':
+            strings, payload = value
+            entry = {'name': name, 'kind': kind, 'count': len(strings)}
+        else:
+            payload = _little_endian(value).tobytes()
+            entry = {'name': name, 'kind': kind, 'type': value.typecode,
+                     'itemsize': value.itemsize}
+            if compress:
+                payload = _shuffle(payload, value.itemsize)
+        if compress:
+            payload = zlib.compress(payload, 6)
+        entry['compressed'] = compress
+        entry['length'] = len(payload)
+        header['sections'].append(entry)
+        payloads.append(payload)
+
+    encoded_header = json.dumps(header, separators=(',', ':')).encode('utf-8')
+    with open(path, 'wb') as handle:
+        handle.write(MAGIC)
+        handle.write(_HEADER_LENGTH.pack(len(encoded_header)))
+        handle.write(encoded_header)
+        for payload in payloads:
+            handle.write(payload)
+    return header['rows']
+
+
+def read_qualification_columns(path):
+    """
+    Load a columnar qualification file.
+
+    Args:
+        path (str): File written by write_qualification_columns()
+
+    Returns:
+        QualificationColumns: The decoded columns
+
+    Raises:
+        ValueError: If the file is not a supported columnar export
+    """
+    with open(path, 'rb') as handle:
+        data = handle.read()
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError('Not a columnar qualification file')
+    offset = len(MAGIC)
+    (header_length,) = _HEADER_LENGTH.unpack_from(data, offset)
+    offset += _HEADER_LENGTH.size
+    header = json.loads(data[offset:offset + header_length].decode('utf-8'))
+    offset += header_length
+    if header.get('version') != FORMAT_VERSION:
+        raise ValueError(f"Unsupported columnar format version: {header.get('version')}")
+
+    view = memoryview(data)
+    dictionaries = {}
+    columns = {}
+    for section in header['sections']:
+        payload = view[offset:offset + section['length']]
+        offset += section['length']
+        if section['compressed']:
+            payload = zlib.decompress(payload)
+        if section['kind'] == 'dictionary':
+            strings = bytes(payload).decode('utf-8').split(_SEPARATOR) if section['count'] else []
+            dictionaries[section['name']] = strings
+        else:
+            column = array(section['type'])
+            if column.itemsize != section['itemsize']:
+                raise ValueError(f"Column {section['name']} has an unsupported item size")
+            if section['compressed']:
+                payload = _unshuffle(payload, column.itemsize)
+            column.frombytes(payload)
+            columns[section['name']] = _little_endian(column)
+    return QualificationColumns(header['rows'], dictionaries, columns)
+
+
+class QualificationColumns:
+    """Qualification rows held as typed column arrays."""
+
+    def __init__(self, rows, dictionaries, columns):
+        """
+        Initialize the QualificationColumns.
+
+        Args:
+            rows (int): Number of rows
+            dictionaries (dict): 'trainers', 'courses' and 'statuses' lists
+                indexed by code
+            columns (dict): 'trainer', 'course', 'certification_date',
+                'expiry_date' and 'status' arrays
+        """
+        self.rows = rows
+        self.trainers = dictionaries['trainers']
+        self.courses = dictionaries['courses']
+        self.statuses = dictionaries['statuses']
+        self.trainer = columns['trainer']
+        self.course = columns['course']
+        self.certification_date = columns['certification_date']
+        self.expiry_date = columns['expiry_date']
+        self.status = columns['status']
+
+    def __len__(self):
+        """Return the number of rows."""
+        return self.rows
+
+    def row(self, index):
+        """
+        Decode one row.
+
+        Args:
+            index (int): Row number
+
+        Returns:
+            tuple: (trainer_id, course_id, qualification_data)
+        """
+        return (
+            self.trainers[self.trainer[index]],
+            self.courses[self.course[index]],
+            {
+                'certification_date': _date_text(self.certification_date[index]),
+                'expiry_date': _date_text(self.expiry_date[index]),
+                'status': self.statuses[self.status[index]],
+            },
+        )
+
+    def status_counts(self):
+        """
+        Count rows per status without decoding rows.
+
+        Returns:
+            dict: Status to number of rows
+        """
+        return {status: self.status.count(code) for code, status in enumerate(self.statuses)}
+
+    def trainers_per_course(self, status='active'):
+        """
+        Count trainers per course for one status without decoding rows.
+
+        Rows are unique (trainer, course) pairs, so this counts rows.
+
+        Args:
+            status (str): Status to count, None for all rows
+
+        Returns:
+            dict: Course ID to number of trainers
+        """
+        if status is None:
+            codes = self.course
+        elif status not in self.statuses:
+            return {}
+        else:
+            # Map the wanted status code to 1 and every other code to 0
+            table = bytearray(256)
+            table[self.statuses.index(status)] = 1
+            codes = compress(self.course, self.status.tobytes().translate(table))
+        return {self.courses[code]: count for code, count in Counter(codes).items()}
+
+    def to_manager(self, qual_manager=None):
+        """
+        Load the rows into a QualificationManager.
+
+        Args:
+            qual_manager (QualificationManager): Manager to fill, defaults
+                to a new one
+
+        Returns:
+            QualificationManager: The filled manager
+        """
+        if qual_manager is None:
+            qual_manager = QualificationManager()
+        for index in range(self.rows):
+            qual_manager.add_qualification(*self.row(index))
+        return qual_manager
+
+
+def _ordinal(text, cache):
+    ordinal = cache.get(text)
+    if ordinal is None:
+        try:
+            ordinal = datetime.strptime(text, '%Y-%m-%d').date().toordinal()
+        except (TypeError, ValueError):
+            ordinal = NO_DATE
+        cache[text] = ordinal
+    return ordinal
+
+
+def _date_text(ordinal):
+    return None if ordinal == NO_DATE else date.fromordinal(ordinal).isoformat()
+
+
+def _encode_dictionary(codes):
+    strings = list(codes)
+    for value in strings:
+        if not isinstance(value, str) or _SEPARATOR in value:
+            raise ValueError(f'Cannot encode dictionary value: {value!r}')
+    return strings, _SEPARATOR.join(strings).encode('utf-8')
+
+
+def _narrowest(column, distinct):
+    # Store dictionary codes in the smallest unsigned type that fits
+    if distinct <= 0x100:
+        return array('B', column)
+    if distinct <= 0x10000:
+        return array('H', column)
+    return column
+
+
+def _shuffle(payload, itemsize):
+    if itemsize == 1:
+        return payload
+    return b''.join(payload[offset::itemsize] for offset in range(itemsize))
+
+
+def _unshuffle(payload, itemsize):
+    if itemsize == 1:
+        return payload
+    count = len(payload) // itemsize
+    data = bytearray(len(payload))
+    for offset in range(itemsize):
+        data[offset::itemsize] = payload[offset * count:(offset + 1) * count]
+    return data
+
+
+def _little_endian(column):
+    if sys.byteorder != 'little' and column.itemsize > 1:
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column
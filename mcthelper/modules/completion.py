@@ -0,0 +1,314 @@
+"""
+Completion Module
+
+Shell completion for the mcthelper command. Course and technology IDs are
+kept in sorted cache files, one ID per line, which the generated bash, zsh
+and fish scripts search by prefix without starting Python: with look(1)
+(a binary search) where it is installed, otherwise with awk.
+
+The files are sorted by code point, which for UTF-8 is byte order, so they
+match the C collation that look(1) expects.
+"""
+
+import os
+import shlex
+import tempfile
+from bisect import bisect_left
+
+
+# Cache file name: function returning the IDs of a manager
+KINDS = {
+    'courses': lambda manager: manager.courses,
+    'technologies': lambda manager: manager.technologies,
+}
+
+SHELLS = ('bash', 'zsh', 'fish')
+
+_BASH_TEMPLATE = r'''# bash completion for @PROGRAM@
+_@NAME@_ids() {
+    local file=@DIRECTORY@/"$1"
+    [ -r "$file" ] || return 0
+    if command -v look >/dev/null 2>&1; then
+        LC_ALL=C look -- "$2" "$file"
+    else
+        MCTHELPER_PREFIX="$2" LC_ALL=C awk 'index($0, ENVIRON["MCTHELPER_PREFIX"]) == 1' "$file"
+    fi
+}
+
+_@NAME@() {
+    local cur=${COMP_WORDS[COMP_CWORD]} prev=${COMP_WORDS[COMP_CWORD-1]}
+    local commands="@COMMANDS@" command= word i
+    for ((i = 1; i < COMP_CWORD; i++)); do
+        word=${COMP_WORDS[i]}
+        case " $commands " in
+            *" $word "*) command=$word; break ;;
+        esac
+    done
+    if [ -z "$command" ]; then
+        COMPREPLY=($(compgen -W "$commands" -- "$cur"))
+        return 0
+    fi
+    [ "$prev" = "$command" ] || return 0
+    local IFS=$'\n'
+    case $command in
+@CASES@
+    esac
+}
+
+complete -F _@NAME@ @PROGRAM@
+'''
+
+_ZSH_TEMPLATE = r'''#compdef @PROGRAM@
+_@NAME@_ids() {
+    local file=@DIRECTORY@/"$1"
+    [[ -r $file ]] || return 0
+    if (( $+commands[look] )); then
+        LC_ALL=C look -- "$2" "$file"
+    else
+        MCTHELPER_PREFIX="$2" LC_ALL=C awk 'index($0, ENVIRON["MCTHELPER_PREFIX"]) == 1' "$file"
+    fi
+}
+
+_@NAME@() {
+    local -a subcommands ids
+    local command= i
+    subcommands=(@COMMANDS@)
+    for (( i = 2; i < CURRENT; i++ )); do
+        if (( ${subcommands[(Ie)$words[i]]} )); then
+            command=$words[i]
+            break
+        fi
+    done
+    if [[ -z $command ]]; then
+        compadd -- $subcommands
+        return
+    fi
+    [[ $words[CURRENT-1] == $command ]] || return 1
+    case $command in
+@CASES@
+    esac
+}
+
+compdef _@NAME@ @PROGRAM@
+'''
+
+_FISH_TEMPLATE = r'''# fish completion for @PROGRAM@
+function __@NAME@_ids
+    set -l file @DIRECTORY@/$argv[1]
+    test -r $file; or return 0
+    set -l prefix (commandline -ct)
+    if command -sq look
+        env LC_ALL=C look -- "$prefix" $file
+    else
+        env MCTHELPER_PREFIX="$prefix" LC_ALL=C awk 'index($0, ENVIRON["MCTHELPER_PREFIX"]) == 1' $file
+    end
+end
+
+complete -c @PROGRAM@ -f
+@COMMANDS@
+@CASES@
+'''
+
+
+def default_cache_directory():
+    """
+    Get the directory holding the completion cache files.
+
+    Returns:
+        str: $MCTHELPER_CACHE_DIR, else mcthelper under $XDG_CACHE_HOME
+            or ~/.cache
+    """
+    directory = os.environ.get('MCTHELPER_CACHE_DIR')
+    if directory:
+        return directory
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'mcthelper')
+
+
+class CompletionCache:
+    """
+    Sorted ID files for shell completion, rewritten when the catalog changes.
+
+    Attached managers mark their kind as changed through subscribe();
+    refresh() then rewrites only the files whose contents differ.
+    """
+
+    def __init__(self, directory=None):
+        """
+        Initialize the CompletionCache.
+
+        Args:
+            directory (str): Cache directory, defaults to
+                default_cache_directory()
+        """
+        self.directory = directory or default_cache_directory()
+        self._managers = {}
+        self._changed = set()
+
+    def attach(self, kind, manager):
+        """
+        Keep a cache file in step with a manager.
+
+        Args:
+            kind (str): 'courses' or 'technologies'
+            manager: CourseDetails for courses, TechLearning for technologies
+
+        Returns:
+            bool: True if attached, False for an unknown kind
+        """
+        if kind not in KINDS:
+            return False
+        self._managers[kind] = manager
+        self._changed.add(kind)
+        manager.subscribe(lambda key: self._changed.add(kind))
+        return True
+
+    def refresh(self):
+        """
+        Rewrite the cache files of changed kinds whose IDs differ on disk.
+
+        Returns:
+            list: Kinds whose files were written
+        """
+        written = []
+        for kind in sorted(self._changed):
+            ids = sorted(_valid_ids(KINDS[kind](self._managers[kind])))
+            if ids != self.read(kind) or not os.path.exists(self.path(kind)):
+                self.write(kind, ids)
+                written.append(kind)
+        self._changed.clear()
+        return written
+
+    def path(self, kind):
+        """
+        Get the cache file path for a kind.
+
+        Args:
+            kind (str): 'courses' or 'technologies'
+
+        Returns:
+            str: File path
+        """
+        return os.path.join(self.directory, kind)
+
+    def write(self, kind, ids):
+        """
+        Atomically replace a cache file.
+
+        Args:
+            kind (str): 'courses' or 'technologies'
+            ids (iterable): IDs to store; IDs containing line breaks are dropped
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        handle, temp_path = tempfile.mkstemp(dir=self.directory, prefix=f'.{kind}.')
+        try:
+            with os.fdopen(handle, 'w', encoding='utf-8', newline='\n') as output:
+                for item in sorted(set(_valid_ids(ids))):
+                    output.write(item + '\n')
+            os.replace(temp_path, self.path(kind))
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    def read(self, kind):
+        """
+        Load a cache file.
+
+        Args:
+            kind (str): 'courses' or 'technologies'
+
+        Returns:
+            list: Sorted IDs, empty if the file does not exist
+        """
+        try:
+            with open(self.path(kind), encoding='utf-8', newline='') as handle:
+                data = handle.read()
+        except FileNotFoundError:
+            return []
+        return data.split('\n')[:-1]
+
+    def complete(self, kind, prefix):
+        """
+        Find cached IDs starting with a prefix.
+
+        Args:
+            kind (str): 'courses' or 'technologies'
+            prefix (str): Text typed so far
+
+        Returns:
+            list: Matching IDs in sorted order
+        """
+        ids = self.read(kind)
+        start = end = bisect_left(ids, prefix)
+        while end < len(ids) and ids[end].startswith(prefix):
+            end += 1
+        return ids[start:end]
+
+
+def completion_script(shell, commands, id_commands, directory=None, program='mcthelper'):
+    """
+    Generate a completion script.
+
+    Args:
+        shell (str): 'bash', 'zsh' or 'fish'
+        commands (dict): Subcommand name to help text
+        id_commands (dict): Subcommand name to the cache kind completing
+            its first argument
+        directory (str): Cache directory, defaults to default_cache_directory()
+        program (str): Command name to complete
+
+    Returns:
+        str: Script to source in the shell
+
+    Raises:
+        ValueError: If the shell is not supported
+    """
+    if shell not in SHELLS:
+        raise ValueError(f"Unsupported shell: {shell!r} (expected one of {', '.join(SHELLS)})")
+    directory = directory or default_cache_directory()
+    by_kind = {}
+    for command, kind in id_commands.items():
+        by_kind.setdefault(kind, []).append(command)
+
+    if shell == 'fish':
+        template = _FISH_TEMPLATE
+        quoted_directory = _fish_quote(directory)
+        command_lines = '\n'.join(
+            f'complete -c {program} -n __fish_use_subcommand -a {_fish_quote(name)}'
+            f' -d {_fish_quote(help_text)}'
+            for name, help_text in commands.items())
+        cases = '\n'.join(
+            f"complete -c {program} -n 'contains -- (commandline -opc)[-1] {' '.join(names)}'"
+            f" -a '(__{_name(program)}_ids {kind})'"
+            for kind, names in by_kind.items())
+    else:
+        template = _BASH_TEMPLATE if shell == 'bash' else _ZSH_TEMPLATE
+        quoted_directory = shlex.quote(directory)
+        command_lines = ' '.join(commands)
+        if shell == 'bash':
+            reply = 'COMPREPLY=($(_{name}_ids {kind} "$cur"))'
+        else:
+            reply = 'ids=(${{(f)"$(_{name}_ids {kind} "$PREFIX")"}}); compadd -- $ids'
+        cases = '\n'.join(
+            f"        {'|'.join(names)}) {reply.format(name=_name(program), kind=kind)} ;;"
+            for kind, names in by_kind.items())
+
+    return (template
+            .replace('@PROGRAM@', program)
+            .replace('@NAME@', _name(program))
+            .replace('@DIRECTORY@', quoted_directory)
+            .replace('@COMMANDS@', command_lines)
+            .replace('@CASES@', cases))
+
+
+def _valid_ids(ids):
+    return (item for item in ids if isinstance(item, str) and item and '\n' not in item
+            and '\r' not in item)
+
+
+def _name(program):
+    return ''.join(c if c.isalnum() else '_' for c in program)
+
+
+def _fish_quote(text):
+    return "'" + text.replace('\\', '\\\\').replace("'", "\\'") + "'"
@@ -0,0 +1,181 @@
+"""
+Compression Module
+
+Optional compressed storage for large record fields. Values are stored
+compressed with zlib or lzma and decoded only when read, with a small LRU
+cache of decoded records for frequently read courses.
+"""
+
+import json
+import lzma
+import zlib
+from collections import OrderedDict
+
+
+CODECS = {
+    'zlib': (lambda data: zlib.compress(data, 6), zlib.decompress),
+    'lzma': (lzma.compress, lzma.decompress),
+}
+
+
+class CompressedField:
+    """A compressed string or JSON-serializable value."""
+
+    __slots__ = ('data', 'codec', 'is_text')
+
+    def __init__(self, value, codec='zlib'):
+        """
+        Compress a value.
+
+        Args:
+            value (str | list): Value to compress
+            codec (str): 'zlib' or 'lzma'
+        """
+        self.is_text = isinstance(value, str)
+        raw = value if self.is_text else json.dumps(value, separators=(',', ':'))
+        self.data = CODECS[codec][0](raw.encode('utf-8'))
+        self.codec = codec
+
+    def __eq__(self, other):
+        """Compare by compressed content."""
+        if not isinstance(other, CompressedField):
+            return NotImplemented
+        return (self.data, self.codec, self.is_text) == (other.data, other.codec, other.is_text)
+
+    def __hash__(self):
+        """Hash by compressed content."""
+        return hash(self.data)
+
+    def decode(self):
+        """
+        Decompress the value.
+
+        Returns:
+            str | list: The original value
+        """
+        raw = CODECS[self.codec][1](self.data).decode('utf-8')
+        return raw if self.is_text else json.loads(raw)
+
+
+def _encoded_size(value):
+    if isinstance(value, str):
+        return len(value.encode('utf-8'))
+    if isinstance(value, (list, tuple)) and all(isinstance(item, str) for item in value):
+        return sum(len(item.encode('utf-8')) for item in value)
+    return 0
+
+
+class FieldCompressor:
+    """Compresses selected record fields and caches decoded records."""
+
+    def __init__(self, threshold=256, codec='zlib', cache_size=128):
+        """
+        Initialize the FieldCompressor.
+
+        Args:
+            threshold (int): Minimum encoded size in bytes before a field is compressed
+            codec (str): 'zlib' or 'lzma'
+            cache_size (int): Number of decoded records kept for hot lookups
+        """
+        if codec not in CODECS:
+            raise ValueError(f'Unknown codec: {codec}')
+        self.threshold = threshold
+        self.codec = codec
+        self.cache_size = cache_size
+        self.stats = {'hits': 0, 'decodes': 0}
+        self._cache = OrderedDict()
+
+    def pack(self, record, fields):
+        """
+        Compress the large fields of a record.
+
+        Args:
+            record (dict): Record to store
+            fields (iterable): Names of fields that may be compressed
+
+        Returns:
+            dict: The record itself if nothing was compressed, otherwise a
+                copy holding CompressedField values
+        """
+        packed = None
+        for field in fields:
+            value = record.get(field)
+            if _encoded_size(value) >= self.threshold:
+                if packed is None:
+                    packed = dict(record)
+                packed[field] = CompressedField(list(value) if isinstance(value, tuple)
+                                                else value, self.codec)
+        return record if packed is None else packed
+
+    def unpack(self, key, record, cache=True):
+        """
+        Get the decoded form of a stored record.
+
+        Args:
+            key (str): Record key used for the decoded-record cache
+            record (dict): Stored record
+            cache (bool): Whether to read and fill the decoded-record cache
+
+        Returns:
+            dict: Record with plain field values
+        """
+        if record is None or not self.is_packed(record):
+            return record
+        if cache:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] is record:
+                self._cache.move_to_end(key)
+                self.stats['hits'] += 1
+                return cached[1]
+
+        self.stats['decodes'] += 1
+        decoded = {name: value.decode() if isinstance(value, CompressedField) else value
+                   for name, value in record.items()}
+        if cache:
+            self._cache[key] = (record, decoded)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return decoded
+
+    def get_field(self, key, record, field):
+        """
+        Read one field, decoding it without caching the whole record.
+
+        Args:
+            key (str): Record key
+            record (dict): Stored record
+            field (str): Field name
+
+        Returns:
+            The plain field value
+        """
+        value = record.get(field)
+        if not isinstance(value, CompressedField):
+            return value
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] is record:
+            return cached[1][field]
+        return value.decode()
+
+    def discard(self, key):
+        """
+        Drop a record from the decoded-record cache.
+
+        Args:
+            key (str): Record key
+        """
+        self._cache.pop(key, None)
+
+    @staticmethod
+    def is_packed(record):
+        """
+        Check whether a stored record holds compressed fields.
+
+        Args:
+            record (dict): Stored record
+
+        Returns:
+            bool: True if any field is compressed
+        """
+        return any(isinstance(value, CompressedField) for value in record.values())
@@ -0,0 +1,115 @@
+"""
+Course Bundle Module
+
+Single-call access to everything a course page needs, served from a
+bounded LRU cache that is invalidated per component as managers change.
+"""
+
+from collections import OrderedDict
+
+
+class CourseCatalog:
+    """Facade combining course, summary, preparation and trainer data."""
+
+    def __init__(self, course_details, summary_info, lecture_prep, qual_manager,
+                 cache_size=256):
+        """
+        Initialize the CourseCatalog facade.
+
+        Args:
+            course_details (CourseDetails): Course manager
+            summary_info (SummaryInfo): Summary manager
+            lecture_prep (LecturePreparation): Preparation manager
+            qual_manager (QualificationManager): Qualification manager
+            cache_size (int): Maximum number of cached course bundles
+        """
+        self.course_details = course_details
+        self.summary_info = summary_info
+        self.lecture_prep = lecture_prep
+        self.qual_manager = qual_manager
+        self.cache_size = cache_size
+        self.stats = {'hits': 0, 'misses': 0, 'refreshes': 0, 'evictions': 0}
+        self._cache = OrderedDict()
+        self._loaders = {
+            'course': lambda cid: self.course_details.get_course(cid),
+            'summary': lambda cid: self.summary_info.get_summary(cid),
+            'prep_materials': lambda cid: self.lecture_prep.get_prep_materials(cid),
+            'checklist': lambda cid: self.lecture_prep.get_checklist(cid),
+            'qualified_trainers': lambda cid: self.qual_manager.get_qualified_trainers(cid),
+        }
+
+        course_details.subscribe(lambda cid: self.invalidate(cid, 'course'))
+        summary_info.subscribe(lambda cid: self.invalidate(cid, 'summary'))
+        lecture_prep.subscribe(lambda cid: self.invalidate(cid, 'prep_materials', 'checklist'))
+        qual_manager.subscribe(lambda key: self.invalidate(key[1], 'qualified_trainers'))
+
+    def get_course_bundle(self, course_id):
+        """
+        Get all course page data for a course in one call.
+
+        Args:
+            course_id (str): Unique identifier for the course
+
+        Returns:
+            dict: Bundle with 'course_id', 'course', 'summary',
+                'prep_materials', 'checklist' and 'qualified_trainers',
+                or None if the course does not exist
+        """
+        entry = self._cache.get(course_id)
+        # Qualified trainers depend on today's date as well as on the data
+        today = self._today()
+        if entry is not None and entry.get('_as_of') != today:
+            entry.pop('qualified_trainers', None)
+
+        if entry is not None and all(component in entry for component in self._loaders):
+            self._cache.move_to_end(course_id)
+            self.stats['hits'] += 1
+            return self._public(entry)
+
+        if entry is None:
+            self.stats['misses'] += 1
+            entry = {'course_id': course_id}
+        else:
+            self.stats['refreshes'] += 1
+        for component, loader in self._loaders.items():
+            if component not in entry:
+                entry[component] = loader(course_id)
+        entry['_as_of'] = today
+
+        if entry['course'] is None:
+            self._cache.pop(course_id, None)
+            return None
+
+        self._cache[course_id] = entry
+        self._cache.move_to_end(course_id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+            self.stats['evictions'] += 1
+        return self._public(entry)
+
+    def invalidate(self, course_id, *components):
+        """
+        Drop cached components for a course.
+
+        Args:
+            course_id (str): Unique identifier for the course
+            *components (str): Components to drop; all when omitted
+        """
+        if not components:
+            self._cache.pop(course_id, None)
+            return
+        entry = self._cache.get(course_id)
+        if entry is not None:
+            for component in components:
+                entry.pop(component, None)
+
+    def clear_cache(self):
+        """Drop every cached bundle."""
+        self._cache.clear()
+
+    def _today(self):
+        return self.qual_manager.clock.today()
+
+    @staticmethod
+    def _public(entry):
+        return {key: value for key, value in entry.items() if key != '_as_of'}
@@ -4,12 +4,32 @@ Course Details Module
 Provides MCTs with quick and accurate information on course details.
 """
 
+from .observable import Observable
 
-class CourseDetails:
+
+class CourseDetails(Observable):
     """Manages and provides course detail information for MCTs."""
     
-    def __init__(self):
-        """Initialize the CourseDetails manager."""
+    # Large text fields that may be stored compressed
+    COMPRESSIBLE_FIELDS = ('description',)
+    
+    def __init__(self, intern_pool=None, compressor=None, history=None):
+        """
+        Initialize the CourseDetails manager.
+        
+        Args:
+            intern_pool (InternPool): Optional pool shared with other managers;
+                when given, string values are stored once and lists are
+                stored as tuples
+            compressor (FieldCompressor): Optional compressor for large
+                descriptions, decoded only when read
+            history (VersionHistory): Optional revision history; when given,
+                earlier revisions stay readable by version or date
+        """
+        super().__init__()
+        self.intern_pool = intern_pool
+        self.compressor = compressor
+        self.history = history
         self.courses = {}
     
     def add_course(self, course_id, course_info):
@@ -35,20 +55,64 @@ class CourseDetails:
         if not all(field in course_info for field in required_fields):
             return False
         
+        if self.compressor is not None:
+            course_info = self.compressor.pack(course_info, self.COMPRESSIBLE_FIELDS)
+            self.compressor.discard(course_id)
+        
+        if self.intern_pool is not None:
+            previous = self.courses.get(course_id)
+            course_info = self.intern_pool.intern_record(course_info)
+            if previous is not None:
+                self.intern_pool.release_record(previous)
+        
+        if self.history is not None:
+            course_info = self.history.record(course_id, course_info)
+        
         self.courses[course_id] = course_info
+        self._notify(course_id)
         return True
     
-    def get_course(self, course_id):
+    def remove_course(self, course_id):
+        """
+        Remove a course from the system.
+        
+        Args:
+            course_id (str): Unique identifier for the course
+        
+        Returns:
+            bool: True if the course existed and was removed
+        """
+        if course_id not in self.courses:
+            return False
+        
+        removed = self.courses.pop(course_id)
+        if self.intern_pool is not None:
+            self.intern_pool.release_record(removed)
+        if self.compressor is not None:
+            self.compressor.discard(course_id)
+        if self.history is not None:
+            self.history.record(course_id, None)
+        self._notify(course_id)
+        return True
+    
+    def get_course(self, course_id, version=None, as_of=None):
         """
         Retrieve course details by course ID.
         
         Args:
             course_id (str): Unique identifier for the course
+            version (int): Revision number starting at 1; requires history
+            as_of (date | datetime | str): Return the revision current at
+                this time (YYYY-MM-DD for strings); requires history
         
         Returns:
             dict: Course information or None if not found
         """
-        return self.courses.get(course_id)
+        if version is None and as_of is None:
+            return self._decoded(course_id, self.courses.get(course_id))
+        if self.history is None:
+            return None
+        return self._decoded(course_id, self.history.get(course_id, version, as_of), cache=False)
     
     def search_courses(self, keyword):
         """
@@ -67,9 +131,13 @@ class CourseDetails:
         results = []
         
         for course_id, info in self.courses.items():
-            if (keyword_lower in info['name'].lower() or 
-                keyword_lower in info['description'].lower()):
-                results.append({'id': course_id, **info})
+            if keyword_lower in info['name'].lower():
+                results.append({'id': course_id, **self._decoded(course_id, info, cache=False)})
+                continue
+            description = (info['description'] if self.compressor is None else
+                           self.compressor.get_field(course_id, info, 'description'))
+            if keyword_lower in description.lower():
+                results.append({'id': course_id, **self._decoded(course_id, info, cache=False)})
         
         return results
     
@@ -80,4 +148,10 @@ class CourseDetails:
         Returns:
             list: List of all courses with their IDs
         """
-        return [{'id': cid, **info} for cid, info in self.courses.items()]
+        return [{'id': cid, **self._decoded(cid, info, cache=False)}
+                for cid, info in self.courses.items()]
+    
+    def _decoded(self, course_id, info, cache=True):
+        if self.compressor is None:
+            return info
+        return self.compressor.unpack(course_id, info, cache=cache)
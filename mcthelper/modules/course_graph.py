@@ -0,0 +1,305 @@
+"""
+Course Graph Module
+
+Resolves free-text SummaryInfo prerequisites to course IDs and answers
+prerequisite-chain, cycle and "unlocked by" queries from cached closures
+that are invalidated only where the graph changed.
+"""
+
+import re
+from collections import deque
+
+
+COURSE_ID_PATTERN = re.compile(r'\b[A-Za-z]{2,3}-\d{2,4}\b')
+
+
+def _name_keys(name):
+    key = ' '.join(name.lower().split())
+    keys = {key}
+    if key.startswith('microsoft '):
+        keys.add(key[len('microsoft '):])
+    return keys
+
+
+class CoursePrerequisiteGraph:
+    """Course-to-course prerequisite graph derived from summaries."""
+
+    def __init__(self, summary_info, course_details=None):
+        """
+        Initialize the graph from existing summaries and keep it up to date.
+
+        Args:
+            summary_info (SummaryInfo): Source of prerequisite lists
+            course_details (CourseDetails): Optional source of course names,
+                used to resolve prerequisites written as course names
+        """
+        self.summary_info = summary_info
+        self.course_details = course_details
+        self.requires = {}
+        self.required_by = {}
+        self.unresolved = {}
+        self._names = {}
+        self._course_names = {}
+        self._mentions = {}
+        self._mentioned_by = {}
+        self._closures = {}
+        self._unlocks = {}
+        self._cycles = None
+
+        if course_details is not None:
+            for course_id in course_details.courses:
+                self._index_name(course_id)
+            course_details.subscribe(self._on_course_change)
+        for course_id in summary_info.summaries:
+            self._resolve(course_id)
+        summary_info.subscribe(self._on_summary_change)
+
+    def direct_prerequisites(self, course_id):
+        """
+        Get the courses directly required by a course.
+
+        Args:
+            course_id (str): Unique identifier for the course
+
+        Returns:
+            frozenset: Course IDs
+        """
+        return frozenset(self.requires.get(course_id, ()))
+
+    def all_prerequisites(self, course_id):
+        """
+        Get the full transitive prerequisite chain of a course.
+
+        Args:
+            course_id (str): Unique identifier for the course
+
+        Returns:
+            frozenset: Every course reachable through prerequisites; contains
+                ``course_id`` itself only if it is part of a cycle
+        """
+        return self._closure(course_id, self.requires, self._closures)
+
+    def unlocked_by(self, course_id, transitive=True):
+        """
+        Get the courses that build on a course.
+
+        Args:
+            course_id (str): Unique identifier for the course
+            transitive (bool): Include courses that require it indirectly
+
+        Returns:
+            frozenset: Course IDs
+        """
+        if not transitive:
+            return frozenset(self.required_by.get(course_id, ()))
+        return self._closure(course_id, self.required_by, self._unlocks)
+
+    def has_cycle(self, course_id):
+        """
+        Check whether a course is part of a prerequisite cycle.
+
+        Args:
+            course_id (str): Unique identifier for the course
+
+        Returns:
+            bool: True if the course transitively requires itself
+        """
+        return course_id in self.all_prerequisites(course_id)
+
+    def find_cycles(self):
+        """
+        Find every prerequisite cycle in the graph.
+
+        Returns:
+            list: Sorted lists of course IDs, one per strongly connected
+                group of courses that require each other
+        """
+        if self._cycles is None:
+            self._cycles = self._strongly_connected()
+        return [list(group) for group in self._cycles]
+
+    def study_order(self, course_id):
+        """
+        Get the order in which to take a course and its prerequisites.
+
+        Courses caught in a cycle are placed after everything else in ID order.
+
+        Args:
+            course_id (str): Unique identifier for the course
+
+        Returns:
+            list: Course IDs, prerequisites first, ending with ``course_id``
+        """
+        needed = set(self.all_prerequisites(course_id)) | {course_id}
+        indegree = {c: len(self.requires.get(c, set()) & needed) for c in needed}
+        ready = sorted(c for c, degree in indegree.items() if degree == 0)
+        order = []
+        while ready:
+            current = ready.pop(0)
+            order.append(current)
+            for dependent in sorted(self.required_by.get(current, set()) & needed):
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    ready.append(dependent)
+            ready.sort()
+        remaining = sorted(needed.difference(order))
+        if course_id in remaining:
+            remaining.remove(course_id)
+            remaining.append(course_id)
+        return order + remaining
+
+    def _closure(self, start, edges, cache):
+        cached = cache.get(start)
+        if cached is not None:
+            return cached
+        seen = set()
+        queue = deque(edges.get(start, ()))
+        while queue:
+            current = queue.popleft()
+            if current in seen:
+                continue
+            seen.add(current)
+            known = cache.get(current)
+            if known is not None:
+                seen |= known
+                continue
+            queue.extend(edges.get(current, ()))
+        result = cache[start] = frozenset(seen)
+        return result
+
+    def _strongly_connected(self):
+        # Iterative Tarjan's algorithm
+        index = {}
+        low = {}
+        on_stack = set()
+        stack = []
+        groups = []
+        counter = 0
+        for root in sorted(self.requires):
+            if root in index:
+                continue
+            work = [(root, iter(sorted(self.requires.get(root, ()))))]
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, children = work[-1]
+                advanced = False
+                for child in children:
+                    if child not in index:
+                        index[child] = low[child] = counter
+                        counter += 1
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(sorted(self.requires.get(child, ())))))
+                        advanced = True
+                        break
+                    if child in on_stack:
+                        low[node] = min(low[node], index[child])
+                if advanced:
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    group = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        group.append(member)
+                        if member == node:
+                            break
+                    if len(group) > 1 or node in self.requires.get(node, ()):
+                        groups.append(sorted(group))
+        return sorted(groups)
+
+    def _index_name(self, course_id):
+        for key in self._course_names.pop(course_id, ()):
+            if self._names.get(key) == course_id:
+                del self._names[key]
+        course = self.course_details.get_course(course_id)
+        if course:
+            keys = _name_keys(course['name'])
+            for key in keys:
+                self._names[key] = course_id
+            self._course_names[course_id] = keys
+
+    def _known(self, course_id):
+        if course_id in self.summary_info.summaries:
+            return True
+        return self.course_details is not None and course_id in self.course_details.courses
+
+    def _on_course_change(self, course_id):
+        # Re-resolve summaries that mention this course by ID or by old or new name
+        keys = {course_id.upper()} | self._course_names.get(course_id, set())
+        self._index_name(course_id)
+        keys |= self._course_names.get(course_id, set())
+        self._resolve_mentions(keys)
+
+    def _on_summary_change(self, course_id):
+        self._resolve(course_id)
+        self._resolve_mentions({course_id.upper()})
+
+    def _resolve_mentions(self, keys):
+        affected = set()
+        for key in keys:
+            affected |= self._mentions.get(key, set())
+        for dependent in affected:
+            self._resolve(dependent)
+
+    def _resolve(self, course_id):
+        summary = self.summary_info.get_summary(course_id)
+        resolved = set()
+        unresolved = []
+        mentions = set()
+        for text in (summary or {}).get('prerequisites', ()):
+            found = set()
+            for match in COURSE_ID_PATTERN.findall(text):
+                mentions.add(match.upper())
+                if self._known(match.upper()):
+                    found.add(match.upper())
+            for key in _name_keys(text):
+                mentions.add(key)
+                if key in self._names:
+                    found.add(self._names[key])
+            if found:
+                resolved |= found
+            else:
+                unresolved.append(text)
+
+        for key in self._mentioned_by.pop(course_id, ()):
+            self._mentions[key].discard(course_id)
+            if not self._mentions[key]:
+                del self._mentions[key]
+        for key in mentions:
+            self._mentions.setdefault(key, set()).add(course_id)
+        if mentions:
+            self._mentioned_by[course_id] = mentions
+        if unresolved:
+            self.unresolved[course_id] = unresolved
+        else:
+            self.unresolved.pop(course_id, None)
+        self._set_edges(course_id, resolved)
+
+    def _set_edges(self, course_id, new):
+        old = self.requires.get(course_id, set())
+        if new == old and course_id in self.requires:
+            return
+        old_closure = self.all_prerequisites(course_id)
+
+        # Closures change for the course and every course that reaches it
+        for dependent in self.unlocked_by(course_id) | {course_id}:
+            self._closures.pop(dependent, None)
+        for prerequisite in old - new:
+            self.required_by[prerequisite].discard(course_id)
+        for prerequisite in new - old:
+            self.required_by.setdefault(prerequisite, set()).add(course_id)
+        self.requires[course_id] = set(new)
+        self.required_by.setdefault(course_id, set())
+
+        # "Unlocked by" sets change for everything the course reached before or after
+        for prerequisite in old_closure | self.all_prerequisites(course_id) | {course_id}:
+            self._unlocks.pop(prerequisite, None)
+        self._cycles = None
@@ -0,0 +1,39 @@
+"""
+Durations Module
+
+Parses free-form duration strings such as '2 hours', '90 minutes' or
+'1h 30m' into whole minutes.
+"""
+
+import re
+
+
+DURATION_PATTERN = re.compile(
+    r'(\d+(?:\.\d+)?)\s*(hours?|hrs?|h|minutes?|mins?|m)(?![a-z])', re.IGNORECASE)
+
+# Stored in place of a module duration that could not be parsed
+UNPARSED = -1
+
+
+def parse_duration_minutes(text):
+    """
+    Parse a duration string into minutes.
+
+    Every number followed by an hour or minute unit is added up, so
+    '1 hour 30 minutes' and '1h30m' both give 90.
+
+    Args:
+        text (str): Duration such as '2 hours' or '45 min'
+
+    Returns:
+        int: Rounded number of minutes, or None if no duration was found
+    """
+    if not isinstance(text, str):
+        return None
+    matches = DURATION_PATTERN.findall(text)
+    if not matches:
+        return None
+    total = 0.0
+    for amount, unit in matches:
+        total += float(amount) * (60 if unit[0].lower() == 'h' else 1)
+    return int(round(total))
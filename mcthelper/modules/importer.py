@@ -0,0 +1,381 @@
+"""
+Importer Module
+
+Bulk import of catalog exports in JSON Lines format. The file is split into
+byte ranges that worker processes parse, validate and normalize in
+parallel; the results are then applied to the managers by a single writer
+in file order, so the final state and error report are the same as for a
+serial import.
+
+Each line holds one record:
+    {"type": "course", "id": "AZ-900", "data": {...}}
+    {"type": "qualification", "trainer_id": "MCT-1", "course_id": "AZ-900",
+     "data": {...}}
+Record types are course, summary, prep_material, qualification, technology
+and learning_path.
+"""
+
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from .durations import parse_duration_minutes
+
+
+DEFAULT_CHUNK_BYTES = 4 * 1024 * 1024
+
+# Record type: (manager argument, required data fields)
+RECORD_TYPES = {
+    'technology': ('tech_learning', ('name', 'category', 'description', 'latest_version',
+                                     'resources')),
+    'learning_path': ('tech_learning', ('title', 'technologies', 'modules', 'duration', 'level')),
+    'course': ('course_details', ('name', 'description', 'duration', 'level', 'topics')),
+    'summary': ('summary_info', ('overview', 'key_points', 'prerequisites', 'target_audience')),
+    'prep_material': ('lecture_prep', ('slides', 'labs', 'demos', 'resources', 'timing')),
+    'qualification': ('qual_manager', ('certification_date', 'expiry_date', 'status')),
+}
+
+# Data fields that must be lists, per record type
+LIST_FIELDS = {
+    'technology': ('resources', 'prerequisites'),
+    'learning_path': ('technologies', 'modules', 'requires'),
+    'course': ('topics',),
+    'summary': ('key_points', 'prerequisites'),
+    'prep_material': ('slides', 'labs', 'demos', 'resources'),
+}
+
+QUALIFICATION_STATUSES = ('active', 'expired', 'pending')
+
+
+def normalize_record(entry):
+    """
+    Validate and normalize one parsed export line.
+
+    Args:
+        entry (dict): Decoded JSON object
+
+    Returns:
+        tuple: (record_type, key, data, timing_minutes); key is the record
+            ID, or (trainer_id, course_id) for qualifications, and
+            timing_minutes is the parsed module timing of prep materials,
+            with None for modules whose timing cannot be parsed
+
+    Raises:
+        ValueError: With a description of the first problem found
+    """
+    if not isinstance(entry, dict):
+        raise ValueError('line is not a JSON object')
+    record_type = entry.get('type')
+    if record_type not in RECORD_TYPES:
+        raise ValueError(f'unknown record type: {record_type!r}')
+    if record_type == 'qualification':
+        key = (_identifier(entry, 'trainer_id'), _identifier(entry, 'course_id'))
+    else:
+        key = _identifier(entry, 'id')
+    data = entry.get('data')
+    if not isinstance(data, dict):
+        raise ValueError('data must be an object')
+    missing = [field for field in RECORD_TYPES[record_type][1] if field not in data]
+    if missing:
+        raise ValueError(f"missing required fields: {', '.join(missing)}")
+    for field in LIST_FIELDS.get(record_type, ()):
+        if field in data and not isinstance(data[field], list):
+            raise ValueError(f'{field} must be a list')
+
+    data = dict(data)
+    timing_minutes = None
+    if record_type == 'course':
+        duration = data['duration']
+        if isinstance(duration, bool) or not isinstance(duration, (int, float)):
+            raise ValueError('duration must be a number')
+    elif record_type == 'prep_material':
+        if not isinstance(data['timing'], dict):
+            raise ValueError('timing must be an object')
+        timing_minutes = [parse_duration_minutes(text) for text in data['timing'].values()]
+    elif record_type == 'qualification':
+        certified = _parse_date(data, 'certification_date')
+        expires = _parse_date(data, 'expiry_date')
+        if expires < certified:
+            raise ValueError('expiry_date is before certification_date')
+        status = data['status'].strip().lower() if isinstance(data['status'], str) else None
+        if status not in QUALIFICATION_STATUSES:
+            raise ValueError(f"status must be one of {', '.join(QUALIFICATION_STATUSES)}")
+        data['certification_date'] = certified.isoformat()
+        data['expiry_date'] = expires.isoformat()
+        data['status'] = status
+    return record_type, key, data, timing_minutes
+
+
+def chunk_ranges(path, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """
+    Split a file into byte ranges that start and end on line boundaries.
+
+    Args:
+        path (str): File path
+        chunk_bytes (int): Approximate size of each range
+
+    Returns:
+        list: (start, end) byte offsets covering the whole file
+    """
+    size = os.path.getsize(path)
+    ranges = []
+    start = 0
+    with open(path, 'rb') as handle:
+        while start < size:
+            handle.seek(start + chunk_bytes)
+            handle.readline()
+            end = min(handle.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def parse_chunk(path, start, end):
+    """
+    Parse and validate the lines of one byte range.
+
+    Runs in worker processes, so it only returns plain data.
+
+    Args:
+        path (str): File path
+        start (int): Offset of the first line
+        end (int): Offset just past the last line
+
+    Returns:
+        tuple: (line_count, records, errors); records are
+            (line, record_type, key, data, timing_minutes) and errors are
+            (line, record_type, record_id, message), with line numbers
+            counted from 1 within the range
+    """
+    records = []
+    errors = []
+    line = 0
+    with open(path, 'rb') as handle:
+        handle.seek(start)
+        position = start
+        while position < end:
+            raw = handle.readline()
+            if not raw:
+                break
+            position += len(raw)
+            line += 1
+            if not raw.strip():
+                continue
+            try:
+                entry = json.loads(raw)
+            except ValueError as exc:
+                errors.append((line, None, None, f'invalid JSON: {exc}'))
+                continue
+            try:
+                records.append((line,) + normalize_record(entry))
+            except ValueError as exc:
+                record_type, record_id = _describe(entry)
+                errors.append((line, record_type, record_id, str(exc)))
+    return line, records, errors
+
+
+class CatalogImporter:
+    """Imports JSON Lines catalog exports into the managers."""
+
+    def __init__(self, course_details=None, summary_info=None, lecture_prep=None,
+                 qual_manager=None, tech_learning=None, workers=None,
+                 chunk_bytes=DEFAULT_CHUNK_BYTES):
+        """
+        Initialize the CatalogImporter.
+
+        Args:
+            course_details (CourseDetails): Receives course records
+            summary_info (SummaryInfo): Receives summary records
+            lecture_prep (LecturePreparation): Receives prep material records
+            qual_manager (QualificationManager): Receives qualification records
+            tech_learning (TechLearning): Receives technology and learning
+                path records
+            workers (int): Parser processes, defaults to the CPU count;
+                1 parses in this process
+            chunk_bytes (int): Approximate bytes parsed per task
+        """
+        self.managers = {
+            'course_details': course_details,
+            'summary_info': summary_info,
+            'lecture_prep': lecture_prep,
+            'qual_manager': qual_manager,
+            'tech_learning': tech_learning,
+        }
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_bytes = chunk_bytes
+
+    def import_file(self, path):
+        """
+        Import a JSON Lines export.
+
+        Records are applied in file order, so a later record for the same
+        ID replaces an earlier one.
+
+        Args:
+            path (str): Export file path
+
+        Returns:
+            dict: Report with
+                - lines: Number of lines read
+                - imported: Records stored, per record type
+                - skipped: Records with no manager to receive them, per type
+                - errors: Dictionaries with 'line', 'type', 'id' and
+                    'error', in line order
+                - warnings: Dictionaries with 'line', 'type', 'id' and
+                    'warning' for imported records with problems, such as
+                    prep timing that cannot be parsed, in line order
+        """
+        ranges = chunk_ranges(path, self.chunk_bytes)
+        report = {
+            'lines': 0,
+            'imported': dict.fromkeys(RECORD_TYPES, 0),
+            'skipped': dict.fromkeys(RECORD_TYPES, 0),
+            'errors': [],
+            'warnings': [],
+        }
+        if self.workers == 1 or len(ranges) <= 1:
+            for start, end in ranges:
+                self._merge(report, parse_chunk(path, start, end))
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                # At most two chunks per worker are in flight, so parsed
+                # chunks of a large file are not all held in memory at once
+                pending = deque()
+                for start, end in ranges:
+                    if len(pending) >= 2 * self.workers:
+                        self._merge(report, pending.popleft().result())
+                    pending.append(pool.submit(parse_chunk, path, start, end))
+                while pending:
+                    self._merge(report, pending.popleft().result())
+        report['errors'].sort(key=lambda error: error['line'])
+        report['warnings'].sort(key=lambda warning: warning['line'])
+        return report
+
+    def _merge(self, report, result):
+        # Single writer: apply one parsed range in line order
+        line_count, records, errors = result
+        base = report['lines']
+        for line, record_type, record_id, message in errors:
+            report['errors'].append(
+                {'line': base + line, 'type': record_type, 'id': record_id, 'error': message})
+        for line, record_type, key, data, timing_minutes in records:
+            manager = self.managers[RECORD_TYPES[record_type][0]]
+            if manager is None:
+                report['skipped'][record_type] += 1
+                continue
+            record_id = '/'.join(key) if isinstance(key, tuple) else key
+            if not _apply(manager, record_type, key, data, timing_minutes):
+                report['errors'].append({
+                    'line': base + line,
+                    'type': record_type,
+                    'id': record_id,
+                    'error': f'rejected by {type(manager).__name__}',
+                })
+                continue
+            report['imported'][record_type] += 1
+            if timing_minutes is not None:
+                for (module, text), minutes in zip(data['timing'].items(), timing_minutes):
+                    if minutes is None:
+                        report['warnings'].append({
+                            'line': base + line,
+                            'type': record_type,
+                            'id': record_id,
+                            'warning': f'unparsable timing for {module!r}: {text!r}',
+                        })
+        report['lines'] += line_count
+
+
+def export_catalog(path, course_details=None, summary_info=None, lecture_prep=None,
+                   qual_manager=None, tech_learning=None):
+    """
+    Write managers to a JSON Lines export readable by CatalogImporter.
+
+    Technologies and learning paths are written first so that dependencies
+    exist when they are imported.
+
+    Args:
+        path (str): Output file path
+        course_details (CourseDetails): Courses to export
+        summary_info (SummaryInfo): Summaries to export
+        lecture_prep (LecturePreparation): Prep materials to export
+        qual_manager (QualificationManager): Qualifications to export
+        tech_learning (TechLearning): Technologies and learning paths to export
+
+    Returns:
+        int: Number of records written
+    """
+    def lines():
+        if tech_learning is not None:
+            for tech_id, info in tech_learning.technologies.items():
+                yield {'type': 'technology', 'id': tech_id, 'data': info}
+            for path_id, info in tech_learning.learning_paths.items():
+                yield {'type': 'learning_path', 'id': path_id, 'data': info}
+        if course_details is not None:
+            for course_id in course_details.courses:
+                yield {'type': 'course', 'id': course_id,
+                       'data': course_details.get_course(course_id)}
+        if summary_info is not None:
+            for course_id in summary_info.summaries:
+                yield {'type': 'summary', 'id': course_id,
+                       'data': summary_info.get_summary(course_id)}
+        if lecture_prep is not None:
+            for course_id, materials in lecture_prep.prep_materials.items():
+                yield {'type': 'prep_material', 'id': course_id, 'data': materials}
+        if qual_manager is not None:
+            for trainer_id, courses in qual_manager.qualifications.items():
+                for course_id, qual in courses.items():
+                    yield {'type': 'qualification', 'trainer_id': trainer_id,
+                           'course_id': course_id, 'data': qual}
+
+    count = 0
+    with open(path, 'w', encoding='utf-8') as handle:
+        for entry in lines():
+            handle.write(json.dumps(entry, separators=(',', ':')) + '\n')
+            count += 1
+    return count
+
+
+def _apply(manager, record_type, key, data, timing_minutes):
+    if record_type == 'course':
+        return manager.add_course(key, data)
+    if record_type == 'summary':
+        return manager.add_summary(key, data)
+    if record_type == 'prep_material':
+        return manager.add_prep_material(key, data, timing_minutes)
+    if record_type == 'qualification':
+        return manager.add_qualification(key[0], key[1], data)
+    if record_type == 'technology':
+        return manager.add_technology(key, data)
+    return manager.add_learning_path(key, data)
+
+
+def _identifier(entry, field):
+    value = entry.get(field)
+    if not isinstance(value, str) or not value.strip():
+        raise ValueError(f'{field} must be a non-empty string')
+    return value.strip()
+
+
+def _parse_date(data, field):
+    value = data[field]
+    try:
+        return datetime.strptime(value.strip(), '%Y-%m-%d').date()
+    except (AttributeError, ValueError):
+        raise ValueError(f'{field} must be a YYYY-MM-DD date, got {value!r}') from None
+
+
+def _describe(entry):
+    # Best-effort record type and ID for an error report
+    if not isinstance(entry, dict):
+        return None, None
+    record_type = entry.get('type')
+    if record_type == 'qualification':
+        parts = [entry.get('trainer_id'), entry.get('course_id')]
+        record_id = '/'.join(str(part) for part in parts if part is not None) or None
+    else:
+        record_id = entry.get('id')
+    if not isinstance(record_type, str):
+        record_type = None
+    return record_type, record_id if isinstance(record_id, str) else None
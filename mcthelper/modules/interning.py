@@ -0,0 +1,151 @@
+"""
+Interning Module
+
+Flyweight storage for strings and string lists repeated across records.
+Each distinct string and tuple is kept once with a reference count, so
+values are dropped from the pool as soon as no record uses them.
+"""
+
+import sys
+
+
+class InternPool:
+    """Reference-counted pool of shared immutable values."""
+
+    def __init__(self):
+        """Initialize an empty InternPool."""
+        self._entries = {}
+
+    def __len__(self):
+        """Return the number of distinct pooled values."""
+        return len(self._entries)
+
+    def __contains__(self, value):
+        """Check whether a value is currently pooled."""
+        try:
+            return value in self._entries
+        except TypeError:
+            return False
+
+    def refcount(self, value):
+        """
+        Get the number of references held on a pooled value.
+
+        Args:
+            value: String or tuple
+
+        Returns:
+            int: Reference count, 0 if not pooled
+        """
+        entry = self._entries.get(value)
+        return entry[1] if entry else 0
+
+    def intern(self, value):
+        """
+        Get the shared instance of a value, adding one reference.
+
+        Strings and tuples are pooled directly; lists become pooled tuples;
+        dictionaries are copied with their values interned. Other values
+        are returned unchanged.
+
+        Args:
+            value: Value to intern
+
+        Returns:
+            The shared instance
+        """
+        if isinstance(value, dict):
+            return {key: self.intern(item) for key, item in value.items()}
+        original = value
+        if isinstance(value, list):
+            value = tuple(value)
+        if not isinstance(value, (str, tuple)):
+            return value
+
+        try:
+            entry = self._entries.get(value)
+        except TypeError:
+            # Sequences holding unhashable items are stored as given
+            return original
+        if entry is not None:
+            entry[1] += 1
+            return entry[0]
+        if isinstance(value, tuple):
+            value = tuple(self.intern(item) for item in value)
+        elif isinstance(value, str):
+            value = sys.intern(value)
+        self._entries[value] = [value, 1]
+        return value
+
+    def release(self, value):
+        """
+        Drop one reference from a value returned by ``intern``.
+
+        Args:
+            value: Previously interned value
+        """
+        if isinstance(value, dict):
+            for item in value.values():
+                self.release(item)
+            return
+        if not isinstance(value, (str, tuple)):
+            return
+        try:
+            entry = self._entries.get(value)
+        except TypeError:
+            return
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] == 0:
+            del self._entries[value]
+            if isinstance(value, tuple):
+                for item in value:
+                    self.release(item)
+
+    def intern_record(self, record):
+        """
+        Copy a record with every field value interned.
+
+        Args:
+            record (dict): Record to store
+
+        Returns:
+            dict: Record sharing pooled values
+        """
+        return self.intern(record)
+
+    def release_record(self, record):
+        """
+        Release every field value of a record produced by ``intern_record``.
+
+        Args:
+            record (dict): Record being replaced or removed
+        """
+        self.release(record)
+
+    def memory_report(self):
+        """
+        Estimate the memory saved by sharing pooled values.
+
+        Tuples are measured without their elements, which are pooled and
+        counted separately.
+
+        Returns:
+            dict: 'distinct_values', 'references', 'pooled_bytes' (one copy of
+                each value), 'unshared_bytes' (a copy per reference) and
+                'saved_bytes'
+        """
+        pooled = unshared = references = 0
+        for value, count in self._entries.values():
+            size = sys.getsizeof(value)
+            pooled += size
+            unshared += size * count
+            references += count
+        return {
+            'distinct_values': len(self._entries),
+            'references': references,
+            'pooled_bytes': pooled,
+            'unshared_bytes': unshared,
+            'saved_bytes': unshared - pooled,
+        }
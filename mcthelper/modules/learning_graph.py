@@ -0,0 +1,220 @@
+"""
+Learning Graph Module
+
+Dependency graph between learning paths and technologies with memoized
+transitive prerequisite sets, study ordering and shortest skill paths.
+"""
+
+import heapq
+from collections import deque
+
+
+class PrerequisiteGraph:
+    """
+    Directed acyclic graph where an edge ``node -> prerequisite`` means the
+    prerequisite must be studied first.
+
+    Transitive prerequisite sets are memoized and extended in place when
+    dependencies are added; only removals fall back to invalidation.
+    """
+
+    def __init__(self):
+        """Initialize an empty PrerequisiteGraph."""
+        self.requires = {}
+        self.dependents = {}
+        self._closures = {}
+        self._order = None
+        self._paths = {}
+
+    def add_node(self, node):
+        """
+        Add a node without dependencies.
+
+        Args:
+            node (str): Learning path or technology ID
+        """
+        self.requires.setdefault(node, set())
+        self.dependents.setdefault(node, set())
+
+    def would_cycle(self, node, prerequisite):
+        """
+        Check whether adding a dependency would create a cycle.
+
+        Args:
+            node (str): Dependent node
+            prerequisite (str): Prerequisite node
+
+        Returns:
+            bool: True if the dependency is not allowed
+        """
+        return node == prerequisite or node in self.prerequisites(prerequisite)
+
+    def add_dependency(self, node, prerequisite):
+        """
+        Record that ``node`` requires ``prerequisite``.
+
+        Args:
+            node (str): Dependent node
+            prerequisite (str): Prerequisite node
+
+        Returns:
+            bool: True if added, False if it would create a cycle
+        """
+        self.add_node(node)
+        self.add_node(prerequisite)
+        if prerequisite in self.requires[node]:
+            return True
+        if self.would_cycle(node, prerequisite):
+            return False
+
+        self.requires[node].add(prerequisite)
+        self.dependents[prerequisite].add(node)
+
+        gained = self.prerequisites(prerequisite) | {prerequisite}
+        for affected in self._with_dependents(node):
+            cached = self._closures.get(affected)
+            if cached is not None and not gained <= cached:
+                self._closures[affected] = cached | gained
+        self._structure_changed()
+        return True
+
+    def set_dependencies(self, node, prerequisites):
+        """
+        Replace the direct prerequisites of a node.
+
+        Args:
+            node (str): Dependent node
+            prerequisites (iterable): New direct prerequisites
+
+        Returns:
+            bool: True if applied, False if any prerequisite would create a
+                cycle (the graph is left unchanged)
+        """
+        self.add_node(node)
+        new = set(prerequisites)
+        if any(self.would_cycle(node, p) for p in new):
+            return False
+
+        removed = self.requires[node] - new
+        if removed:
+            for affected in self._with_dependents(node):
+                self._closures.pop(affected, None)
+            for prerequisite in removed:
+                self.requires[node].discard(prerequisite)
+                self.dependents[prerequisite].discard(node)
+            self._structure_changed()
+        for prerequisite in new - self.requires[node]:
+            self.add_dependency(node, prerequisite)
+        return True
+
+    def prerequisites(self, node):
+        """
+        Get the full transitive prerequisite set of a node.
+
+        Args:
+            node (str): Learning path or technology ID
+
+        Returns:
+            frozenset: Every node that must be studied before ``node``
+        """
+        cached = self._closures.get(node)
+        if cached is not None:
+            return cached
+
+        # Iterative post-order DFS so deep chains don't hit the recursion limit.
+        stack = [(node, False)]
+        while stack:
+            current, expanded = stack.pop()
+            if current in self._closures:
+                continue
+            direct = self.requires.get(current, ())
+            if expanded:
+                closure = set(direct)
+                for prerequisite in direct:
+                    closure |= self._closures[prerequisite]
+                self._closures[current] = frozenset(closure)
+                continue
+            stack.append((current, True))
+            for prerequisite in direct:
+                if prerequisite not in self._closures:
+                    stack.append((prerequisite, False))
+        return self._closures[node]
+
+    def study_order(self, targets):
+        """
+        Get a valid study order covering the targets and their prerequisites.
+
+        Args:
+            targets (iterable): Nodes the learner wants to reach
+
+        Returns:
+            list: Nodes ordered so every prerequisite comes first
+        """
+        needed = set()
+        for target in targets:
+            needed.add(target)
+            needed |= self.prerequisites(target)
+        order = self._topological_index()
+        return sorted(needed, key=lambda n: order.get(n, -1))
+
+    def shortest_path(self, source, target):
+        """
+        Find the shortest prerequisite chain leading from one skill to another.
+
+        Args:
+            source (str): Starting node, already mastered
+            target (str): Node to reach
+
+        Returns:
+            list: Nodes from ``source`` to ``target`` inclusive, or None if
+                ``target`` does not build on ``source``
+        """
+        if source not in self.requires or target not in self.requires:
+            return None
+        parents = self._paths.get(source)
+        if parents is None:
+            parents = {source: None}
+            queue = deque([source])
+            while queue:
+                current = queue.popleft()
+                for dependent in sorted(self.dependents[current]):
+                    if dependent not in parents:
+                        parents[dependent] = current
+                        queue.append(dependent)
+            self._paths[source] = parents
+        if target not in parents:
+            return None
+        path = [target]
+        while parents[path[-1]] is not None:
+            path.append(parents[path[-1]])
+        return path[::-1]
+
+    def _with_dependents(self, node):
+        seen = {node}
+        queue = deque([node])
+        while queue:
+            for dependent in self.dependents.get(queue.popleft(), ()):
+                if dependent not in seen:
+                    seen.add(dependent)
+                    queue.append(dependent)
+        return seen
+
+    def _topological_index(self):
+        if self._order is None:
+            indegree = {node: len(reqs) for node, reqs in self.requires.items()}
+            ready = [node for node, degree in indegree.items() if degree == 0]
+            heapq.heapify(ready)
+            order = {}
+            while ready:
+                node = heapq.heappop(ready)
+                order[node] = len(order)
+                for dependent in self.dependents[node]:
+                    indegree[dependent] -= 1
+                    if indegree[dependent] == 0:
+                        heapq.heappush(ready, dependent)
+            self._order = order
+        return self._order
+
+    def _structure_changed(self):
+        self._order = None
+        self._paths = {}
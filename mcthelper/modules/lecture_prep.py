@@ -4,15 +4,35 @@ Lecture Preparation Module
 Helps MCTs prepare for lectures with structured guidance and resources.
 """
 
+from array import array
 
-class LecturePreparation:
+from .durations import UNPARSED, parse_duration_minutes
+from .observable import Observable
+
+
+class LecturePreparation(Observable):
     """Manages lecture preparation materials and guidelines for MCTs."""
     
-    def __init__(self):
-        """Initialize the LecturePreparation manager."""
+    def __init__(self, intern_pool=None):
+        """
+        Initialize the LecturePreparation manager.
+        
+        Args:
+            intern_pool (InternPool): Optional pool shared with other managers;
+                when given, string values are stored once and lists are
+                stored as tuples
+        """
+        super().__init__()
+        self.intern_pool = intern_pool
         self.prep_materials = {}
+        # Module timings parsed once at insert: per-course module minutes and
+        # one slot per course in a flat array of total minutes
+        self.timing_minutes = {}
+        self._timing_slots = {}
+        self._free_slots = []
+        self._total_minutes = array('i')
     
-    def add_prep_material(self, course_id, materials):
+    def add_prep_material(self, course_id, materials, timing_minutes=None):
         """
         Add preparation materials for a course.
         
@@ -24,6 +44,9 @@ class LecturePreparation:
                 - demos: List of demonstration guides
                 - resources: List of additional resources
                 - timing: Suggested timing for each module
+            timing_minutes (list): Optional module minutes already parsed
+                from the timing values (None for unparsed ones), in timing
+                order; parsed here when not given
         
         Returns:
             bool: True if materials added successfully
@@ -35,7 +58,39 @@ class LecturePreparation:
         if not all(field in materials for field in required_fields):
             return False
         
+        if timing_minutes is None:
+            timing = materials['timing'] if isinstance(materials['timing'], dict) else {}
+            timing_minutes = [parse_duration_minutes(value) for value in timing.values()]
+        self._store_timing(course_id, timing_minutes)
+        
+        if self.intern_pool is not None:
+            previous = self.prep_materials.get(course_id)
+            materials = self.intern_pool.intern_record(materials)
+            if previous is not None:
+                self.intern_pool.release_record(previous)
+        
         self.prep_materials[course_id] = materials
+        self._notify(course_id)
+        return True
+    
+    def remove_prep_material(self, course_id):
+        """
+        Remove the preparation materials for a course.
+        
+        Args:
+            course_id (str): Unique identifier for the course
+        
+        Returns:
+            bool: True if materials existed and were removed
+        """
+        if course_id not in self.prep_materials:
+            return False
+        
+        removed = self.prep_materials.pop(course_id)
+        self._clear_timing(course_id)
+        if self.intern_pool is not None:
+            self.intern_pool.release_record(removed)
+        self._notify(course_id)
         return True
     
     def get_prep_materials(self, course_id):
@@ -87,3 +142,98 @@ class LecturePreparation:
         """
         materials = self.prep_materials.get(course_id)
         return materials.get('timing', {}) if materials else {}
+    
+    def get_timing_minutes(self, course_id):
+        """
+        Get the parsed duration of each module.
+        
+        Args:
+            course_id (str): Unique identifier for the course
+        
+        Returns:
+            dict: Module name to minutes (None where the timing could not
+                be parsed), or empty dict if not found
+        """
+        minutes = self.timing_minutes.get(course_id)
+        if minutes is None:
+            return {}
+        modules = self.prep_materials[course_id]['timing']
+        return {module: (None if value == UNPARSED else value)
+                for module, value in zip(modules, minutes)}
+    
+    def get_total_minutes(self, course_id):
+        """
+        Get the total module time of a course.
+        
+        Args:
+            course_id (str): Unique identifier for the course
+        
+        Returns:
+            int: Sum of parsed module minutes, or None if not found
+        """
+        slot = self._timing_slots.get(course_id)
+        return None if slot is None else self._total_minutes[slot]
+    
+    def get_prep_hours(self, course_id):
+        """
+        Get the total module time of a course in hours.
+        
+        Args:
+            course_id (str): Unique identifier for the course
+        
+        Returns:
+            float: Hours, or None if not found
+        """
+        minutes = self.get_total_minutes(course_id)
+        return None if minutes is None else minutes / 60
+    
+    def get_catalog_prep_hours(self):
+        """
+        Get the total module time across all courses in hours.
+        
+        Returns:
+            float: Hours
+        """
+        # Free slots hold zero, so the whole array can be summed
+        return sum(self._total_minutes) / 60
+    
+    def get_prep_hours_by_level(self, course_details):
+        """
+        Get total module time grouped by course level.
+        
+        Args:
+            course_details (CourseDetails): Source of course levels; courses
+                without details are grouped under 'Unknown'
+        
+        Returns:
+            dict: Level to total hours
+        """
+        totals = self._total_minutes
+        courses = course_details.courses
+        by_level = {}
+        for course_id, slot in self._timing_slots.items():
+            course = courses.get(course_id)
+            level = course['level'] if course else 'Unknown'
+            by_level[level] = by_level.get(level, 0) + totals[slot]
+        return {level: minutes / 60 for level, minutes in by_level.items()}
+    
+    def _store_timing(self, course_id, minutes):
+        self.timing_minutes[course_id] = array(
+            'i', (UNPARSED if value is None else value for value in minutes))
+        total = sum(value for value in minutes if value is not None)
+        slot = self._timing_slots.get(course_id)
+        if slot is None:
+            if self._free_slots:
+                slot = self._free_slots.pop()
+            else:
+                slot = len(self._total_minutes)
+                self._total_minutes.append(0)
+            self._timing_slots[course_id] = slot
+        self._total_minutes[slot] = total
+    
+    def _clear_timing(self, course_id):
+        self.timing_minutes.pop(course_id, None)
+        slot = self._timing_slots.pop(course_id, None)
+        if slot is not None:
+            self._total_minutes[slot] = 0
+            self._free_slots.append(slot)
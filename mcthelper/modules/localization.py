@@ -0,0 +1,296 @@
+"""
+Localization Module
+
+Localized course and summary text served from locale packs. Packs are
+loaded on first use and each locale gets its own search index, so a
+process only pays for the locales it actually serves. A locale's index
+holds the fallback-resolved text of the records translated anywhere in its
+fallback chain; untranslated records are searched in the default index.
+"""
+
+import json
+import os
+
+from .text_index import InvertedIndex
+
+
+DEFAULT_LOCALE = 'en-US'
+
+# Fields that locale packs may translate
+COURSE_FIELDS = ('name', 'description', 'topics')
+SUMMARY_FIELDS = ('overview', 'key_points', 'prerequisites', 'target_audience')
+
+SEARCH_FIELD_WEIGHTS = {
+    'name': 2.0,
+    'description': 1.0,
+    'topics': 1.5,
+    'overview': 1.0,
+    'key_points': 1.0,
+    'prerequisites': 1.5,
+    'target_audience': 1.5,
+}
+
+
+def fallback_chain(locale, default=DEFAULT_LOCALE):
+    """
+    Get the locales to try, most specific first.
+
+    Args:
+        locale (str): Requested locale such as 'ko-KR'
+        default (str): Locale of the base catalog
+
+    Returns:
+        list: For example ['ko-KR', 'ko', 'en-US']
+    """
+    chain = []
+    parts = (locale or default).replace('_', '-').split('-')
+    for end in range(len(parts), 0, -1):
+        candidate = '-'.join(parts[:end])
+        if candidate not in chain:
+            chain.append(candidate)
+    if default not in chain:
+        chain.append(default)
+    return chain
+
+
+class DirectoryPackLoader:
+    """Loads locale packs from '<directory>/<locale>.json' files."""
+
+    def __init__(self, directory):
+        """
+        Initialize the DirectoryPackLoader.
+
+        Args:
+            directory (str): Directory holding one JSON file per locale
+        """
+        self.directory = directory
+
+    def __call__(self, locale):
+        """
+        Load one locale pack.
+
+        The file holds {"courses": {id: {field: text}}, "summaries": {...}}.
+
+        Args:
+            locale (str): Locale to load
+
+        Returns:
+            dict: Pack contents or None if there is no pack for the locale
+        """
+        path = os.path.join(self.directory, f'{locale}.json')
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding='utf-8') as handle:
+            return json.load(handle)
+
+
+class LocalizedCatalog:
+    """
+    Localized view of CourseDetails and SummaryInfo.
+
+    The base managers hold the default-locale text. Each translated field is
+    looked up along the locale's fallback chain, so partially translated
+    packs fall back to the parent language and then to the default locale.
+    """
+
+    def __init__(self, course_details, summary_info, loader=None, default_locale=DEFAULT_LOCALE):
+        """
+        Initialize the LocalizedCatalog.
+
+        Args:
+            course_details (CourseDetails): Default-locale courses
+            summary_info (SummaryInfo): Default-locale summaries
+            loader (callable | str): Function returning the pack for a
+                locale (or None), or a directory for DirectoryPackLoader
+            default_locale (str): Locale of the base managers
+        """
+        if isinstance(loader, str):
+            loader = DirectoryPackLoader(loader)
+        self.course_details = course_details
+        self.summary_info = summary_info
+        self.loader = loader
+        self.default_locale = default_locale
+        self._packs = {}
+        self._indexes = {}
+        course_details.subscribe(self._on_base_change)
+        summary_info.subscribe(self._on_base_change)
+
+    def loaded_locales(self):
+        """
+        List the locales whose packs have been loaded.
+
+        Returns:
+            list: Sorted locale names, including those without a pack
+        """
+        return sorted(self._packs)
+
+    def set_translation(self, locale, kind, record_id, fields):
+        """
+        Add or replace translated fields for one record.
+
+        Args:
+            locale (str): Locale of the translation
+            kind (str): 'courses' or 'summaries'
+            record_id (str): Course ID
+            fields (dict): Field name to translated text
+
+        Returns:
+            bool: True if stored, False for an unknown kind or field or for
+                the default locale, whose text lives in the base managers
+        """
+        allowed = {'courses': COURSE_FIELDS, 'summaries': SUMMARY_FIELDS}.get(kind)
+        if not allowed or not record_id or not isinstance(fields, dict):
+            return False
+        if locale == self.default_locale:
+            return False
+        if not all(field in allowed for field in fields):
+            return False
+        pack = self._pack(locale)
+        pack.setdefault(kind, {}).setdefault(record_id, {}).update(fields)
+        for indexed_locale, index in self._indexes.items():
+            if indexed_locale != self.default_locale and locale in self._chain(indexed_locale):
+                self._index_record(index, record_id, indexed_locale)
+        return True
+
+    def get_course(self, course_id, locale=None):
+        """
+        Retrieve a course with fields translated for a locale.
+
+        Args:
+            course_id (str): Unique identifier for the course
+            locale (str): Requested locale, defaults to the default locale
+
+        Returns:
+            dict: Course information or None if not found
+        """
+        course = self.course_details.get_course(course_id)
+        if course is None:
+            return None
+        return self._localize(dict(course), 'courses', course_id, COURSE_FIELDS, locale)
+
+    def get_summary(self, course_id, locale=None):
+        """
+        Retrieve a summary with fields translated for a locale.
+
+        Args:
+            course_id (str): Unique identifier for the course
+            locale (str): Requested locale, defaults to the default locale
+
+        Returns:
+            dict: Summary information or None if not found
+        """
+        summary = self.summary_info.get_summary(course_id)
+        if summary is None:
+            return None
+        return self._localize(dict(summary), 'summaries', course_id, SUMMARY_FIELDS, locale)
+
+    def search(self, query, locale=None, fields=None, limit=None):
+        """
+        Search course and summary text in a locale.
+
+        Records are matched on the same text get_course() and get_summary()
+        return for the locale: translated fields where the fallback chain
+        has them and default-locale text for the rest.
+
+        Args:
+            query (str): Words and quoted phrases that must all match
+            locale (str): Locale to search, defaults to the default locale
+            fields (list): Fields to search, defaults to all indexed fields
+            limit (int): Maximum number of results, None for all
+
+        Returns:
+            list: Dictionaries with 'id', 'score' and 'locale' (the most
+                specific locale translating the record, or the default
+                locale for untranslated records), best match first
+        """
+        locale = locale or self.default_locale
+        matches = []
+        translated = None
+        if locale != self.default_locale:
+            translated = self._index(locale)
+            chain = self._chain(locale)
+            for doc_id, score in translated.search(query, fields):
+                matches.append((score, doc_id, self._translating_locale(doc_id, chain)))
+        for doc_id, score in self._index(self.default_locale).search(query, fields):
+            if translated is None or doc_id not in translated.doc_terms:
+                matches.append((score, doc_id, self.default_locale))
+        matches.sort(key=lambda match: (-match[0], match[1]))
+        results = [{'id': doc_id, 'score': score, 'locale': source}
+                   for score, doc_id, source in matches]
+        return results if limit is None else results[:limit]
+
+    def _chain(self, locale):
+        return fallback_chain(locale or self.default_locale, self.default_locale)
+
+    def _translating_locale(self, record_id, chain):
+        for candidate in chain:
+            if candidate == self.default_locale:
+                break
+            pack = self._pack(candidate)
+            if record_id in pack.get('courses', {}) or record_id in pack.get('summaries', {}):
+                return candidate
+        return None
+
+    def _localize(self, record, kind, record_id, fields, locale):
+        chain = self._chain(locale)
+        missing = set(fields)
+        for candidate in chain:
+            if candidate == self.default_locale or not missing:
+                break
+            translated = self._pack(candidate).get(kind, {}).get(record_id)
+            if not translated:
+                continue
+            for field in list(missing):
+                if field in translated:
+                    record[field] = translated[field]
+                    missing.discard(field)
+        return record
+
+    def _pack(self, locale):
+        pack = self._packs.get(locale)
+        if pack is None:
+            if locale == self.default_locale or self.loader is None:
+                pack = {}
+            else:
+                pack = self.loader(locale) or {}
+            self._packs[locale] = pack
+        return pack
+
+    def _index(self, locale):
+        index = self._indexes.get(locale)
+        if index is None:
+            index = self._indexes[locale] = InvertedIndex(SEARCH_FIELD_WEIGHTS)
+            if locale == self.default_locale:
+                record_ids = set(self.course_details.courses) | set(self.summary_info.summaries)
+            else:
+                record_ids = set()
+                for candidate in self._chain(locale):
+                    if candidate != self.default_locale:
+                        pack = self._pack(candidate)
+                        record_ids.update(pack.get('courses', {}))
+                        record_ids.update(pack.get('summaries', {}))
+            for record_id in record_ids:
+                self._index_record(index, record_id, locale)
+        return index
+
+    def _index_record(self, index, record_id, locale):
+        # Index the text get_course()/get_summary() return for the locale
+        course = self.get_course(record_id, locale) or {}
+        summary = self.get_summary(record_id, locale) or {}
+        if not course and not summary:
+            index.remove_document(record_id)
+            return
+        fields = {}
+        for field in COURSE_FIELDS:
+            if field in course:
+                fields[field] = course[field]
+        for field in SUMMARY_FIELDS:
+            if field in summary:
+                fields[field] = summary[field]
+        index.add_document(record_id, fields)
+
+    def _on_base_change(self, course_id):
+        for locale, index in self._indexes.items():
+            if (locale == self.default_locale
+                    or self._translating_locale(course_id, self._chain(locale)) is not None):
+                self._index_record(index, course_id, locale)
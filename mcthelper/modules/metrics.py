@@ -0,0 +1,256 @@
+"""
+Metrics Module
+
+Opt-in instrumentation for MCTHelper managers and CLI commands. Records call
+counts, miss/error counts and latency histograms, exportable as Prometheus
+text format or as a JSON snapshot.
+"""
+
+import functools
+import inspect
+import json
+import time
+from bisect import bisect_left
+
+
+# Upper bounds (seconds) of the latency histogram buckets. A final +Inf
+# bucket is implied.
+DEFAULT_BUCKETS = (
+    0.000005, 0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5,
+)
+
+
+class MethodStats:
+    """Counters and latency histogram for a single instrumented method."""
+
+    def __init__(self, buckets):
+        """Initialize empty statistics for the given bucket bounds."""
+        self.buckets = buckets
+        self.clear()
+
+    def clear(self):
+        """Reset all counters to zero."""
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.calls = 0
+        self.misses = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+
+    def observe(self, seconds):
+        """Record one call latency in seconds."""
+        self.calls += 1
+        self.total_seconds += seconds
+        self.bucket_counts[bisect_left(self.buckets, seconds)] += 1
+
+    def to_dict(self):
+        """
+        Convert the statistics to a JSON-serializable dictionary.
+
+        Returns:
+            dict: Counters, latency sum and cumulative bucket counts
+        """
+        cumulative = []
+        running = 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.bucket_counts):
+            running += count
+            cumulative.append({'le': _format_bound(bound), 'count': running})
+        return {
+            'calls': self.calls,
+            'misses': self.misses,
+            'errors': self.errors,
+            'latency_seconds_sum': self.total_seconds,
+            'latency_buckets': cumulative,
+        }
+
+
+class MetricsRegistry:
+    """
+    Collects metrics for instrumented objects.
+
+    Instrumentation is installed as instance attributes that shadow the
+    class methods, so disabling the registry removes the wrappers entirely
+    and instrumented objects run at their original speed.
+    """
+
+    def __init__(self, enabled=True, buckets=DEFAULT_BUCKETS, timer=time.perf_counter):
+        """
+        Initialize the MetricsRegistry.
+
+        Args:
+            enabled (bool): Whether wrappers are installed on instrumented objects
+            buckets (tuple): Sorted latency bucket upper bounds in seconds
+            timer (callable): Monotonic clock returning seconds
+        """
+        self.buckets = tuple(buckets)
+        self.timer = timer
+        self.stats = {}
+        self._targets = []
+        self._enabled = enabled
+
+    @property
+    def enabled(self):
+        """bool: Whether metrics are currently being recorded."""
+        return self._enabled
+
+    def enable(self):
+        """Install wrappers on every instrumented object."""
+        if not self._enabled:
+            self._enabled = True
+            for target in self._targets:
+                self._install(*target)
+
+    def disable(self):
+        """Remove wrappers from every instrumented object."""
+        if self._enabled:
+            self._enabled = False
+            for obj, _, methods, _ in self._targets:
+                for name in methods:
+                    obj.__dict__.pop(name, None)
+
+    def instrument(self, obj, prefix=None, methods=None, outcomes=True):
+        """
+        Register an object's public methods for instrumentation.
+
+        Args:
+            obj: Manager or CLI instance to instrument
+            prefix (str): Metric label prefix, defaults to the class name
+            methods (list): Method names to instrument, defaults to all
+                public methods of the object's class
+            outcomes (bool): Count None results as misses and False results
+                as errors; turn off for methods such as CLI commands that
+                return nothing, so only calls and exceptions are counted
+
+        Returns:
+            object: The same object, for chaining
+        """
+        prefix = prefix or type(obj).__name__
+        if methods is None:
+            methods = public_methods(obj)
+        methods = list(methods)
+        for name in methods:
+            self.stats.setdefault(f'{prefix}.{name}', MethodStats(self.buckets))
+        target = (obj, prefix, methods, outcomes)
+        self._targets.append(target)
+        if self._enabled:
+            self._install(*target)
+        return obj
+
+    def _install(self, obj, prefix, methods, outcomes):
+        for name in methods:
+            bound = getattr(type(obj), name).__get__(obj)
+            obj.__dict__[name] = self._wrap(bound, self.stats[f'{prefix}.{name}'], outcomes)
+
+    def _wrap(self, func, stats, outcomes=True):
+        timer = self.timer
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = timer()
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                stats.errors += 1
+                stats.observe(timer() - start)
+                raise
+            stats.observe(timer() - start)
+            if outcomes:
+                if result is None:
+                    stats.misses += 1
+                elif result is False:
+                    stats.errors += 1
+            return result
+
+        return wrapper
+
+    def reset(self):
+        """Clear all recorded values while keeping instrumentation in place."""
+        for stats in self.stats.values():
+            stats.clear()
+
+    def snapshot(self):
+        """
+        Get a snapshot of all recorded metrics.
+
+        Returns:
+            dict: Mapping of 'Class.method' to its statistics
+        """
+        return {name: stats.to_dict() for name, stats in sorted(self.stats.items())}
+
+    def to_json(self, indent=2):
+        """
+        Export the metrics snapshot as JSON.
+
+        Returns:
+            str: JSON document
+        """
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def to_prometheus(self, namespace='mcthelper'):
+        """
+        Export the metrics in the Prometheus text exposition format.
+
+        Args:
+            namespace (str): Metric name prefix
+
+        Returns:
+            str: Prometheus text format
+        """
+        items = sorted(self.stats.items())
+        lines = []
+        for metric, attr, help_text in (
+            ('calls_total', 'calls', 'Total number of calls.'),
+            ('misses_total', 'misses', 'Calls that returned no result.'),
+            ('errors_total', 'errors', 'Calls that raised or were rejected.'),
+        ):
+            lines.append(f'# HELP {namespace}_{metric} {help_text}')
+            lines.append(f'# TYPE {namespace}_{metric} counter')
+            for name, stats in items:
+                lines.append(f'{namespace}_{metric}{{method="{name}"}} {getattr(stats, attr)}')
+
+        hist = f'{namespace}_call_duration_seconds'
+        lines.append(f'# HELP {hist} Call latency in seconds.')
+        lines.append(f'# TYPE {hist} histogram')
+        for name, stats in items:
+            for bucket in stats.to_dict()['latency_buckets']:
+                lines.append(f'{hist}_bucket{{method="{name}",le="{bucket["le"]}"}} {bucket["count"]}')
+            lines.append(f'{hist}_sum{{method="{name}"}} {stats.total_seconds!r}')
+            lines.append(f'{hist}_count{{method="{name}"}} {stats.calls}')
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path):
+        """
+        Write metrics to a file, as Prometheus text for '.prom'/'.txt' paths
+        and as JSON otherwise.
+
+        Args:
+            path (str): Output file path
+        """
+        if str(path).endswith(('.prom', '.txt')):
+            content = self.to_prometheus()
+        else:
+            content = self.to_json()
+        with open(path, 'w', encoding='utf-8') as handle:
+            handle.write(content)
+
+
+def public_methods(obj):
+    """
+    List the public method names of an object's class.
+
+    Args:
+        obj: Any instance
+
+    Returns:
+        list: Sorted method names not starting with an underscore
+    """
+    return sorted(
+        name for name, member in inspect.getmembers(type(obj), inspect.isfunction)
+        if not name.startswith('_')
+    )
+
+
+def _format_bound(bound):
+    if bound == float('inf'):
+        return '+Inf'
+    return repr(bound)
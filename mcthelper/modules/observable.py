@@ -0,0 +1,37 @@
+"""
+Observable Module
+
+Change notification shared by the MCTHelper managers, so caches and
+indexes built on top of a manager can update when its records change.
+"""
+
+
+class Observable:
+    """Mixin that lets callers subscribe to record changes."""
+
+    def __init__(self):
+        """Initialize an empty subscriber list."""
+        self._subscribers = []
+
+    def subscribe(self, callback):
+        """
+        Register a callback invoked with the key of every changed record.
+
+        Args:
+            callback (callable): Function taking the changed record key
+        """
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        """
+        Remove a previously registered callback.
+
+        Args:
+            callback (callable): Callback passed to subscribe
+        """
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def _notify(self, key):
+        for callback in list(self._subscribers):
+            callback(key)
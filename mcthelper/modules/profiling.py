@@ -0,0 +1,273 @@
+"""
+Profiling Module
+
+Opt-in profiling for CLI commands. Runs either cProfile or a low-overhead
+sampling profiler, and keeps a wall-clock breakdown of the time spent in
+data loading, indexing, querying and rendering.
+"""
+
+import cProfile
+import functools
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+from .metrics import public_methods
+
+
+PHASES = ('loading', 'indexing', 'querying', 'rendering')
+
+# Manager methods that change data rather than read it
+WRITE_PREFIXES = ('add_', 'remove_', 'subscribe', 'unsubscribe')
+
+
+def read_methods(manager):
+    """
+    List the public read methods of a manager.
+
+    Args:
+        manager: Manager instance
+
+    Returns:
+        list: Sorted method names, excluding add/remove/subscribe methods
+    """
+    return [name for name in public_methods(manager) if not name.startswith(WRITE_PREFIXES)]
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler sampling one thread's stack at a fixed interval.
+
+    Samples are aggregated as collapsed stacks ('root;caller;callee count'),
+    the input format of flame graph tools.
+    """
+
+    def __init__(self, interval=0.005, thread_id=None, label=None):
+        """
+        Initialize the SamplingProfiler.
+
+        Args:
+            interval (float): Seconds between samples
+            thread_id (int): Thread to sample, defaults to the calling thread
+            label (callable): Optional function returning a frame name to
+                put at the root of each sample, such as the current phase
+        """
+        self.interval = interval
+        self.thread_id = thread_id or threading.get_ident()
+        self.label = label
+        self.samples = Counter()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start sampling in a background thread."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='mcthelper-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling and wait for the sampler thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def collapsed(self):
+        """
+        Format the samples as collapsed stacks.
+
+        Returns:
+            list: Lines 'frame;frame;frame count', most frequent first
+        """
+        return [f"{';'.join(stack)} {count}" for stack, count in self.samples.most_common()]
+
+    def write(self, path):
+        """
+        Write collapsed stacks to a file.
+
+        Args:
+            path (str): Output file path
+        """
+        with open(path, 'w', encoding='utf-8') as handle:
+            for line in self.collapsed():
+                handle.write(line + '\n')
+
+    def sample(self):
+        """Record the target thread's current stack once."""
+        frame = sys._current_frames().get(self.thread_id)
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f'{os.path.basename(code.co_filename)}:{code.co_name}')
+            frame = frame.f_back
+        if not stack:
+            return
+        if self.label is not None:
+            stack.append(self.label())
+        self.samples[tuple(reversed(stack))] += 1
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+
+class Profiler:
+    """
+    Profiles a command and breaks its wall time down by phase.
+
+    Phases nest; time spent in an inner phase is only counted for the inner
+    phase, so the breakdown adds up to the total.
+    """
+
+    def __init__(self, mode='cprofile', interval=0.005, timer=time.perf_counter):
+        """
+        Initialize the Profiler.
+
+        Args:
+            mode (str): 'cprofile' for deterministic profiling, 'sample' for
+                the sampling profiler
+            interval (float): Seconds between samples in 'sample' mode
+            timer (callable): Clock returning seconds
+        """
+        if mode not in ('cprofile', 'sample'):
+            raise ValueError(f'Unknown profiling mode: {mode}')
+        self.mode = mode
+        self.interval = interval
+        self.timer = timer
+        self.phase_seconds = dict.fromkeys(PHASES, 0.0)
+        self.total_seconds = 0.0
+        self._stack = []
+        self._started = None
+        self._profile = None
+        self._sampler = None
+
+    def start(self):
+        """Start profiling."""
+        if self.mode == 'cprofile':
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        else:
+            self._sampler = SamplingProfiler(self.interval, label=self.current_phase)
+            self._sampler.start()
+        self._started = self.timer()
+
+    def stop(self):
+        """Stop profiling and record the total wall time."""
+        if self._started is None:
+            return
+        self.total_seconds += self.timer() - self._started
+        self._started = None
+        if self._profile is not None:
+            self._profile.disable()
+        if self._sampler is not None:
+            self._sampler.stop()
+
+    def current_phase(self):
+        """
+        Get the innermost active phase.
+
+        Returns:
+            str: Phase name, or 'other' outside all phases
+        """
+        return self._stack[-1][0] if self._stack else 'other'
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Attribute the wall time of a block to a phase.
+
+        Args:
+            name (str): Phase name, usually one of PHASES
+        """
+        now = self.timer()
+        if self._stack:
+            outer = self._stack[-1]
+            self._add(outer[0], now - outer[1])
+        self._stack.append([name, now])
+        try:
+            yield
+        finally:
+            name, started = self._stack.pop()
+            now = self.timer()
+            self._add(name, now - started)
+            if self._stack:
+                self._stack[-1][1] = now
+
+    def instrument(self, obj, phase, methods=None):
+        """
+        Attribute the time spent in an object's methods to a phase.
+
+        Wrappers are installed on the instance on top of any existing ones,
+        such as those of MetricsRegistry.
+
+        Args:
+            obj: Object to instrument
+            phase (str): Phase name
+            methods (list): Method names, defaults to all public methods
+
+        Returns:
+            object: The same object, for chaining
+        """
+        for name in public_methods(obj) if methods is None else methods:
+            obj.__dict__[name] = self._wrap(getattr(obj, name), phase)
+        return obj
+
+    def breakdown(self):
+        """
+        Get the wall time per phase.
+
+        Returns:
+            dict: Phase name to seconds, with 'other' for time outside any
+                phase and 'total'
+        """
+        result = dict(self.phase_seconds)
+        result['other'] = max(0.0, self.total_seconds - sum(self.phase_seconds.values()))
+        result['total'] = self.total_seconds
+        return result
+
+    def format_breakdown(self):
+        """
+        Format the phase breakdown for display.
+
+        Returns:
+            str: One line per phase with milliseconds and share of the total
+        """
+        breakdown = self.breakdown()
+        total = breakdown.pop('total')
+        lines = ['=== Profile ===']
+        for name, seconds in breakdown.items():
+            share = seconds / total * 100 if total else 0.0
+            lines.append(f'{name:<10} {seconds * 1000:10.2f} ms {share:5.1f}%')
+        lines.append(f"{'total':<10} {total * 1000:10.2f} ms")
+        return '\n'.join(lines)
+
+    def write(self, path):
+        """
+        Write the profile.
+
+        cProfile output is a pstats file (load it with pstats.Stats or
+        snakeviz); sampling output is collapsed stacks for flame graphs.
+
+        Args:
+            path (str): Output file path
+        """
+        if self._profile is not None:
+            self._profile.dump_stats(path)
+        elif self._sampler is not None:
+            self._sampler.write(path)
+
+    def _add(self, name, seconds):
+        self.phase_seconds[name] = self.phase_seconds.get(name, 0.0) + seconds
+
+    def _wrap(self, func, phase_name):
+        phase = self.phase
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with phase(phase_name):
+                return func(*args, **kwargs)
+
+        return wrapper
@@ -2,17 +2,42 @@
 Qualifications Module
 
 Helps MCTs maintain and renew their course qualifications.
+
+Each trainer gets a stable bit index, and every course keeps the active
+qualifications of its trainers as a Python int bitset, so "qualified for
+all of these courses" and "missing one of them" are answered with bitwise
+AND/OR instead of nested dictionary lookups.
 """
 
 from datetime import datetime, timedelta
 
+from .clock import SystemClock
+from .observable import Observable
+
+
+# Per-qualification limit on cached as-of dates
+EXPIRY_CACHE_DATES = 8
+
 
-class QualificationManager:
+class QualificationManager(Observable):
     """Manages MCT qualifications and renewal tracking."""
     
-    def __init__(self):
-        """Initialize the QualificationManager."""
+    def __init__(self, clock=None):
+        """
+        Initialize the QualificationManager.
+        
+        Args:
+            clock (SystemClock | ManualClock): Clock used when no as-of date
+                is given, defaults to the system clock
+        """
+        super().__init__()
         self.qualifications = {}
+        self.clock = clock or SystemClock()
+        self._expiry_cache = {}
+        self._trainer_bits = {}
+        self._trainer_order = []
+        self._active_expiry = {}
+        self._coverage_cache = {}
     
     def add_qualification(self, trainer_id, course_id, qualification_data):
         """
@@ -40,6 +65,32 @@ class QualificationManager:
             self.qualifications[trainer_id] = {}
         
         self.qualifications[trainer_id][course_id] = qualification_data
+        self._expiry_cache.pop((trainer_id, course_id), None)
+        self._index_qualification(trainer_id, course_id, qualification_data)
+        self._notify((trainer_id, course_id))
+        return True
+    
+    def remove_qualification(self, trainer_id, course_id):
+        """
+        Remove a trainer's qualification for a course.
+        
+        Args:
+            trainer_id (str): Unique identifier for the trainer
+            course_id (str): Unique identifier for the course
+        
+        Returns:
+            bool: True if the qualification existed and was removed
+        """
+        courses = self.qualifications.get(trainer_id)
+        if not courses or course_id not in courses:
+            return False
+        
+        del courses[course_id]
+        if not courses:
+            del self.qualifications[trainer_id]
+        self._expiry_cache.pop((trainer_id, course_id), None)
+        self._index_qualification(trainer_id, course_id, None)
+        self._notify((trainer_id, course_id))
         return True
     
     def get_qualifications(self, trainer_id):
@@ -54,13 +105,18 @@ class QualificationManager:
         """
         return self.qualifications.get(trainer_id, {})
     
-    def check_expiry(self, trainer_id, course_id):
+    def check_expiry(self, trainer_id, course_id, as_of=None):
         """
         Check if a qualification is expiring soon (within 90 days).
         
+        Results are cached per qualification and as-of day until the
+        qualification is re-added.
+        
         Args:
             trainer_id (str): Unique identifier for the trainer
             course_id (str): Unique identifier for the course
+            as_of (date | datetime | str): Date to evaluate on (YYYY-MM-DD
+                for strings), defaults to today according to the clock
         
         Returns:
             dict: Expiry information with status and days remaining
@@ -71,20 +127,152 @@ class QualificationManager:
         if course_id not in self.qualifications[trainer_id]:
             return {'status': 'not_found', 'days_remaining': None}
         
-        qual = self.qualifications[trainer_id][course_id]
+        day = self._as_of_date(as_of)
+        cached = self._expiry_cache.setdefault((trainer_id, course_id), {})
+        result = cached.get(day)
+        if result is None:
+            if len(cached) >= EXPIRY_CACHE_DATES:
+                del cached[next(iter(cached))]
+            result = cached[day] = self._evaluate_expiry(
+                self.qualifications[trainer_id][course_id], day)
+        return dict(result)
+    
+    def get_qualified_trainers(self, course_id, as_of=None):
+        """
+        Get trainers holding an active, non-expired qualification for a course.
+        
+        Args:
+            course_id (str): Unique identifier for the course
+            as_of (date | datetime | str): Date to evaluate on, defaults to today
+        
+        Returns:
+            list: Sorted trainer IDs
+        """
+        return self._trainers(self._coverage(course_id, self._as_of_date(as_of)))
+    
+    def get_trainers_qualified_for_all(self, course_ids, as_of=None):
+        """
+        Get trainers qualified, as in get_qualified_trainers(), for every course.
+        
+        Args:
+            course_ids (list): Course IDs, e.g. the courses of a bootcamp
+            as_of (date | datetime | str): Date to evaluate on, defaults to today
+        
+        Returns:
+            list: Sorted trainer IDs, empty if no courses are given
+        """
+        course_ids = list(course_ids)
+        if not course_ids:
+            return []
+        day = self._as_of_date(as_of)
+        mask = -1
+        for course_id in course_ids:
+            mask &= self._coverage(course_id, day)
+            if not mask:
+                break
+        return self._trainers(mask)
+    
+    def get_trainers_missing_one(self, course_ids, as_of=None):
+        """
+        Get trainers qualified for all but exactly one of the courses.
+        
+        Args:
+            course_ids (list): Course IDs
+            as_of (date | datetime | str): Date to evaluate on, defaults to today
+        
+        Returns:
+            dict: Trainer ID to the course ID they still need
+        """
+        course_ids = list(dict.fromkeys(course_ids))
+        day = self._as_of_date(as_of)
+        masks = [self._coverage(course_id, day) for course_id in course_ids]
+        # Trainers missing none so far, and missing exactly one so far
+        none_missing = (1 << len(self._trainer_order)) - 1
+        one_missing = 0
+        for mask in masks:
+            one_missing = (one_missing & mask) | (none_missing & ~mask)
+            none_missing &= mask
+        missing = {}
+        for course_id, mask in zip(course_ids, masks):
+            for trainer_id in self._trainers(one_missing & ~mask):
+                if trainer_id in self.qualifications:
+                    missing[trainer_id] = course_id
+        return dict(sorted(missing.items()))
+    
+    def get_course_coverage(self, course_ids, as_of=None):
+        """
+        Count qualified trainers per course.
+        
+        Args:
+            course_ids (list): Course IDs
+            as_of (date | datetime | str): Date to evaluate on, defaults to today
+        
+        Returns:
+            dict: Course ID to number of qualified trainers
+        """
+        day = self._as_of_date(as_of)
+        return {course_id: bin(self._coverage(course_id, day)).count('1')
+                for course_id in course_ids}
+    
+    def _index_qualification(self, trainer_id, course_id, qual):
+        bit = self._trainer_bits.get(trainer_id)
+        if bit is None:
+            bit = self._trainer_bits[trainer_id] = len(self._trainer_order)
+            self._trainer_order.append(trainer_id)
+        self._coverage_cache.pop(course_id, None)
+        active = self._active_expiry.setdefault(course_id, {})
+        active.pop(bit, None)
+        if qual is not None and qual.get('status') == 'active':
+            try:
+                active[bit] = datetime.strptime(qual['expiry_date'], '%Y-%m-%d').date()
+            except (ValueError, KeyError, TypeError):
+                pass
+        if not active:
+            del self._active_expiry[course_id]
+    
+    def _coverage(self, course_id, day):
+        # Bitset of trainers with an active qualification not expired on day
+        cached = self._coverage_cache.get(course_id)
+        if cached is not None and cached[0] == day:
+            return cached[1]
+        mask = 0
+        for bit, expiry_date in self._active_expiry.get(course_id, {}).items():
+            if expiry_date >= day:
+                mask |= 1 << bit
+        self._coverage_cache[course_id] = (day, mask)
+        return mask
+    
+    def _trainers(self, mask):
+        trainers = []
+        while mask:
+            low = mask & -mask
+            trainers.append(self._trainer_order[low.bit_length() - 1])
+            mask ^= low
+        return sorted(trainers)
+    
+    def _as_of_date(self, as_of):
+        if as_of is None:
+            return self.clock.today()
+        if isinstance(as_of, str):
+            return datetime.strptime(as_of, '%Y-%m-%d').date()
+        if isinstance(as_of, datetime):
+            return as_of.date()
+        return as_of
+    
+    @staticmethod
+    def _evaluate_expiry(qual, day):
         try:
-            expiry_date = datetime.strptime(qual['expiry_date'], '%Y-%m-%d')
-            today = datetime.now()
-            days_remaining = (expiry_date - today).days
-            
-            if days_remaining < 0:
-                return {'status': 'expired', 'days_remaining': days_remaining}
-            elif days_remaining <= 90:
-                return {'status': 'expiring_soon', 'days_remaining': days_remaining}
-            else:
-                return {'status': 'valid', 'days_remaining': days_remaining}
-        except (ValueError, KeyError):
+            expiry_date = datetime.strptime(qual['expiry_date'], '%Y-%m-%d').date()
+        except (ValueError, KeyError, TypeError):
             return {'status': 'error', 'days_remaining': None}
+        days_remaining = (expiry_date - day).days
+        
+        if days_remaining < 0:
+            return {'status': 'expired', 'days_remaining': days_remaining}
+        elif days_remaining <= 90:
+            return {'status': 'expiring_soon', 'days_remaining': days_remaining}
+        else:
+            return {'status': 'valid', 'days_remaining': days_remaining}
     
     def get_renewal_requirements(self, course_id):
         """
@@ -0,0 +1,604 @@
+"""
+Query Module
+
+A small query language over courses that combines conditions on course
+fields, summaries, preparation time and qualified trainers. Queries are
+compiled into a plan that reads candidates from indexes where they exist,
+checks the remaining conditions cheapest and most selective first, and can
+describe itself with explain().
+
+Example:
+    level = Intermediate and topic = Security and summary ~ compliance
+    and trainers >= 3
+"""
+
+import math
+import re
+
+from .text_index import parse_query as parse_search_query
+
+
+# Operators accepted per field; '~' means "contains" (full-text for summaries)
+NUMERIC_OPS = ('=', '!=', '<', '<=', '>', '>=')
+FIELD_OPS = {
+    'id': ('=', '!='),
+    'name': ('=', '!=', '~'),
+    'description': ('=', '!=', '~'),
+    'level': ('=', '!='),
+    'topic': ('=', '!=', '~'),
+    'duration': NUMERIC_OPS,
+    'summary': ('~',),
+    'prep_hours': NUMERIC_OPS,
+    'trainers': NUMERIC_OPS,
+}
+
+FIELD_ALIASES = {'topics': 'topic', 'active_trainers': 'trainers'}
+
+# Manager attribute each field needs besides course_details
+FIELD_SOURCES = {'summary': 'summary_info', 'prep_hours': 'lecture_prep',
+                 'trainers': 'qual_manager'}
+
+# Relative cost of checking one course against a condition
+PROBE_COSTS = {
+    'id': 1, 'level': 1, 'duration': 1, 'name': 2, 'topic': 2,
+    'prep_hours': 2, 'description': 5, 'trainers': 10, 'summary': 20,
+}
+
+# Assumed fraction of courses matching a condition that has no index
+DEFAULT_SELECTIVITY = {'=': 0.1, '!=': 0.9, '~': 0.25, '<': 0.5, '<=': 0.5, '>': 0.5, '>=': 0.5}
+
+TOKEN_PATTERN = re.compile(
+    r'\s*(?:"(?P<dq>[^"]*)"|\'(?P<sq>[^\']*)\'|(?P<op>>=|<=|!=|=|<|>|~)|(?P<word>[^\s=<>!~"\']+))')
+
+_COMPARE = {
+    '=': lambda a, b: a == b,
+    '!=': lambda a, b: a != b,
+    '<': lambda a, b: a < b,
+    '<=': lambda a, b: a <= b,
+    '>': lambda a, b: a > b,
+    '>=': lambda a, b: a >= b,
+}
+
+
+class QueryError(ValueError):
+    """Raised for queries that cannot be parsed or planned."""
+
+
+class Condition:
+    """One 'field op value' comparison."""
+
+    def __init__(self, field, op, value):
+        """
+        Initialize the Condition.
+
+        Args:
+            field (str): Field name from FIELD_OPS (aliases allowed)
+            op (str): Comparison operator
+            value (str | int | float): Value to compare with; numeric fields
+                convert it to a number
+        """
+        field = FIELD_ALIASES.get(field.lower(), field.lower())
+        if field not in FIELD_OPS:
+            raise QueryError(f'Unknown field: {field}')
+        if op not in FIELD_OPS[field]:
+            raise QueryError(f"Operator '{op}' is not supported for {field}")
+        if FIELD_OPS[field] is NUMERIC_OPS:
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                raise QueryError(f'{field} needs a number, got {value!r}') from None
+        elif not isinstance(value, str) or not value.strip():
+            raise QueryError(f'{field} needs a non-empty text value')
+        self.field = field
+        self.op = op
+        self.value = value
+
+    def __repr__(self):
+        """Return the condition in query syntax."""
+        if isinstance(self.value, float):
+            value = f'{self.value:g}'
+        else:
+            value = f'"{self.value}"'
+        return f'{self.field} {self.op} {value}'
+
+
+def parse_query(text):
+    """
+    Parse a query into conditions.
+
+    Conditions are 'field op value' joined by 'and'. Values containing
+    spaces or operator characters must be quoted with single or double
+    quotes.
+
+    Args:
+        text (str): Query text
+
+    Returns:
+        list: Condition objects
+
+    Raises:
+        QueryError: If the text is not a valid query
+    """
+    tokens = []
+    position = 0
+    text = text.strip()
+    while position < len(text):
+        match = TOKEN_PATTERN.match(text, position)
+        if match is None or match.end() == position:
+            raise QueryError(f'Unexpected character at position {position}: {text[position]!r}')
+        position = match.end()
+        if match.group('op') is not None:
+            tokens.append(('op', match.group('op')))
+        elif match.group('word') is not None:
+            tokens.append(('word', match.group('word')))
+        else:
+            quoted = match.group('dq') if match.group('dq') is not None else match.group('sq')
+            tokens.append(('text', quoted))
+
+    conditions = []
+    index = 0
+    while True:
+        if len(tokens) - index < 3:
+            raise QueryError('Expected a condition such as: level = Intermediate')
+        (field_kind, field), (op_kind, op), (value_kind, value) = tokens[index:index + 3]
+        if field_kind != 'word' or op_kind != 'op' or value_kind == 'op':
+            raise QueryError(f'Malformed condition near {field!r}')
+        conditions.append(Condition(field, op, value))
+        index += 3
+        if index == len(tokens):
+            return conditions
+        kind, word = tokens[index]
+        if kind != 'word' or word.lower() != 'and':
+            raise QueryError(f"Expected 'and' before {word!r}")
+        index += 1
+
+
+class PlanStep:
+    """One step of a query plan."""
+
+    def __init__(self, kind, condition, source, estimate):
+        """
+        Initialize the PlanStep.
+
+        Args:
+            kind (str): 'index' to intersect with an index lookup, 'scan' to
+                start from every course, or 'filter' to check candidates
+            condition (Condition): Condition evaluated by the step, None for
+                a scan
+            source (str): Index or data the step reads
+            estimate (float): Estimated courses left after the step
+        """
+        self.kind = kind
+        self.condition = condition
+        self.source = source
+        self.estimate = estimate
+        self.actual = None
+
+
+class QueryPlan:
+    """Ordered steps evaluating a query."""
+
+    def __init__(self, engine, steps):
+        """
+        Initialize the QueryPlan.
+
+        Args:
+            engine (QueryEngine): Engine providing indexes and matchers
+            steps (list): PlanStep objects in execution order
+        """
+        self.engine = engine
+        self.steps = steps
+
+    def execute(self):
+        """
+        Run the plan.
+
+        Returns:
+            list: Sorted IDs of matching courses
+        """
+        courses = self.engine.course_details.courses
+        ids = None
+        for step in self.steps:
+            if step.kind == 'scan':
+                ids = set(courses)
+            elif step.kind == 'index':
+                found = self.engine.lookup(step.condition)
+                if ids is None:
+                    ids = found & courses.keys()
+                elif len(found) < len(ids):
+                    ids = {course_id for course_id in found if course_id in ids}
+                else:
+                    ids = {course_id for course_id in ids if course_id in found}
+            else:
+                matches = self.engine.matcher(step.condition)
+                ids = {course_id for course_id in ids if matches(course_id)}
+            step.actual = len(ids)
+        return sorted(ids)
+
+    def explain(self):
+        """
+        Describe the plan.
+
+        Returns:
+            str: One line per step with its estimated row count, and the
+                actual count once the plan has been executed
+        """
+        lines = [f'Plan over {len(self.engine.course_details.courses)} courses:']
+        for number, step in enumerate(self.steps, 1):
+            what = 'all courses' if step.condition is None else repr(step.condition)
+            line = f'  {number}. {step.kind:<6} {what:<36} via {step.source}, est. {step.estimate:.0f}'
+            if step.actual is not None:
+                line += f', actual {step.actual}'
+            lines.append(line)
+        return '\n'.join(lines)
+
+
+class Query:
+    """A conjunction of conditions bound to a QueryEngine."""
+
+    def __init__(self, engine, conditions=()):
+        """
+        Initialize the Query.
+
+        Args:
+            engine (QueryEngine): Engine the query runs on
+            conditions (iterable): Condition objects that must all hold
+        """
+        self.engine = engine
+        self.conditions = list(conditions)
+        for condition in self.conditions:
+            engine.check_supported(condition)
+
+    def where(self, field, op, value):
+        """
+        Add a condition.
+
+        Args:
+            field (str): Field name
+            op (str): Comparison operator
+            value (str | int | float): Value to compare with
+
+        Returns:
+            Query: New query with the extra condition
+        """
+        return Query(self.engine, self.conditions + [Condition(field, op, value)])
+
+    def plan(self):
+        """
+        Compile the query into a plan.
+
+        Returns:
+            QueryPlan: Plan reflecting the current index statistics
+        """
+        return self.engine.plan(self.conditions)
+
+    def execute(self):
+        """
+        Run the query.
+
+        Returns:
+            list: Sorted IDs of matching courses
+        """
+        return self.plan().execute()
+
+    def explain(self):
+        """
+        Describe how the query would run.
+
+        Returns:
+            str: Plan description from QueryPlan.explain()
+        """
+        return self.plan().explain()
+
+
+class QueryEngine:
+    """
+    Plans and runs course queries across the managers.
+
+    Level and topic indexes are kept by the engine and updated through
+    change notifications; summary conditions use the SummaryInfo search
+    index and trainer counts use a per-course index of qualification
+    holders. Conditions on fields without an index are checked course by
+    course.
+    """
+
+    def __init__(self, course_details, summary_info=None, qual_manager=None,
+                 lecture_prep=None, indexed_fields=('level', 'topic')):
+        """
+        Initialize the QueryEngine.
+
+        Args:
+            course_details (CourseDetails): Courses being queried
+            summary_info (SummaryInfo): Needed for summary conditions
+            qual_manager (QualificationManager): Needed for trainer conditions
+            lecture_prep (LecturePreparation): Needed for prep_hours conditions
+            indexed_fields (iterable): Course fields to keep exact-match
+                indexes for; 'level' and/or 'topic'
+        """
+        self.course_details = course_details
+        self.summary_info = summary_info
+        self.qual_manager = qual_manager
+        self.lecture_prep = lecture_prep
+        self.indexes = {field: {} for field in indexed_fields}
+        self._indexed_keys = {}
+        self._trainers_by_course = {}
+        for course_id in course_details.courses:
+            self._index_course(course_id)
+        course_details.subscribe(self._on_course_change)
+        if qual_manager is not None:
+            for trainer_id, courses in qual_manager.qualifications.items():
+                for course_id in courses:
+                    self._trainers_by_course.setdefault(course_id, set()).add(trainer_id)
+            qual_manager.subscribe(self._on_qualification_change)
+
+    def query(self, text=None):
+        """
+        Create a query.
+
+        Args:
+            text (str): Query text, or None to build one with Query.where()
+
+        Returns:
+            Query: The query
+
+        Raises:
+            QueryError: If the text is invalid or needs a missing manager
+        """
+        return Query(self, parse_query(text) if text else ())
+
+    def check_supported(self, condition):
+        """
+        Check that the engine has the data a condition needs.
+
+        Args:
+            condition (Condition): Condition to check
+
+        Raises:
+            QueryError: If the manager the condition reads was not given
+        """
+        source = FIELD_SOURCES.get(condition.field)
+        if source is not None and getattr(self, source) is None:
+            raise QueryError(f'{condition.field} conditions need {source}')
+
+    def plan(self, conditions):
+        """
+        Order conditions into a plan.
+
+        The indexed condition with the fewest estimated matches supplies the
+        candidates. Other indexed conditions are intersected in while an
+        index read is cheaper than checking the remaining candidates one by
+        one; all other conditions are checked in order of cost per course
+        removed, so cheap and selective checks come first.
+
+        Args:
+            conditions (list): Condition objects
+
+        Returns:
+            QueryPlan: The plan
+        """
+        total = len(self.course_details.courses)
+        indexed = []
+        probes = []
+        for condition in conditions:
+            source, estimate, read_cost, exact = self._index_estimate(condition)
+            if source is None:
+                probes.append(condition)
+                continue
+            indexed.append((estimate, read_cost, source, condition))
+            if not exact:
+                probes.append(condition)
+        indexed.sort(key=lambda item: item[0])
+
+        steps = []
+        if indexed:
+            estimate, _, source, condition = indexed.pop(0)
+            rows = estimate
+            steps.append(PlanStep('index', condition, source, rows))
+        else:
+            rows = total
+            steps.append(PlanStep('scan', None, 'course_details', rows))
+        for estimate, read_cost, source, condition in indexed:
+            if read_cost <= rows * PROBE_COSTS[condition.field]:
+                rows = rows * estimate / total if total else 0
+                steps.append(PlanStep('index', condition, source, rows))
+            elif condition not in probes:
+                probes.append(condition)
+
+        def rank(condition):
+            selectivity = self._selectivity(condition, total)
+            return PROBE_COSTS[condition.field] / max(1.0 - selectivity, 1e-6)
+
+        for condition in sorted(probes, key=rank):
+            rows *= self._selectivity(condition, total)
+            steps.append(PlanStep('filter', condition, self._probe_source(condition), rows))
+        return QueryPlan(self, steps)
+
+    def lookup(self, condition):
+        """
+        Get the course IDs an index returns for a condition.
+
+        Args:
+            condition (Condition): Condition with an index
+
+        Returns:
+            set: Matching course IDs; a superset for trainer conditions
+        """
+        field = condition.field
+        if field == 'id':
+            return {condition.value} if condition.value in self.course_details.courses else set()
+        if field == 'summary':
+            return {doc_id for doc_id, _ in self.summary_info.search_index.search(condition.value)}
+        if field == 'trainers':
+            minimum = self._minimum_holders(condition)
+            return {course_id for course_id, trainers in self._trainers_by_course.items()
+                    if len(trainers) >= minimum}
+        return set(self.indexes[field].get(condition.value.lower(), ()))
+
+    def matcher(self, condition):
+        """
+        Build a function checking one course against a condition.
+
+        Args:
+            condition (Condition): Condition to check
+
+        Returns:
+            callable: Function taking a course ID and returning a bool
+        """
+        field, op, value = condition.field, condition.op, condition.value
+        courses = self.course_details.courses
+        if field == 'id':
+            return lambda course_id: _COMPARE[op](course_id, value)
+        if field in ('name', 'level'):
+            return lambda course_id: _text_matches(courses[course_id].get(field), op, value)
+        if field == 'description':
+            return lambda course_id: _text_matches(
+                self.course_details.get_course(course_id).get(field), op, value)
+        if field == 'topic':
+            def topic_matches(course_id):
+                topics = courses[course_id].get('topics') or ()
+                if op == '!=':
+                    return not any(_text_matches(topic, '=', value) for topic in topics)
+                return any(_text_matches(topic, op, value) for topic in topics)
+            return topic_matches
+        if field == 'summary':
+            found = self.lookup(condition)
+            return found.__contains__
+        if field == 'duration':
+            return lambda course_id: _number_matches(courses[course_id].get('duration'), op, value)
+        if field == 'prep_hours':
+            return lambda course_id: _number_matches(
+                self.lecture_prep.get_prep_hours(course_id), op, value)
+        return lambda course_id: _COMPARE[op](self.active_trainer_count(course_id), value)
+
+    def active_trainer_count(self, course_id):
+        """
+        Count trainers with an active, non-expired qualification for a course.
+
+        Args:
+            course_id (str): Unique identifier for the course
+
+        Returns:
+            int: Number of qualified trainers as of the qualification clock
+        """
+        qm = self.qual_manager
+        today = qm.clock.today()
+        count = 0
+        for trainer_id in self._trainers_by_course.get(course_id, ()):
+            if qm.qualifications[trainer_id][course_id].get('status') != 'active':
+                continue
+            if qm.check_expiry(trainer_id, course_id, today)['status'] in ('valid', 'expiring_soon'):
+                count += 1
+        return count
+
+    def _index_estimate(self, condition):
+        # (source, estimated matches, cost of reading the index, exact), or
+        # Nones when no index serves the condition
+        field, op = condition.field, condition.op
+        if op != '=' and field in ('id', 'level', 'topic'):
+            return None, None, None, None
+        if field == 'id':
+            found = 1 if condition.value in self.course_details.courses else 0
+            return 'record lookup', found, 1, True
+        if field in self.indexes:
+            found = len(self.indexes[field].get(condition.value.lower(), ()))
+            return f'{field} index', found, found, True
+        if field == 'summary':
+            postings = self.summary_info.search_index.postings
+            sizes = [len(postings.get(token, ()))
+                     for phrase in parse_search_query(condition.value) for token in phrase]
+            if not sizes:
+                return 'summary search index', 0, 1, True
+            return 'summary search index', min(sizes), sum(sizes), True
+        minimum = self._minimum_holders(condition) if field == 'trainers' else 0
+        if minimum > 0:
+            found = sum(1 for trainers in self._trainers_by_course.values()
+                        if len(trainers) >= minimum)
+            return 'qualification holders index', found, len(self._trainers_by_course), False
+        return None, None, None, None
+
+    def _minimum_holders(self, condition):
+        # Least number of qualification holders a matching course can have
+        op, value = condition.op, condition.value
+        if op in ('>=', '='):
+            return max(0, math.ceil(value))
+        if op == '>':
+            return max(0, math.floor(value) + 1)
+        return 0
+
+    def _selectivity(self, condition, total):
+        field, op = condition.field, condition.op
+        if not total:
+            return 0.0
+        if field in ('summary', 'trainers'):
+            source, estimate, _, exact = self._index_estimate(condition)
+            if source is not None:
+                # Trainer estimates count holders, not active trainers
+                return estimate / total if exact else DEFAULT_SELECTIVITY[op]
+        if field in self.indexes and op in ('=', '!='):
+            share = len(self.indexes[field].get(condition.value.lower(), ())) / total
+            return share if op == '=' else 1.0 - share
+        if field == 'id':
+            return 1 / total if op == '=' else 1.0 - 1 / total
+        return DEFAULT_SELECTIVITY[op]
+
+    def _probe_source(self, condition):
+        field = condition.field
+        if field == 'trainers':
+            return 'qualifications'
+        if field == 'prep_hours':
+            return 'lecture_prep'
+        if field == 'summary':
+            return 'summary search index'
+        return 'course records'
+
+    def _index_course(self, course_id):
+        for field, keys in self._indexed_keys.pop(course_id, {}).items():
+            index = self.indexes[field]
+            for key in keys:
+                ids = index.get(key)
+                ids.discard(course_id)
+                if not ids:
+                    del index[key]
+        course = self.course_details.courses.get(course_id)
+        if course is None or not self.indexes:
+            return
+        keys_by_field = {}
+        for field, index in self.indexes.items():
+            if field == 'topic':
+                values = course.get('topics') or ()
+            else:
+                values = (course.get(field),)
+            keys = {value.lower() for value in values if isinstance(value, str)}
+            for key in keys:
+                index.setdefault(key, set()).add(course_id)
+            keys_by_field[field] = keys
+        self._indexed_keys[course_id] = keys_by_field
+
+    def _on_course_change(self, course_id):
+        self._index_course(course_id)
+
+    def _on_qualification_change(self, key):
+        trainer_id, course_id = key
+        holders = self._trainers_by_course.setdefault(course_id, set())
+        if course_id in self.qual_manager.qualifications.get(trainer_id, {}):
+            holders.add(trainer_id)
+        else:
+            holders.discard(trainer_id)
+            if not holders:
+                del self._trainers_by_course[course_id]
+
+
+def _text_matches(text, op, value):
+    if not isinstance(text, str):
+        return op == '!='
+    text = text.lower()
+    value = value.lower()
+    if op == '~':
+        return value in text
+    return (text == value) if op == '=' else (text != value)
+
+
+def _number_matches(number, op, value):
+    if isinstance(number, bool) or not isinstance(number, (int, float)):
+        return False
+    return _COMPARE[op](number, value)
@@ -0,0 +1,128 @@
+"""
+Renewal Scheduler Module
+
+Tracks when qualification renewal reminders are due using a min-heap of
+notice dates, so due reminders are found without scanning every
+qualification. Superseded entries stay in the heap until they surface or
+outnumber the live ones, when the heap is rebuilt.
+"""
+
+import heapq
+from datetime import datetime, timedelta
+
+
+class RenewalScheduler:
+    """Schedules renewal reminders ahead of qualification expiry dates."""
+
+    def __init__(self, qual_manager, notice_days=90, clock=None):
+        """
+        Initialize the RenewalScheduler and schedule existing qualifications.
+
+        Args:
+            qual_manager (QualificationManager): Source of qualifications
+            notice_days (int): Days before expiry a reminder becomes due
+            clock (SystemClock | ManualClock): Clock deciding what is due,
+                defaults to the qualification manager's clock
+        """
+        self.qual_manager = qual_manager
+        self.notice_days = notice_days
+        self.clock = clock or qual_manager.clock
+        self._heap = []
+        self._scheduled = {}
+        self._counter = 0
+
+        for trainer_id, courses in qual_manager.qualifications.items():
+            for course_id, qual in courses.items():
+                entry = self._make_entry(trainer_id, course_id, qual)
+                if entry is not None:
+                    self._heap.append(entry)
+        heapq.heapify(self._heap)
+        qual_manager.subscribe(self._on_change)
+
+    def __len__(self):
+        """Return the number of pending reminders."""
+        return len(self._scheduled)
+
+    def schedule(self, trainer_id, course_id):
+        """
+        (Re)schedule the reminder for one qualification.
+
+        Any previously scheduled reminder for the same trainer and course is
+        superseded. Qualifications that are not active or have no valid
+        expiry date are unscheduled.
+
+        Args:
+            trainer_id (str): Unique identifier for the trainer
+            course_id (str): Unique identifier for the course
+        """
+        qual = self.qual_manager.get_qualifications(trainer_id).get(course_id)
+        self._scheduled.pop((trainer_id, course_id), None)
+        entry = self._make_entry(trainer_id, course_id, qual)
+        if entry is not None:
+            heapq.heappush(self._heap, entry)
+        if len(self._heap) > 2 * len(self._scheduled):
+            self._compact()
+
+    def peek_next(self):
+        """
+        Get the next pending reminder without removing it.
+
+        Returns:
+            dict: Reminder information or None if nothing is scheduled
+        """
+        self._discard_stale()
+        return self._reminder(self._heap[0]) if self._heap else None
+
+    def pop_due(self):
+        """
+        Remove and return every reminder whose notice date has arrived.
+
+        Returns:
+            list: Reminders ordered by notice date
+        """
+        today = self.clock.today().toordinal()
+        due = []
+        while True:
+            self._discard_stale()
+            if not self._heap or self._heap[0][0] > today:
+                return due
+            entry = heapq.heappop(self._heap)
+            del self._scheduled[(entry[2], entry[3])]
+            due.append(self._reminder(entry))
+
+    def _make_entry(self, trainer_id, course_id, qual):
+        if not qual or qual.get('status') != 'active':
+            return None
+        try:
+            expiry = datetime.strptime(qual['expiry_date'], '%Y-%m-%d').date()
+        except (ValueError, KeyError, TypeError):
+            return None
+        self._counter += 1
+        notice = expiry - timedelta(days=self.notice_days)
+        entry = (notice.toordinal(), self._counter, trainer_id, course_id, expiry)
+        self._scheduled[(trainer_id, course_id)] = self._counter
+        return entry
+
+    def _discard_stale(self):
+        heap = self._heap
+        while heap and self._scheduled.get((heap[0][2], heap[0][3])) != heap[0][1]:
+            heapq.heappop(heap)
+
+    def _compact(self):
+        scheduled = self._scheduled
+        self._heap = [entry for entry in self._heap
+                      if scheduled.get((entry[2], entry[3])) == entry[1]]
+        heapq.heapify(self._heap)
+
+    def _reminder(self, entry):
+        notice_ordinal, _, trainer_id, course_id, expiry = entry
+        return {
+            'trainer_id': trainer_id,
+            'course_id': course_id,
+            'expiry_date': expiry.isoformat(),
+            'notice_date': datetime.fromordinal(notice_ordinal).date().isoformat(),
+            'days_remaining': (expiry - self.clock.today()).days,
+        }
+
+    def _on_change(self, key):
+        self.schedule(*key)
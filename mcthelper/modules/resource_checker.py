@@ -0,0 +1,327 @@
+"""
+Resource Checker Module
+
+Checks that preparation and learning resource URLs are reachable. Requests
+run concurrently on asyncio with a global concurrency limit, a small pool
+of keep-alive connections per host, per-request timeouts and a TTL cache of
+results. Timeouts and connection errors are cached only briefly, so a
+passing network problem is retried soon.
+"""
+
+import asyncio
+import ssl
+import time
+from urllib.parse import urljoin, urlsplit
+
+
+MAX_REDIRECTS = 5
+
+
+class _HostPool:
+    """Keep-alive connections to one scheme/host/port."""
+
+    def __init__(self, scheme, host, port, limit):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.idle = []
+        self.slots = asyncio.Semaphore(limit)
+        self.opened = 0
+
+    async def acquire(self, fresh=False):
+        while self.idle and not fresh:
+            reader, writer = self.idle.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                return reader, writer, True
+            writer.close()
+        context = ssl.create_default_context() if self.scheme == 'https' else None
+        reader, writer = await asyncio.open_connection(self.host, self.port, ssl=context)
+        self.opened += 1
+        return reader, writer, False
+
+    def release(self, reader, writer, reusable):
+        if reusable:
+            self.idle.append((reader, writer))
+        else:
+            writer.close()
+
+    def close(self):
+        for _, writer in self.idle:
+            writer.close()
+        self.idle = []
+
+
+class ResourceChecker:
+    """Concurrent HTTP reachability checker for resource URLs."""
+
+    def __init__(self, max_concurrency=50, per_host=4, timeout=10.0, ttl=3600,
+                 error_ttl=60, clock=time.monotonic, user_agent='MCTHelper-ResourceChecker'):
+        """
+        Initialize the ResourceChecker.
+
+        Args:
+            max_concurrency (int): Maximum requests in flight overall
+            per_host (int): Maximum open connections per host
+            timeout (float): Seconds allowed for one request once a
+                connection slot is available
+            ttl (float): Seconds a result with an HTTP status stays cached
+            error_ttl (float): Seconds a timeout or connection error stays
+                cached
+            clock (callable): Monotonic clock returning seconds
+            user_agent (str): User-Agent header sent with requests
+        """
+        self.max_concurrency = max_concurrency
+        self.per_host = per_host
+        self.timeout = timeout
+        self.ttl = ttl
+        self.error_ttl = error_ttl
+        self.clock = clock
+        self.user_agent = user_agent
+        self._results = {}
+        self._pools = {}
+        self._limit = None
+        self._loop = None
+
+    def cached_result(self, url):
+        """
+        Get the cached result for a URL.
+
+        Args:
+            url (str): Resource URL
+
+        Returns:
+            dict: Result or None if not cached or expired
+        """
+        cached = self._results.get(url)
+        if cached is None or self.clock() >= cached[0]:
+            return None
+        return cached[1]
+
+    def clear_cache(self):
+        """Forget all cached results."""
+        self._results.clear()
+
+    async def check(self, url):
+        """
+        Check one URL.
+
+        Args:
+            url (str): http or https URL
+
+        Returns:
+            dict: Result with
+                - url: Checked URL
+                - ok: True for a 2xx/3xx final response
+                - status: Final HTTP status code or None
+                - error: Error description or None
+                - elapsed: Seconds spent, 0 for cached results
+        """
+        cached = self.cached_result(url)
+        if cached is not None:
+            return dict(cached, elapsed=0.0)
+        self._bind_loop()
+        async with self._limit:
+            start = time.perf_counter()
+            try:
+                status = await self._follow(url)
+                result = {'url': url, 'ok': 200 <= status < 400, 'status': status, 'error': None}
+            except asyncio.TimeoutError:
+                result = {'url': url, 'ok': False, 'status': None, 'error': 'timeout'}
+            except (OSError, ValueError, asyncio.IncompleteReadError) as exc:
+                result = {'url': url, 'ok': False, 'status': None,
+                          'error': str(exc) or type(exc).__name__}
+            result['elapsed'] = time.perf_counter() - start
+        ttl = self.ttl if result['status'] is not None else self.error_ttl
+        self._results[url] = (self.clock() + ttl, result)
+        return result
+
+    async def check_urls(self, urls):
+        """
+        Check many URLs concurrently.
+
+        Args:
+            urls (iterable): URLs; duplicates are checked once
+
+        Returns:
+            dict: URL to result
+        """
+        unique = list(dict.fromkeys(urls))
+        results = await asyncio.gather(*(self.check(url) for url in unique))
+        return dict(zip(unique, results))
+
+    async def check_catalog(self, lecture_prep=None, tech_learning=None):
+        """
+        Check every resource URL in the preparation materials and technologies.
+
+        Resources that are not http(s) URLs (for example 'Microsoft Learn')
+        are reported as skipped.
+
+        Args:
+            lecture_prep (LecturePreparation): Source of course resources
+            tech_learning (TechLearning): Source of technology resources
+
+        Returns:
+            dict: Report with
+                - results: URL to result
+                - broken: Sorted list of (owner, url) pairs that failed,
+                    owners being 'course:<id>' or 'technology:<id>'
+                - skipped: Sorted list of (owner, resource) pairs
+        """
+        owners = {}
+        skipped = []
+        for owner, resources in _catalog_resources(lecture_prep, tech_learning):
+            for resource in resources:
+                if is_checkable(resource):
+                    owners.setdefault(resource, []).append(owner)
+                else:
+                    skipped.append((owner, resource))
+        results = await self.check_urls(owners)
+        broken = sorted((owner, url) for url, result in results.items() if not result['ok']
+                        for owner in owners[url])
+        return {'results': results, 'broken': broken, 'skipped': sorted(skipped, key=str)}
+
+    async def close(self):
+        """Close pooled connections."""
+        for pool in self._pools.values():
+            pool.close()
+        self._pools = {}
+
+    def stats(self):
+        """
+        Get connection statistics.
+
+        Returns:
+            dict: Connections opened per host and cached result count
+        """
+        return {
+            'connections': {f'{p.scheme}://{p.host}:{p.port}': p.opened
+                            for p in self._pools.values()},
+            'cached_results': len(self._results),
+        }
+
+    def _bind_loop(self):
+        # asyncio primitives belong to one event loop; start over on a new one
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._limit = asyncio.Semaphore(self.max_concurrency)
+            self._pools = {}
+
+    async def _follow(self, url):
+        for _ in range(MAX_REDIRECTS + 1):
+            status, location = await self._request(url, 'HEAD')
+            if status in (405, 501):
+                status, location = await self._request(url, 'GET')
+            if status in (301, 302, 303, 307, 308) and location:
+                url = urljoin(url, location)
+                continue
+            return status
+        raise ValueError('too many redirects')
+
+    async def _request(self, url, method):
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            raise ValueError(f'unsupported URL: {url}')
+        port = parts.port or (443 if parts.scheme == 'https' else 80)
+        key = (parts.scheme, parts.hostname, port)
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = _HostPool(parts.scheme, parts.hostname, port, self.per_host)
+        target = parts.path or '/'
+        if parts.query:
+            target += '?' + parts.query
+        host = parts.hostname if parts.port is None else f'{parts.hostname}:{parts.port}'
+        request = (
+            f'{method} {target} HTTP/1.1\r\n'
+            f'Host: {host}\r\n'
+            f'User-Agent: {self.user_agent}\r\n'
+            'Connection: keep-alive\r\n'
+            '\r\n'
+        ).encode('latin-1')
+
+        async with pool.slots:
+            status, headers = await asyncio.wait_for(
+                self._exchange(pool, request, method), self.timeout)
+        return status, headers.get('location')
+
+    async def _exchange(self, pool, request, method):
+        reader, writer, reused = await pool.acquire()
+        try:
+            writer.write(request)
+            await writer.drain()
+            status_line = await reader.readline()
+            if not status_line and reused:
+                # The server closed an idle connection; retry on a new one
+                writer.close()
+                reader, writer, reused = await pool.acquire(fresh=True)
+                writer.write(request)
+                await writer.drain()
+                status_line = await reader.readline()
+            status, headers = await _read_head(status_line, reader)
+        except BaseException:
+            writer.close()
+            raise
+        # Bodies are never read, so only bodiless responses keep the connection
+        reusable = (method == 'HEAD' or headers.get('content-length') == '0') and \
+            headers.get('connection', '').lower() != 'close'
+        pool.release(reader, writer, reusable)
+        return status, headers
+
+
+async def _read_head(status_line, reader):
+    parts = status_line.decode('latin-1').split(None, 2)
+    if len(parts) < 2 or not parts[0].startswith('HTTP/') or not parts[1].isdigit():
+        raise ValueError('invalid HTTP response')
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if not line:
+            raise asyncio.IncompleteReadError(b'', None)
+        if line in (b'\r\n', b'\n'):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    return int(parts[1]), headers
+
+
+def _catalog_resources(lecture_prep, tech_learning):
+    if lecture_prep is not None:
+        for course_id, materials in lecture_prep.prep_materials.items():
+            yield f'course:{course_id}', materials.get('resources', ())
+    if tech_learning is not None:
+        for tech_id, tech in tech_learning.technologies.items():
+            yield f'technology:{tech_id}', tech.get('resources', ())
+
+
+def is_checkable(resource):
+    """
+    Check whether a resource entry is an http(s) URL.
+
+    Args:
+        resource: Resource entry
+
+    Returns:
+        bool: True for http and https URLs
+    """
+    return isinstance(resource, str) and resource.startswith(('http://', 'https://'))
+
+
+def check_resources(lecture_prep=None, tech_learning=None, **options):
+    """
+    Check all catalog resources from synchronous code.
+
+    Args:
+        lecture_prep (LecturePreparation): Source of course resources
+        tech_learning (TechLearning): Source of technology resources
+        **options: Keyword arguments for ResourceChecker
+
+    Returns:
+        dict: Report from ResourceChecker.check_catalog()
+    """
+    async def run():
+        checker = ResourceChecker(**options)
+        try:
+            return await checker.check_catalog(lecture_prep, tech_learning)
+        finally:
+            await checker.close()
+    return asyncio.run(run())
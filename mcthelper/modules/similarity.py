@@ -0,0 +1,202 @@
+"""
+Similarity Module
+
+"Courses similar to X" recommendations. Every course gets a sparse TF-IDF
+vector built from its name, description, topics and summary key points,
+and top-k cosine similarity is answered from an inverted index of those
+vectors, so a query only touches courses that share terms with the course.
+"""
+
+import heapq
+import math
+
+from .text_index import tokenize
+
+
+# Words too common in course text to say anything about similarity
+STOP_WORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'how', 'in',
+    'into', 'is', 'it', 'of', 'on', 'or', 'the', 'this', 'to', 'with', 'your',
+})
+
+
+class CourseSimilarity:
+    """
+    Incrementally maintained TF-IDF index for course-to-course similarity.
+
+    Term weights are 1 + log(term frequency) times a smoothed inverse
+    document frequency. IDF values and vector norms are recomputed in one
+    pass ("reweighting") when the number of courses has changed by more
+    than ``reweight_ratio`` since the last pass; in between, new and
+    changed courses are weighted with the current values.
+    """
+
+    def __init__(self, course_details, summary_info=None, reweight_ratio=0.1,
+                 accumulator_limit=5000):
+        """
+        Initialize the CourseSimilarity index.
+
+        Args:
+            course_details (CourseDetails): Courses to compare
+            summary_info (SummaryInfo): Optional source of key points
+            reweight_ratio (float): Relative change in course count that
+                triggers recomputing IDF values and norms
+            accumulator_limit (int): Candidate courses scored per query;
+                once reached, rarer terms have been applied and common terms
+                only add to existing candidates
+        """
+        self.course_details = course_details
+        self.summary_info = summary_info
+        self.reweight_ratio = reweight_ratio
+        self.accumulator_limit = accumulator_limit
+        self._term_weights = {}
+        self._postings = {}
+        self._idf = {}
+        self._norms = {}
+        self._weighted_count = 0
+        self._results = {}
+        for course_id in course_details.courses:
+            self._add_terms(course_id)
+        self.reweight()
+        course_details.subscribe(self._on_change)
+        if summary_info is not None:
+            summary_info.subscribe(self._on_change)
+
+    def __len__(self):
+        """Return the number of indexed courses."""
+        return len(self._term_weights)
+
+    def reweight(self):
+        """Recompute IDF values and vector norms for all courses."""
+        count = len(self._term_weights)
+        self._idf = {term: self._smoothed_idf(len(posting), count)
+                     for term, posting in self._postings.items()}
+        self._norms = {course_id: self._norm(weights)
+                       for course_id, weights in self._term_weights.items()}
+        self._weighted_count = count
+        self._results.clear()
+
+    def clear_cache(self):
+        """Forget cached similar() results."""
+        self._results.clear()
+
+    def vector(self, course_id):
+        """
+        Get a course's normalized TF-IDF vector.
+
+        Args:
+            course_id (str): Unique identifier for the course
+
+        Returns:
+            dict: Term to weight, empty if the course is not indexed
+        """
+        weights = self._term_weights.get(course_id)
+        norm = self._norms.get(course_id)
+        if not weights or not norm:
+            return {}
+        return {term: weight * self._idf_of(term) / norm for term, weight in weights.items()}
+
+    def similar(self, course_id, k=10):
+        """
+        Find the courses most similar to a course.
+
+        Args:
+            course_id (str): Unique identifier for the course
+            k (int): Maximum number of results
+
+        Returns:
+            list: Dictionaries with 'id' and 'score' (cosine similarity),
+                best first, ties by ID; empty for unknown courses
+        """
+        cache_key = (course_id, k)
+        cached = self._results.get(cache_key)
+        if cached is not None:
+            return [dict(item) for item in cached]
+        query = self.vector(course_id)
+        if not query:
+            return []
+
+        scores = {}
+        limit = max(self.accumulator_limit, k + 1)
+        # Rare, heavily weighted terms first so they choose the candidates
+        for term, query_weight in sorted(query.items(), key=lambda item: -item[1]):
+            factor = query_weight * self._idf_of(term)
+            posting = self._postings[term]
+            if len(scores) < limit:
+                for other, weight in posting.items():
+                    scores[other] = scores.get(other, 0.0) + factor * weight
+            else:
+                for other in scores:
+                    weight = posting.get(other)
+                    if weight is not None:
+                        scores[other] += factor * weight
+        scores.pop(course_id, None)
+        norms = self._norms
+        best = heapq.nsmallest(
+            k, ((-score / norms[other], other) for other, score in scores.items() if norms[other]))
+        results = [{'id': other, 'score': -negative} for negative, other in best]
+        self._results[cache_key] = results
+        return [dict(item) for item in results]
+
+    def _course_terms(self, course_id):
+        course = self.course_details.get_course(course_id)
+        if course is None:
+            return None
+        texts = [course.get('name'), course.get('description')]
+        texts.extend(course.get('topics') or ())
+        if self.summary_info is not None:
+            summary = self.summary_info.get_summary(course_id) or {}
+            texts.extend(summary.get('key_points') or ())
+        counts = {}
+        for text in texts:
+            if not isinstance(text, str):
+                continue
+            for token in tokenize(text):
+                if token not in STOP_WORDS:
+                    counts[token] = counts.get(token, 0) + 1
+        return {term: 1.0 + math.log(count) for term, count in counts.items()}
+
+    def _add_terms(self, course_id):
+        self._remove_terms(course_id)
+        weights = self._course_terms(course_id)
+        if weights is None:
+            return False
+        self._term_weights[course_id] = weights
+        for term, weight in weights.items():
+            self._postings.setdefault(term, {})[course_id] = weight
+        return True
+
+    def _remove_terms(self, course_id):
+        weights = self._term_weights.pop(course_id, None)
+        self._norms.pop(course_id, None)
+        if weights is None:
+            return
+        for term in weights:
+            posting = self._postings[term]
+            del posting[course_id]
+            if not posting:
+                del self._postings[term]
+                self._idf.pop(term, None)
+
+    def _on_change(self, course_id):
+        self._results.clear()
+        if self._add_terms(course_id):
+            self._norms[course_id] = self._norm(self._term_weights[course_id])
+        drift = abs(len(self._term_weights) - self._weighted_count)
+        if drift > self.reweight_ratio * max(self._weighted_count, 1):
+            self.reweight()
+
+    def _idf_of(self, term):
+        idf = self._idf.get(term)
+        if idf is None:
+            idf = self._idf[term] = self._smoothed_idf(
+                len(self._postings.get(term, ())), len(self._term_weights))
+        return idf
+
+    def _norm(self, weights):
+        return math.sqrt(sum((weight * self._idf_of(term)) ** 2
+                             for term, weight in weights.items()))
+
+    @staticmethod
+    def _smoothed_idf(document_frequency, count):
+        return math.log((1 + count) / (1 + document_frequency)) + 1.0
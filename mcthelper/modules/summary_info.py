@@ -4,13 +4,43 @@ Summary Information Module
 Provides MCTs with summary information about courses and training programs.
 """
 
+from .observable import Observable
+from .text_index import InvertedIndex
 
-class SummaryInfo:
+
+class SummaryInfo(Observable):
     """Manages and provides summary information for MCTs."""
     
-    def __init__(self):
-        """Initialize the SummaryInfo manager."""
+    # Large text fields that may be stored compressed
+    COMPRESSIBLE_FIELDS = ('overview', 'key_points')
+    
+    # Relevance weight of each field in full-text search
+    SEARCH_FIELD_WEIGHTS = {
+        'overview': 1.0,
+        'key_points': 1.0,
+        'prerequisites': 1.5,
+        'target_audience': 1.5,
+    }
+    
+    def __init__(self, intern_pool=None, compressor=None, history=None):
+        """
+        Initialize the SummaryInfo manager.
+        
+        Args:
+            intern_pool (InternPool): Optional pool shared with other managers;
+                when given, string values are stored once and lists are
+                stored as tuples
+            compressor (FieldCompressor): Optional compressor for large
+                overviews and key points, decoded only when read
+            history (VersionHistory): Optional revision history; when given,
+                earlier revisions stay readable by version or date
+        """
+        super().__init__()
+        self.intern_pool = intern_pool
+        self.compressor = compressor
+        self.history = history
         self.summaries = {}
+        self.search_index = InvertedIndex(self.SEARCH_FIELD_WEIGHTS)
     
     def add_summary(self, course_id, summary_data):
         """
@@ -34,20 +64,74 @@ class SummaryInfo:
         if not all(field in summary_data for field in required_fields):
             return False
         
+        self.search_index.add_document(
+            course_id, {field: summary_data[field] for field in self.SEARCH_FIELD_WEIGHTS})
+        
+        if self.compressor is not None:
+            summary_data = self.compressor.pack(summary_data, self.COMPRESSIBLE_FIELDS)
+            self.compressor.discard(course_id)
+        
+        if self.intern_pool is not None:
+            previous = self.summaries.get(course_id)
+            summary_data = self.intern_pool.intern_record(summary_data)
+            if previous is not None:
+                self.intern_pool.release_record(previous)
+        
+        if self.history is not None:
+            summary_data = self.history.record(course_id, summary_data)
+        
         self.summaries[course_id] = summary_data
+        self._notify(course_id)
+        return True
+    
+    def remove_summary(self, course_id):
+        """
+        Remove the summary for a course.
+        
+        Args:
+            course_id (str): Unique identifier for the course
+        
+        Returns:
+            bool: True if the summary existed and was removed
+        """
+        if course_id not in self.summaries:
+            return False
+        
+        removed = self.summaries.pop(course_id)
+        self.search_index.remove_document(course_id)
+        if self.intern_pool is not None:
+            self.intern_pool.release_record(removed)
+        if self.compressor is not None:
+            self.compressor.discard(course_id)
+        if self.history is not None:
+            self.history.record(course_id, None)
+        self._notify(course_id)
         return True
     
-    def get_summary(self, course_id):
+    def get_summary(self, course_id, version=None, as_of=None):
         """
         Retrieve summary information by course ID.
         
         Args:
             course_id (str): Unique identifier for the course
+            version (int): Revision number starting at 1; requires history
+            as_of (date | datetime | str): Return the revision current at
+                this time (YYYY-MM-DD for strings); requires history
         
         Returns:
             dict: Summary information or None if not found
         """
-        return self.summaries.get(course_id)
+        if version is None and as_of is None:
+            summary = self.summaries.get(course_id)
+            cache = True
+        elif self.history is None:
+            return None
+        else:
+            summary = self.history.get(course_id, version, as_of)
+            cache = False
+        if self.compressor is not None:
+            return self.compressor.unpack(course_id, summary, cache=cache)
+        return summary
     
     def get_key_points(self, course_id):
         """
@@ -59,7 +143,7 @@ class SummaryInfo:
         Returns:
             list: List of key points or empty list if not found
         """
-        summary = self.summaries.get(course_id)
+        summary = self.get_summary(course_id)
         return summary.get('key_points', []) if summary else []
     
     def get_prerequisites(self, course_id):
@@ -74,3 +158,24 @@ class SummaryInfo:
         """
         summary = self.summaries.get(course_id)
         return summary.get('prerequisites', []) if summary else []
+    
+    def search(self, query, fields=None, limit=None):
+        """
+        Search summaries by overview, key points, prerequisites and audience.
+        
+        Every word must match; wrap phrases in double quotes, for example
+        '"Azure Fundamentals"'. Results are ranked by BM25 relevance.
+        
+        Args:
+            query (str): Search query
+            fields (list): Restrict matching to these fields, e.g. ['prerequisites']
+            limit (int): Maximum number of results
+        
+        Returns:
+            list: Matching summaries with their IDs and scores, best first
+        """
+        if not query:
+            return []
+        
+        return [{'id': course_id, 'score': score, **self.get_summary(course_id)}
+                for course_id, score in self.search_index.search(query, fields, limit)]
@@ -0,0 +1,341 @@
+"""
+Sync Module
+
+Content hashes and Merkle-style digests for every manager, used to
+exchange only changed records between catalog instances.
+
+A sync between a source and a replica takes two round trips:
+
+1. The replica sends ``digest()``; the source answers with
+   ``diff_buckets(replica_digest)``.
+2. The replica sends ``manifest(buckets)``; the source answers with
+   ``make_delta(replica_digest, replica_manifest)`` which the replica
+   passes to ``apply_delta``.
+"""
+
+import gzip
+import hashlib
+import json
+
+
+BUCKET_COUNT = 256
+DELTA_FORMAT_VERSION = 1
+KEY_SEPARATOR = '\x1f'
+
+
+def record_hash(record):
+    """
+    Compute the content hash of a record.
+
+    Args:
+        record (dict): Record data
+
+    Returns:
+        str: Hex digest of the canonical JSON encoding
+    """
+    encoded = json.dumps(record, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.blake2b(encoded.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def bucket_of(key):
+    """
+    Get the digest bucket a record key belongs to.
+
+    Args:
+        key (str): Record key
+
+    Returns:
+        int: Bucket index
+    """
+    return hashlib.blake2b(key.encode('utf-8'), digest_size=2).digest()[0] % BUCKET_COUNT
+
+
+class _Store:
+    """Hash state for one manager dictionary, exposed as string-keyed records."""
+
+    def __init__(self, records, get, put, remove):
+        self.records = records
+        self.get = get
+        self.put = put
+        self.remove = remove
+        self.members = {}
+        self.bucket_hashes = {}
+        self.dirty = set()
+        self.root = None
+        self.rehash_all()
+
+    def rehash_all(self):
+        self.members = {}
+        for key, record in self.records():
+            self.members.setdefault(bucket_of(key), {})[key] = record_hash(record)
+        self.bucket_hashes = {}
+        self.dirty = set(self.members)
+        self.root = None
+
+    def rehash(self, key):
+        bucket = bucket_of(key)
+        record = self.get(key)
+        members = self.members.setdefault(bucket, {})
+        if record is None:
+            members.pop(key, None)
+        else:
+            members[key] = record_hash(record)
+        self.dirty.add(bucket)
+        self.root = None
+
+    def digest(self):
+        for bucket in self.dirty:
+            members = self.members.get(bucket)
+            if members:
+                self.bucket_hashes[bucket] = record_hash(sorted(members.items()))
+            else:
+                self.members.pop(bucket, None)
+                self.bucket_hashes.pop(bucket, None)
+        self.dirty = set()
+        if self.root is None:
+            self.root = record_hash(sorted(self.bucket_hashes.items()))
+        return {
+            'root': self.root,
+            'buckets': {str(b): h for b, h in sorted(self.bucket_hashes.items())},
+        }
+
+
+def _split_key(key):
+    return key.split(KEY_SEPARATOR, 1)
+
+
+class CatalogSync:
+    """Maintains per-record hashes and bucket digests for a set of managers."""
+
+    def __init__(self, course_details=None, summary_info=None, lecture_prep=None,
+                 qual_manager=None, tech_learning=None):
+        """
+        Initialize the CatalogSync and subscribe to the given managers.
+
+        Args:
+            course_details (CourseDetails): Course manager
+            summary_info (SummaryInfo): Summary manager
+            lecture_prep (LecturePreparation): Preparation manager
+            qual_manager (QualificationManager): Qualification manager
+            tech_learning (TechLearning): Technology manager
+        """
+        self.stores = {}
+        if course_details is not None:
+            self._register('courses', course_details, _Store(
+                lambda: ((k, course_details.get_course(k)) for k in list(course_details.courses)),
+                course_details.get_course,
+                course_details.add_course,
+                course_details.remove_course))
+        if summary_info is not None:
+            self._register('summaries', summary_info, _Store(
+                lambda: ((k, summary_info.get_summary(k)) for k in list(summary_info.summaries)),
+                summary_info.get_summary,
+                summary_info.add_summary,
+                summary_info.remove_summary))
+        if lecture_prep is not None:
+            self._register('prep_materials', lecture_prep, _Store(
+                lambda: lecture_prep.prep_materials.items(),
+                lecture_prep.prep_materials.get,
+                lecture_prep.add_prep_material,
+                lecture_prep.remove_prep_material))
+        if qual_manager is not None:
+            self._register('qualifications', qual_manager, _Store(
+                lambda: ((f'{t}{KEY_SEPARATOR}{c}', q)
+                         for t, courses in qual_manager.qualifications.items()
+                         for c, q in courses.items()),
+                lambda key: qual_manager.get_qualifications(_split_key(key)[0]).get(
+                    _split_key(key)[1]),
+                lambda key, q: qual_manager.add_qualification(*_split_key(key), q),
+                lambda key: qual_manager.remove_qualification(*_split_key(key))),
+                key_of=KEY_SEPARATOR.join)
+        if tech_learning is not None:
+            # Technologies are registered first so they are applied first
+            self._register('technologies', tech_learning, _Store(
+                lambda: tech_learning.technologies.items(),
+                tech_learning.technologies.get,
+                tech_learning.add_technology,
+                tech_learning.remove_technology),
+                key_of=lambda key: key[1] if key[0] == 'technology' else None)
+            self._register('learning_paths', tech_learning, _Store(
+                lambda: tech_learning.learning_paths.items(),
+                tech_learning.learning_paths.get,
+                tech_learning.add_learning_path,
+                tech_learning.remove_learning_path),
+                key_of=lambda key: key[1] if key[0] == 'learning_path' else None)
+
+    def _register(self, name, manager, store, key_of=None):
+        self.stores[name] = store
+
+        def on_change(changed):
+            key = key_of(changed) if key_of else changed
+            if key is not None:
+                store.rehash(key)
+        manager.subscribe(on_change)
+
+    def refresh(self):
+        """Recompute every record hash, e.g. after records were mutated in place."""
+        for store in self.stores.values():
+            store.rehash_all()
+
+    def record_hashes(self, name):
+        """
+        Get the content hash of every record in a store.
+
+        Args:
+            name (str): Store name such as 'courses'
+
+        Returns:
+            dict: Mapping of record key to content hash
+        """
+        hashes = {}
+        for members in self.stores[name].members.values():
+            hashes.update(members)
+        return hashes
+
+    def digest(self):
+        """
+        Get the Merkle-style summary of every store.
+
+        Returns:
+            dict: For each store, its 'root' hash and the hashes of its
+                non-empty 'buckets'
+        """
+        return {name: store.digest() for name, store in self.stores.items()}
+
+    def diff_buckets(self, remote_digest):
+        """
+        Find the buckets that differ from a remote digest.
+
+        Args:
+            remote_digest (dict): Result of ``digest()`` on the other instance
+
+        Returns:
+            dict: For each differing store, the sorted differing bucket indexes
+        """
+        diff = {}
+        for name, summary in self.digest().items():
+            remote = remote_digest.get(name, {'root': None, 'buckets': {}})
+            if remote['root'] == summary['root']:
+                continue
+            buckets = set(summary['buckets']) | set(remote['buckets'])
+            diff[name] = sorted(int(b) for b in buckets
+                                if summary['buckets'].get(b) != remote['buckets'].get(b))
+        return diff
+
+    def manifest(self, buckets):
+        """
+        List record hashes within the given buckets.
+
+        Args:
+            buckets (dict): Store name to bucket indexes, as returned by
+                ``diff_buckets``
+
+        Returns:
+            dict: Store name to a mapping of record key to content hash
+        """
+        result = {}
+        for name, indexes in buckets.items():
+            store = self.stores.get(name)
+            hashes = {}
+            if store is not None:
+                store.digest()
+                for bucket in indexes:
+                    hashes.update(store.members.get(bucket, {}))
+            result[name] = hashes
+        return result
+
+    def make_delta(self, remote_digest, remote_manifest):
+        """
+        Build the delta that brings a remote instance up to date.
+
+        Args:
+            remote_digest (dict): Remote ``digest()``
+            remote_manifest (dict): Remote ``manifest()`` for the differing buckets
+
+        Returns:
+            dict: Delta with changed records to upsert and keys to delete
+        """
+        buckets = self.diff_buckets(remote_digest)
+        local_manifest = self.manifest(buckets)
+        stores = {}
+        for name in buckets:
+            local = local_manifest[name]
+            remote = remote_manifest.get(name, {})
+            store = self.stores[name]
+            upsert = {key: store.get(key) for key, digest in sorted(local.items())
+                      if remote.get(key) != digest}
+            delete = sorted(key for key in remote if key not in local)
+            if upsert or delete:
+                stores[name] = {'upsert': upsert, 'delete': delete}
+        return {'version': DELTA_FORMAT_VERSION, 'stores': stores}
+
+    def apply_delta(self, delta):
+        """
+        Apply a delta produced by ``make_delta`` on another instance.
+
+        Args:
+            delta (dict): Delta document
+
+        Returns:
+            dict: Number of 'upserted', 'deleted' and 'rejected' records
+
+        Raises:
+            ValueError: If the delta format version is not supported
+        """
+        if delta.get('version') != DELTA_FORMAT_VERSION:
+            raise ValueError(f"Unsupported delta version: {delta.get('version')}")
+        counts = {'upserted': 0, 'deleted': 0, 'rejected': 0}
+        for name, store in self.stores.items():
+            changes = delta['stores'].get(name)
+            if not changes:
+                continue
+            for key in changes['delete']:
+                if store.remove(key):
+                    counts['deleted'] += 1
+            for key, record in changes['upsert'].items():
+                if store.put(key, record):
+                    counts['upserted'] += 1
+                else:
+                    counts['rejected'] += 1
+        return counts
+
+    def sync_from(self, source):
+        """
+        Pull all changes from another CatalogSync in the same process.
+
+        Args:
+            source (CatalogSync): Authoritative instance
+
+        Returns:
+            dict: Counts returned by ``apply_delta``
+        """
+        local_digest = self.digest()
+        buckets = source.diff_buckets(local_digest)
+        delta = source.make_delta(local_digest, self.manifest(buckets))
+        return self.apply_delta(delta)
+
+
+def write_delta(delta, path):
+    """
+    Write a delta to a gzip-compressed JSON file.
+
+    Args:
+        delta (dict): Delta document
+        path (str): Output file path
+    """
+    with gzip.open(path, 'wt', encoding='utf-8') as handle:
+        json.dump(delta, handle, separators=(',', ':'))
+
+
+def read_delta(path):
+    """
+    Read a delta written by ``write_delta``.
+
+    Args:
+        path (str): Delta file path
+
+    Returns:
+        dict: Delta document
+    """
+    with gzip.open(path, 'rt', encoding='utf-8') as handle:
+        return json.load(handle)
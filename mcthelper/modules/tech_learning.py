@@ -4,14 +4,27 @@ Technology Learning Module
 Helps MCTs stay updated with the latest technologies and learning resources.
 """
 
+from .learning_graph import PrerequisiteGraph
+from .observable import Observable
 
-class TechLearning:
+
+class TechLearning(Observable):
     """Manages technology learning resources and updates for MCTs."""
     
-    def __init__(self):
-        """Initialize the TechLearning manager."""
+    def __init__(self, intern_pool=None):
+        """
+        Initialize the TechLearning manager.
+        
+        Args:
+            intern_pool (InternPool): Optional pool shared with other managers;
+                when given, string values are stored once and lists are
+                stored as tuples
+        """
+        super().__init__()
+        self.intern_pool = intern_pool
         self.technologies = {}
         self.learning_paths = {}
+        self.dependencies = PrerequisiteGraph()
     
     def add_technology(self, tech_id, tech_info):
         """
@@ -25,6 +38,7 @@ class TechLearning:
                 - description: Brief description
                 - latest_version: Latest version
                 - resources: List of learning resources
+                - prerequisites: Optional list of prerequisite technology IDs
         
         Returns:
             bool: True if technology added successfully
@@ -36,7 +50,37 @@ class TechLearning:
         if not all(field in tech_info for field in required_fields):
             return False
         
+        if not self.dependencies.set_dependencies(tech_id, tech_info.get('prerequisites', [])):
+            return False
+        
+        if self.intern_pool is not None:
+            previous = self.technologies.get(tech_id)
+            tech_info = self.intern_pool.intern_record(tech_info)
+            if previous is not None:
+                self.intern_pool.release_record(previous)
+        
         self.technologies[tech_id] = tech_info
+        self._notify(('technology', tech_id))
+        return True
+    
+    def remove_technology(self, tech_id):
+        """
+        Remove a technology from the system.
+        
+        Args:
+            tech_id (str): Unique identifier for the technology
+        
+        Returns:
+            bool: True if the technology existed and was removed
+        """
+        if tech_id not in self.technologies:
+            return False
+        
+        removed = self.technologies.pop(tech_id)
+        if self.intern_pool is not None:
+            self.intern_pool.release_record(removed)
+        self.dependencies.set_dependencies(tech_id, [])
+        self._notify(('technology', tech_id))
         return True
     
     def get_technology(self, tech_id):
@@ -79,6 +123,7 @@ class TechLearning:
                 - modules: List of learning modules
                 - duration: Estimated duration
                 - level: Beginner/Intermediate/Advanced
+                - requires: Optional list of prerequisite learning path IDs
         
         Returns:
             bool: True if learning path added successfully
@@ -90,7 +135,39 @@ class TechLearning:
         if not all(field in path_info for field in required_fields):
             return False
         
+        # A path depends on the paths it requires and on the technologies it covers
+        dependencies = list(path_info.get('requires', [])) + list(path_info['technologies'])
+        if not self.dependencies.set_dependencies(path_id, dependencies):
+            return False
+        
+        if self.intern_pool is not None:
+            previous = self.learning_paths.get(path_id)
+            path_info = self.intern_pool.intern_record(path_info)
+            if previous is not None:
+                self.intern_pool.release_record(previous)
+        
         self.learning_paths[path_id] = path_info
+        self._notify(('learning_path', path_id))
+        return True
+    
+    def remove_learning_path(self, path_id):
+        """
+        Remove a learning path from the system.
+        
+        Args:
+            path_id (str): Unique identifier for the learning path
+        
+        Returns:
+            bool: True if the learning path existed and was removed
+        """
+        if path_id not in self.learning_paths:
+            return False
+        
+        removed = self.learning_paths.pop(path_id)
+        if self.intern_pool is not None:
+            self.intern_pool.release_record(removed)
+        self.dependencies.set_dependencies(path_id, [])
+        self._notify(('learning_path', path_id))
         return True
     
     def get_learning_path(self, path_id):
@@ -122,3 +199,43 @@ class TechLearning:
                 'category': info.get('category')
             })
         return sorted(updates, key=lambda x: x['name'])
+    
+    def get_all_prerequisites(self, item_id):
+        """
+        Get every learning path and technology that must be studied before
+        a learning path or technology.
+        
+        Learning path and technology IDs share one dependency graph.
+        
+        Args:
+            item_id (str): Learning path or technology ID
+        
+        Returns:
+            list: Sorted prerequisite IDs
+        """
+        return sorted(self.dependencies.prerequisites(item_id))
+    
+    def get_study_order(self, item_ids):
+        """
+        Get a valid study order for reaching the given paths or technologies.
+        
+        Args:
+            item_ids (list): Target learning path or technology IDs
+        
+        Returns:
+            list: IDs ordered so that prerequisites come first
+        """
+        return self.dependencies.study_order(item_ids)
+    
+    def get_skill_path(self, from_id, to_id):
+        """
+        Get the shortest chain of steps leading from one skill to another.
+        
+        Args:
+            from_id (str): Learning path or technology already mastered
+            to_id (str): Learning path or technology to reach
+        
+        Returns:
+            list: IDs from from_id to to_id, or None if to_id does not build on from_id
+        """
+        return self.dependencies.shortest_path(from_id, to_id)
@@ -0,0 +1,512 @@
+"""
+Tenancy Module
+
+Hosts catalogs for several training partners in one process. Common course
+data is kept once in shared, read-only managers; each tenant only stores
+its own additions, overrides and removals, with its own indexes and quota.
+"""
+
+from .course_details import CourseDetails
+from .learning_graph import PrerequisiteGraph
+from .lecture_prep import LecturePreparation
+from .qualifications import QualificationManager
+from .summary_info import SummaryInfo
+from .tech_learning import TechLearning
+
+
+# How each manager's methods behave on an overlay:
+#   lookups: single-record reads (ID first), resolved against the named
+#            record dictionary
+#   writes:  methods that add or replace a record (ID first) in the store
+#   removes: methods that delete a record (ID first) from the store
+#   lists:   list reads merged by record 'id', with an optional sort key
+# Reads over the whole catalog (prep hour totals, the technology dependency
+# graph) are implemented by the manager's overlay subclass below.
+OVERLAY_SPECS = {
+    'CourseDetails': {
+        'lookups': {'get_course': 'courses'},
+        'writes': {'add_course': 'courses'},
+        'removes': {'remove_course': 'courses'},
+        'lists': {'search_courses': ('courses', None), 'list_all_courses': ('courses', None)},
+    },
+    'SummaryInfo': {
+        'lookups': {'get_summary': 'summaries', 'get_key_points': 'summaries',
+                    'get_prerequisites': 'summaries'},
+        'writes': {'add_summary': 'summaries'},
+        'removes': {'remove_summary': 'summaries'},
+        'lists': {},
+    },
+    'LecturePreparation': {
+        'lookups': {'get_prep_materials': 'prep_materials', 'get_checklist': 'prep_materials',
+                    'get_timing_guide': 'prep_materials', 'get_timing_minutes': 'prep_materials',
+                    'get_total_minutes': 'prep_materials', 'get_prep_hours': 'prep_materials'},
+        'writes': {'add_prep_material': 'prep_materials'},
+        'removes': {'remove_prep_material': 'prep_materials'},
+        'lists': {},
+    },
+    'TechLearning': {
+        'lookups': {'get_technology': 'technologies', 'get_learning_path': 'learning_paths'},
+        'writes': {'add_technology': 'technologies', 'add_learning_path': 'learning_paths'},
+        'removes': {'remove_technology': 'technologies', 'remove_learning_path': 'learning_paths'},
+        'lists': {'get_by_category': ('technologies', None),
+                  'get_latest_updates': ('technologies', lambda item: item['name'])},
+    },
+}
+
+_MANAGER_CLASSES = {
+    'course_details': CourseDetails,
+    'summary_info': SummaryInfo,
+    'lecture_prep': LecturePreparation,
+    'tech_learning': TechLearning,
+}
+
+
+class TenantOverlay:
+    """
+    One tenant's view of a shared manager.
+
+    Reads check the tenant's own records first and fall back to the shared
+    manager unless the tenant removed the record. Writes only ever touch
+    the tenant's own manager.
+    """
+
+    def __init__(self, tenant, shared, local):
+        """
+        Initialize the TenantOverlay.
+
+        Args:
+            tenant (Tenant): Owning tenant, used for quota checks
+            shared: Shared manager, never modified
+            local: Tenant-private manager of the same class
+        """
+        self.tenant = tenant
+        self.shared = shared
+        self.local = local
+        self.hidden = {}
+        spec = OVERLAY_SPECS[type(local).__name__]
+        for name, store in spec['lookups'].items():
+            setattr(self, name, self._lookup(name, store))
+        for name, store in spec['writes'].items():
+            setattr(self, name, self._write(name, store))
+        for name, store in spec['removes'].items():
+            setattr(self, name, self._remove(name, store))
+        for name, (store, sort_key) in spec['lists'].items():
+            setattr(self, name, self._list(name, store, sort_key))
+
+    def record_ids(self, store):
+        """
+        Get the IDs visible to the tenant in a record store.
+
+        Args:
+            store (str): Store attribute name such as 'courses'
+
+        Returns:
+            set: Visible record IDs
+        """
+        hidden = self.hidden.get(store, set())
+        shared = set(getattr(self.shared, store)) - hidden
+        return shared | set(getattr(self.local, store))
+
+    def local_count(self):
+        """
+        Count the records stored by the tenant.
+
+        Returns:
+            int: Tenant-specific records, overrides included
+        """
+        spec = OVERLAY_SPECS[type(self.local).__name__]
+        stores = set(spec['writes'].values())
+        return sum(len(getattr(self.local, store)) for store in stores)
+
+    def subscribe(self, callback):
+        """
+        Register a change callback on both the tenant and shared managers.
+
+        Args:
+            callback (callable): Function taking the changed record key
+        """
+        self.local.subscribe(callback)
+        self.shared.subscribe(callback)
+
+    def unsubscribe(self, callback):
+        """
+        Remove a callback registered with subscribe.
+
+        Args:
+            callback (callable): Callback passed to subscribe
+        """
+        self.local.unsubscribe(callback)
+        self.shared.unsubscribe(callback)
+
+    def _changed(self):
+        # Called after the tenant's view changed through this overlay
+        pass
+
+    def _masked(self, store):
+        # Shared records the tenant has replaced or removed
+        return self.hidden.get(store, set()) | getattr(self.local, store).keys()
+
+    def _lookup(self, name, store):
+        local_method = getattr(self.local, name)
+        shared_method = getattr(self.shared, name)
+        local_records = getattr(self.local, store)
+
+        def lookup(record_id, *args, **kwargs):
+            if record_id in local_records:
+                return local_method(record_id, *args, **kwargs)
+            if record_id in self.hidden.get(store, ()):
+                return local_method(record_id, *args, **kwargs)
+            return shared_method(record_id, *args, **kwargs)
+
+        lookup.__doc__ = local_method.__doc__
+        return lookup
+
+    def _write(self, name, store):
+        local_method = getattr(self.local, name)
+        local_records = getattr(self.local, store)
+
+        def write(record_id, *args, **kwargs):
+            if record_id not in local_records and not self.tenant.has_room():
+                return False
+            if not local_method(record_id, *args, **kwargs):
+                return False
+            self.hidden.get(store, set()).discard(record_id)
+            self._changed()
+            return True
+
+        write.__doc__ = local_method.__doc__
+        return write
+
+    def _remove(self, name, store):
+        local_method = getattr(self.local, name)
+        shared_records = getattr(self.shared, store)
+
+        def remove(record_id):
+            removed = local_method(record_id)
+            hidden = self.hidden.setdefault(store, set())
+            if record_id in shared_records and record_id not in hidden:
+                hidden.add(record_id)
+                removed = True
+            if removed:
+                self._changed()
+            return removed
+
+        remove.__doc__ = local_method.__doc__
+        return remove
+
+    def _list(self, name, store, sort_key):
+        local_method = getattr(self.local, name)
+        shared_method = getattr(self.shared, name)
+
+        def merged(*args, **kwargs):
+            masked = self._masked(store)
+            items = [item for item in shared_method(*args, **kwargs) if item['id'] not in masked]
+            items.extend(local_method(*args, **kwargs))
+            if sort_key is not None:
+                items.sort(key=sort_key)
+            return items
+
+        merged.__doc__ = local_method.__doc__
+        return merged
+
+
+class SummaryOverlay(TenantOverlay):
+    """Tenant view of a shared SummaryInfo with a tenant-private search index."""
+
+    def search(self, query, fields=None, limit=None):
+        """
+        Search the summaries visible to the tenant.
+
+        Tenant summaries are searched in the tenant's own index and shared
+        summaries in the shared index; each index scores against its own
+        collection statistics before the results are merged.
+
+        Args:
+            query (str): Words and quoted phrases that must all match
+            fields (list): Fields to search, defaults to all indexed fields
+            limit (int): Maximum number of results, None for all
+
+        Returns:
+            list: Matching summaries with 'id' and 'score', best first
+        """
+        masked = self._masked('summaries')
+        shared_limit = None if limit is None else limit + len(masked)
+        results = [item for item in self.shared.search(query, fields, shared_limit)
+                   if item['id'] not in masked]
+        results.extend(self.local.search(query, fields, limit))
+        results.sort(key=lambda item: (-item['score'], item['id']))
+        return results if limit is None else results[:limit]
+
+
+class LecturePrepOverlay(TenantOverlay):
+    """Tenant view of a shared LecturePreparation with catalog-wide prep totals."""
+
+    def get_catalog_prep_hours(self):
+        """
+        Get the total module time across all courses visible to the tenant.
+
+        Returns:
+            float: Hours
+        """
+        shared = self.shared
+        # The shared total is a whole number of minutes
+        minutes = round(shared.get_catalog_prep_hours() * 60)
+        for course_id in self._masked('prep_materials'):
+            minutes -= shared.get_total_minutes(course_id) or 0
+        return minutes / 60 + self.local.get_catalog_prep_hours()
+
+    def get_prep_hours_by_level(self, course_details):
+        """
+        Get total module time of the visible courses grouped by course level.
+
+        Args:
+            course_details: Source of course levels, such as the tenant's
+                course overlay; courses without details are grouped under
+                'Unknown'
+
+        Returns:
+            dict: Level to total hours
+        """
+        by_level = {}
+        for course_id in self.record_ids('prep_materials'):
+            course = course_details.get_course(course_id)
+            level = course['level'] if course else 'Unknown'
+            by_level[level] = by_level.get(level, 0) + (self.get_total_minutes(course_id) or 0)
+        return {level: minutes / 60 for level, minutes in by_level.items()}
+
+
+class TechLearningOverlay(TenantOverlay):
+    """
+    Tenant view of a shared TechLearning with a dependency graph over the
+    technologies and learning paths visible to the tenant.
+
+    The graph is built on first use and rebuilt after the tenant's next
+    change. A tenant record whose dependencies would close a cycle with the
+    shared records keeps no dependencies in the merged graph.
+    """
+
+    def __init__(self, tenant, shared, local):
+        """
+        Initialize the TechLearningOverlay.
+
+        Args:
+            tenant (Tenant): Owning tenant, used for quota checks
+            shared (TechLearning): Shared manager, never modified
+            local (TechLearning): Tenant-private manager
+        """
+        super().__init__(tenant, shared, local)
+        self._dependencies = None
+
+    def get_all_prerequisites(self, item_id):
+        """
+        Get every visible learning path and technology that must be studied
+        before a learning path or technology.
+
+        Args:
+            item_id (str): Learning path or technology ID
+
+        Returns:
+            list: Sorted prerequisite IDs
+        """
+        return sorted(self._graph().prerequisites(item_id))
+
+    def get_study_order(self, item_ids):
+        """
+        Get a valid study order for reaching the given paths or technologies.
+
+        Args:
+            item_ids (list): Target learning path or technology IDs
+
+        Returns:
+            list: IDs ordered so that prerequisites come first
+        """
+        return self._graph().study_order(item_ids)
+
+    def get_skill_path(self, from_id, to_id):
+        """
+        Get the shortest chain of steps leading from one skill to another.
+
+        Args:
+            from_id (str): Learning path or technology already mastered
+            to_id (str): Learning path or technology to reach
+
+        Returns:
+            list: IDs from from_id to to_id, or None if to_id does not build on from_id
+        """
+        return self._graph().shortest_path(from_id, to_id)
+
+    def _changed(self):
+        self._dependencies = None
+
+    def _graph(self):
+        if self._dependencies is None:
+            graph = PrerequisiteGraph()
+            for tech_id in sorted(self.record_ids('technologies')):
+                tech = self.get_technology(tech_id)
+                graph.set_dependencies(tech_id, tech.get('prerequisites', []))
+            for path_id in sorted(self.record_ids('learning_paths')):
+                path = self.get_learning_path(path_id)
+                graph.set_dependencies(
+                    path_id, list(path.get('requires', [])) + list(path['technologies']))
+            self._dependencies = graph
+        return self._dependencies
+
+
+class Tenant:
+    """A training partner's catalog layered over the shared catalog."""
+
+    def __init__(self, tenant_id, shared, max_records=None, intern_pool=None):
+        """
+        Initialize the Tenant.
+
+        Args:
+            tenant_id (str): Unique identifier for the tenant
+            shared (dict): Shared managers keyed 'course_details',
+                'summary_info', 'lecture_prep' and 'tech_learning'
+            max_records (int): Maximum catalog records the tenant may store
+                across the overlays, None for no limit; qualifications are
+                not counted
+            intern_pool (InternPool): Optional pool shared with the shared
+                catalog so overrides reuse its strings
+        """
+        self.tenant_id = tenant_id
+        self.max_records = max_records
+        self.course_details = TenantOverlay(
+            self, shared['course_details'], CourseDetails(intern_pool=intern_pool))
+        self.summary_info = SummaryOverlay(
+            self, shared['summary_info'], SummaryInfo(intern_pool=intern_pool))
+        self.lecture_prep = LecturePrepOverlay(
+            self, shared['lecture_prep'], LecturePreparation(intern_pool=intern_pool))
+        self.tech_learning = TechLearningOverlay(
+            self, shared['tech_learning'], TechLearning(intern_pool=intern_pool))
+        # Qualifications belong to a partner's own trainers and are never shared
+        self.qual_manager = QualificationManager()
+
+    def overlays(self):
+        """
+        Get the tenant's overlay managers.
+
+        Returns:
+            dict: Overlays keyed like the shared managers
+        """
+        return {
+            'course_details': self.course_details,
+            'summary_info': self.summary_info,
+            'lecture_prep': self.lecture_prep,
+            'tech_learning': self.tech_learning,
+        }
+
+    def record_count(self):
+        """
+        Count the catalog records stored by the tenant.
+
+        Returns:
+            int: Tenant-specific and overriding records across the overlays
+        """
+        return sum(overlay.local_count() for overlay in self.overlays().values())
+
+    def has_room(self):
+        """
+        Check whether the tenant may store another record.
+
+        Returns:
+            bool: True if under quota
+        """
+        return self.max_records is None or self.record_count() < self.max_records
+
+    def stats(self):
+        """
+        Get the tenant's storage statistics.
+
+        Returns:
+            dict: Stored records, hidden shared records and quota
+        """
+        return {
+            'records': self.record_count(),
+            'hidden': sum(len(ids) for overlay in self.overlays().values()
+                          for ids in overlay.hidden.values()),
+            'max_records': self.max_records,
+        }
+
+
+class TenantCatalog:
+    """Registry of tenants sharing one read-only base catalog."""
+
+    def __init__(self, course_details=None, summary_info=None, lecture_prep=None,
+                 tech_learning=None, max_records=None, intern_pool=None):
+        """
+        Initialize the TenantCatalog.
+
+        Args:
+            course_details (CourseDetails): Shared course records
+            summary_info (SummaryInfo): Shared summaries
+            lecture_prep (LecturePreparation): Shared preparation materials
+            tech_learning (TechLearning): Shared technologies and paths
+            max_records (int): Default per-tenant record quota
+            intern_pool (InternPool): Optional pool used by tenant managers
+
+        Managers not given are replaced by empty ones. Shared managers must
+        not be modified while tenants are in use.
+        """
+        given = {
+            'course_details': course_details,
+            'summary_info': summary_info,
+            'lecture_prep': lecture_prep,
+            'tech_learning': tech_learning,
+        }
+        self.shared = {name: manager if manager is not None else _MANAGER_CLASSES[name]()
+                       for name, manager in given.items()}
+        self.max_records = max_records
+        self.intern_pool = intern_pool
+        self.tenants = {}
+
+    def create_tenant(self, tenant_id, max_records=None):
+        """
+        Create a tenant.
+
+        Args:
+            tenant_id (str): Unique identifier for the tenant
+            max_records (int): Record quota, defaults to the catalog default
+
+        Returns:
+            Tenant: The new tenant, or None if the ID is empty or taken
+        """
+        if not tenant_id or tenant_id in self.tenants:
+            return None
+        quota = self.max_records if max_records is None else max_records
+        tenant = Tenant(tenant_id, self.shared, quota, self.intern_pool)
+        self.tenants[tenant_id] = tenant
+        return tenant
+
+    def get_tenant(self, tenant_id):
+        """
+        Retrieve a tenant by ID.
+
+        Args:
+            tenant_id (str): Unique identifier for the tenant
+
+        Returns:
+            Tenant: The tenant or None if not found
+        """
+        return self.tenants.get(tenant_id)
+
+    def remove_tenant(self, tenant_id):
+        """
+        Remove a tenant and its records.
+
+        Args:
+            tenant_id (str): Unique identifier for the tenant
+
+        Returns:
+            bool: True if the tenant existed and was removed
+        """
+        return self.tenants.pop(tenant_id, None) is not None
+
+    def list_tenants(self):
+        """
+        List tenant IDs.
+
+        Returns:
+            list: Sorted tenant IDs
+        """
+        return sorted(self.tenants)
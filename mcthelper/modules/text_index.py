@@ -0,0 +1,191 @@
+"""
+Text Index Module
+
+Positional inverted index with BM25 ranking, field weights and phrase
+queries, maintained incrementally as documents are added or replaced.
+"""
+
+import math
+import re
+
+
+TOKEN_PATTERN = re.compile(r'\w+(?:[-.]\w+)*')
+QUERY_PATTERN = re.compile(r'"([^"]*)"|(\S+)')
+
+# Position gap between list items and fields so phrases never span them
+POSITION_GAP = 16
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def tokenize(text):
+    """
+    Split text into lowercase search tokens.
+
+    Hyphenated and dotted identifiers such as 'AZ-900' stay one token.
+
+    Args:
+        text (str): Text to tokenize
+
+    Returns:
+        list: Lowercase tokens
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def parse_query(query):
+    """
+    Split a query into phrases.
+
+    Quoted text is one phrase; every other word is a single-token phrase.
+
+    Args:
+        query (str): Query such as 'engineers "Azure Fundamentals"'
+
+    Returns:
+        list: Token lists, one per phrase
+    """
+    phrases = []
+    for quoted, word in QUERY_PATTERN.findall(query):
+        tokens = tokenize(quoted if quoted else word)
+        if tokens:
+            phrases.append(tokens)
+    return phrases
+
+
+class InvertedIndex:
+    """Incrementally maintained positional inverted index."""
+
+    def __init__(self, field_weights=None):
+        """
+        Initialize the InvertedIndex.
+
+        Args:
+            field_weights (dict): Relevance weight per field name, default 1.0
+        """
+        self.field_weights = dict(field_weights or {})
+        self.postings = {}
+        self.doc_terms = {}
+        self.doc_lengths = {}
+        self.total_length = 0
+
+    def __len__(self):
+        """Return the number of indexed documents."""
+        return len(self.doc_lengths)
+
+    def add_document(self, doc_id, fields):
+        """
+        Index a document, replacing any previous version.
+
+        Args:
+            doc_id (str): Document identifier
+            fields (dict): Field name to text or list of texts; values and
+                list items that are not strings are not indexed
+        """
+        self.remove_document(doc_id)
+        length = 0
+        terms = set()
+        for field, value in fields.items():
+            if isinstance(value, str):
+                texts = [value]
+            elif isinstance(value, (list, tuple)):
+                texts = [text for text in value if isinstance(text, str)]
+            else:
+                texts = []
+            position = 0
+            for text in texts:
+                for token in tokenize(text):
+                    posting = self.postings.setdefault(token, {}).setdefault(doc_id, {})
+                    posting.setdefault(field, []).append(position)
+                    terms.add(token)
+                    position += 1
+                    length += 1
+                position += POSITION_GAP
+        self.doc_terms[doc_id] = terms
+        self.doc_lengths[doc_id] = length
+        self.total_length += length
+
+    def remove_document(self, doc_id):
+        """
+        Remove a document from the index.
+
+        Args:
+            doc_id (str): Document identifier
+        """
+        terms = self.doc_terms.pop(doc_id, None)
+        if terms is None:
+            return
+        for token in terms:
+            posting = self.postings[token]
+            del posting[doc_id]
+            if not posting:
+                del self.postings[token]
+        self.total_length -= self.doc_lengths.pop(doc_id)
+
+    def search(self, query, fields=None, limit=None):
+        """
+        Find documents matching every word and quoted phrase in a query.
+
+        Args:
+            query (str): Query text; wrap phrases in double quotes
+            fields (iterable): Restrict matching to these fields
+            limit (int): Maximum number of results
+
+        Returns:
+            list: (doc_id, score) tuples, best first
+        """
+        phrases = parse_query(query)
+        if not phrases:
+            return []
+        fields = set(fields) if fields else None
+
+        # Start from the rarest token to keep the candidate set small
+        tokens = {token for phrase in phrases for token in phrase}
+        if any(token not in self.postings for token in tokens):
+            return []
+        rarest = min(tokens, key=lambda token: len(self.postings[token]))
+        candidates = set(self.postings[rarest])
+        for token in tokens:
+            candidates.intersection_update(self.postings[token])
+            if not candidates:
+                return []
+
+        count = len(self.doc_lengths)
+        average_length = self.total_length / count if count else 0
+        results = []
+        for doc_id in candidates:
+            score = 0.0
+            for phrase in phrases:
+                frequency = self._phrase_frequency(phrase, doc_id, fields)
+                if not frequency:
+                    score = None
+                    break
+                score += self._bm25(phrase, doc_id, frequency, count, average_length)
+            if score is not None:
+                results.append((doc_id, score))
+
+        results.sort(key=lambda item: (-item[1], item[0]))
+        return results[:limit] if limit else results
+
+    def _phrase_frequency(self, phrase, doc_id, fields):
+        postings = [self.postings[token][doc_id] for token in phrase]
+        frequency = 0.0
+        for field, positions in postings[0].items():
+            if fields is not None and field not in fields:
+                continue
+            if len(phrase) == 1:
+                matches = len(positions)
+            else:
+                following = [set(p.get(field, ())) for p in postings[1:]]
+                matches = sum(1 for start in positions
+                              if all(start + offset in tokens
+                                     for offset, tokens in enumerate(following, 1)))
+            frequency += matches * self.field_weights.get(field, 1.0)
+        return frequency
+
+    def _bm25(self, phrase, doc_id, frequency, count, average_length):
+        document_frequency = min(len(self.postings[token]) for token in phrase)
+        idf = math.log(1 + (count - document_frequency + 0.5) / (document_frequency + 0.5))
+        norm = 1 - BM25_B + BM25_B * self.doc_lengths[doc_id] / (average_length or 1)
+        return idf * frequency * (BM25_K1 + 1) / (frequency + BM25_K1 * norm)
@@ -0,0 +1,171 @@
+"""
+Versioning Module
+
+Revision history for course and summary records. Each revision is a
+snapshot: a private dictionary whose lists are frozen into tuples, so
+later edits to the caller's dictionaries cannot rewrite history. Unchanged
+field values are shared with the revision before it, and revisions are
+found by number or by date with a binary search over their timestamps.
+"""
+
+from bisect import bisect_right
+from datetime import date, datetime, time
+
+from .clock import SystemClock
+
+
+class VersionHistory:
+    """Copy-on-write revision history keyed by record ID."""
+
+    def __init__(self, clock=None):
+        """
+        Initialize the VersionHistory.
+
+        Args:
+            clock (SystemClock | ManualClock): Clock timestamping revisions,
+                defaults to the system clock
+        """
+        self.clock = clock or SystemClock()
+        self._records = {}
+        self._timestamps = {}
+
+    def __contains__(self, key):
+        """Check whether a record has any history."""
+        return key in self._records
+
+    def record(self, key, record):
+        """
+        Store a snapshot of a new revision of a record.
+
+        Lists are stored as tuples. Field values equal to those of the
+        previous revision are replaced by the previous revision's objects,
+        so unchanged fields are stored once.
+
+        Args:
+            key (str): Record ID
+            record (dict): New record, or None when the record was removed
+
+        Returns:
+            dict: A copy of the stored revision for the caller to keep,
+                sharing its (immutable) values; None for removals
+        """
+        records = self._records.setdefault(key, [])
+        timestamps = self._timestamps.setdefault(key, [])
+        previous = records[-1] if records else None
+        if record is not None:
+            record = {field: _frozen(value) for field, value in record.items()}
+            if previous is not None:
+                record = {field: _shared(previous, field, value)
+                          for field, value in record.items()}
+        now = self.clock.now()
+        # Keep timestamps sorted even if the clock is set back
+        if timestamps and now < timestamps[-1]:
+            now = timestamps[-1]
+        records.append(record)
+        timestamps.append(now)
+        return None if record is None else dict(record)
+
+    def get(self, key, version=None, as_of=None):
+        """
+        Retrieve a revision.
+
+        Args:
+            key (str): Record ID
+            version (int): Revision number starting at 1, defaults to latest
+            as_of (date | datetime | str): Return the revision current at
+                this time; dates and 'YYYY-MM-DD' strings mean the end of
+                that day
+
+        Returns:
+            dict: A copy of the revision, or None if it does not exist or
+                the record was removed at that point
+        """
+        records = self._records.get(key)
+        if not records:
+            return None
+        if version is not None:
+            if not 1 <= version <= len(records):
+                return None
+            revision = records[version - 1]
+        elif as_of is not None:
+            position = bisect_right(self._timestamps[key], _as_of_datetime(as_of))
+            revision = records[position - 1] if position else None
+        else:
+            revision = records[-1]
+        return None if revision is None else dict(revision)
+
+    def versions(self, key):
+        """
+        Describe the revisions of a record.
+
+        Args:
+            key (str): Record ID
+
+        Returns:
+            list: Dictionaries with 'version', 'timestamp' (ISO format),
+                'removed' and the sorted 'changed_fields' of each revision
+        """
+        history = []
+        previous = None
+        for number, (record, timestamp) in enumerate(
+                zip(self._records.get(key, ()), self._timestamps.get(key, ())), 1):
+            if record is None:
+                changed = []
+            elif previous is None:
+                changed = sorted(record)
+            else:
+                changed = sorted(field for field in set(record) | set(previous)
+                                 if record.get(field, _ABSENT) is not previous.get(field, _ABSENT))
+            history.append({
+                'version': number,
+                'timestamp': timestamp.isoformat(),
+                'removed': record is None,
+                'changed_fields': changed,
+            })
+            previous = record
+        return history
+
+    def latest_version(self, key):
+        """
+        Get the number of the latest revision.
+
+        Args:
+            key (str): Record ID
+
+        Returns:
+            int: Revision number, 0 if the record has no history
+        """
+        return len(self._records.get(key, ()))
+
+
+_ABSENT = object()
+
+
+def _frozen(value):
+    # Lists become tuples and dictionaries are copied, recursively; tuples
+    # whose items need no change are kept, so interned tuples stay shared
+    if isinstance(value, (list, tuple)):
+        items = tuple(_frozen(item) for item in value)
+        if isinstance(value, tuple) and all(a is b for a, b in zip(items, value)):
+            return value
+        return items
+    if isinstance(value, dict):
+        return {key: _frozen(item) for key, item in value.items()}
+    return value
+
+
+def _shared(previous, field, value):
+    old = previous.get(field, _ABSENT)
+    if old is value or old is _ABSENT:
+        return value
+    return old if type(old) is type(value) and old == value else value
+
+
+def _as_of_datetime(as_of):
+    if isinstance(as_of, str):
+        as_of = datetime.strptime(as_of, '%Y-%m-%d').date()
+    if isinstance(as_of, datetime):
+        return as_of
+    if isinstance(as_of, date):
+        return datetime.combine(as_of, time.max)
+    raise TypeError(f'Unsupported as_of value: {as_of!r}')
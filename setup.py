@@ -5,7 +5,10 @@ setup(
     version="1.0.0",
     description="A support tool for Microsoft Certified Trainers (MCTs)",
     author="MCT Support Team",
-    packages=find_packages(),
+    packages=find_packages(exclude=['tests', 'tests.*', 'benchmarks', 'benchmarks.*']),
     install_requires=[],
+    entry_points={
+        'console_scripts': ['mcthelper=mcthelper.cli:main'],
+    },
     python_requires='>=3.7',
 )
@@ -0,0 +1,13 @@
+"""
+Shared test fixtures
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def completion_cache_dir(tmp_path, monkeypatch):
+    """Keep completion cache files written by cli.main() out of ~/.cache."""
+    directory = tmp_path / 'completion-cache'
+    monkeypatch.setenv('MCTHELPER_CACHE_DIR', str(directory))
+    return directory
@@ -0,0 +1,197 @@
+"""
+Tests for assignment module
+"""
+
+import random
+import pytest
+from mcthelper.modules.assignment import TrainerAssigner
+from mcthelper.modules.lecture_prep import LecturePreparation
+from mcthelper.modules.qualifications import QualificationManager
+
+
+def qual(expiry_date, status='active'):
+    """Build qualification data expiring on the given date."""
+    return {
+        'certification_date': '2024-01-01',
+        'expiry_date': expiry_date,
+        'status': status
+    }
+
+
+def session(session_id, course_id, day='2025-03-03', **extra):
+    """Build a session dictionary."""
+    return dict(session_id=session_id, course_id=course_id, date=day, **extra)
+
+
+def max_matching_size(candidates, limits):
+    """Reference maximum matching by simple depth-first augmenting paths."""
+    assigned = {trainer: [] for trainer in limits}
+
+    def try_assign(s, seen):
+        for trainer in candidates[s]:
+            if trainer in seen:
+                continue
+            seen.add(trainer)
+            if len(assigned[trainer]) < limits[trainer]:
+                assigned[trainer].append(s)
+                return True
+            for other in list(assigned[trainer]):
+                if try_assign(other, seen):
+                    assigned[trainer].remove(other)
+                    assigned[trainer].append(s)
+                    return True
+        return False
+
+    return sum(try_assign(s, set()) for s in range(len(candidates)))
+
+
+class TestTrainerAssigner:
+    """Test cases for TrainerAssigner class."""
+
+    def test_assigns_qualified_trainers(self):
+        """Test that sessions go to trainers qualified for the course."""
+        qm = QualificationManager()
+        qm.add_qualification('TRAINER-001', 'AZ-900', qual('2026-01-01'))
+        qm.add_qualification('TRAINER-002', 'AZ-104', qual('2026-01-01'))
+        result = TrainerAssigner(qm).assign([
+            session('S1', 'AZ-104'), session('S2', 'AZ-900'), session('S3', 'AZ-305')])
+        assert result['assignments'] == {'S1': 'TRAINER-002', 'S2': 'TRAINER-001'}
+        assert result['unassigned'] == ['S3']
+
+    def test_ignores_inactive_and_expiring(self):
+        """Test that inactive or expired-by-session-end qualifications are skipped."""
+        qm = QualificationManager()
+        qm.add_qualification('TRAINER-001', 'AZ-900', qual('2026-01-01', status='pending'))
+        qm.add_qualification('TRAINER-002', 'AZ-900', qual('2025-03-02'))
+        qm.add_qualification('TRAINER-003', 'AZ-900', qual('2025-03-03'))
+        assigner = TrainerAssigner(qm)
+        assert assigner.eligible_trainers('AZ-900', '2025-03-03') == ['TRAINER-003']
+        assert assigner.eligible_trainers('AZ-900', '2025-03-03', days=2) == []
+
+    def test_session_length_from_timing(self):
+        """Test that module timing extends the session past an expiry date."""
+        qm = QualificationManager()
+        lp = LecturePreparation()
+        lp.add_prep_material('AZ-104', {
+            'slides': [], 'labs': [], 'demos': [], 'resources': [],
+            'timing': {'Module 1': '6 hours', 'Module 2': '4 hours', 'Module 3': '90 minutes'}
+        })
+        qm.add_qualification('TRAINER-001', 'AZ-104', qual('2025-03-03'))
+        qm.add_qualification('TRAINER-002', 'AZ-104', qual('2025-03-04'))
+        assigner = TrainerAssigner(qm, lp)
+        assert assigner.session_days('AZ-104') == 2
+        assert assigner.session_days('AZ-900') == 1
+        result = assigner.assign([session('S1', 'AZ-104')])
+        assert result['assignments'] == {'S1': 'TRAINER-002'}
+        result = assigner.assign([session('S1', 'AZ-104', days=1)], capacity=1)
+        assert result['assignments'] == {'S1': 'TRAINER-002'}
+
+    def test_capacity(self):
+        """Test per-trainer capacity limits."""
+        qm = QualificationManager()
+        qm.add_qualification('TRAINER-001', 'AZ-900', qual('2026-01-01'))
+        sessions = [session(f'S{i}', 'AZ-900', f'2025-03-0{3 + i}') for i in range(3)]
+        assigner = TrainerAssigner(qm)
+        assert len(assigner.assign(sessions)['assignments']) == 1
+        assert len(assigner.assign(sessions, capacity=2)['assignments']) == 2
+        assert len(assigner.assign(sessions, capacity={'TRAINER-001': 3})['assignments']) == 3
+
+    def test_reassigns_to_staff_more_sessions(self):
+        """Test that an earlier greedy choice is moved to free a trainer."""
+        qm = QualificationManager()
+        # TRAINER-001 runs longest, so the greedy pass gives it S1, but it is
+        # the only trainer who can deliver S2
+        qm.add_qualification('TRAINER-001', 'AZ-900', qual('2027-01-01'))
+        qm.add_qualification('TRAINER-001', 'AZ-104', qual('2027-01-01'))
+        qm.add_qualification('TRAINER-002', 'AZ-900', qual('2026-01-01'))
+        result = TrainerAssigner(qm).assign([session('S1', 'AZ-900'), session('S2', 'AZ-104')])
+        assert result['assignments'] == {'S1': 'TRAINER-002', 'S2': 'TRAINER-001'}
+        assert result['unassigned'] == []
+
+    def test_index_refreshed_on_change(self):
+        """Test that qualification changes are picked up."""
+        qm = QualificationManager()
+        assigner = TrainerAssigner(qm)
+        assert assigner.eligible_trainers('AZ-900', '2025-03-03') == []
+        qm.add_qualification('TRAINER-001', 'AZ-900', qual('2026-01-01'))
+        assert assigner.eligible_trainers('AZ-900', '2025-03-03') == ['TRAINER-001']
+        qm.remove_qualification('TRAINER-001', 'AZ-900')
+        assert assigner.eligible_trainers('AZ-900', '2025-03-03') == []
+
+    def test_matching_is_maximum(self):
+        """Test against a reference matching on random instances."""
+        rng = random.Random(7)
+        for _ in range(30):
+            qm = QualificationManager()
+            trainers = [f'T{t}' for t in range(rng.randint(1, 8))]
+            courses = [f'AZ-{100 + c}' for c in range(rng.randint(1, 5))]
+            for trainer in trainers:
+                for course in rng.sample(courses, rng.randint(1, len(courses))):
+                    qm.add_qualification(trainer, course, qual('2026-01-01'))
+            # One session per week, so no two sessions overlap
+            sessions = [session(f'S{i}', rng.choice(courses),
+                                f'2025-{1 + i // 4:02d}-{1 + 7 * (i % 4):02d}')
+                        for i in range(rng.randint(1, 20))]
+            limits = {trainer: rng.randint(1, 3) for trainer in trainers}
+
+            assigner = TrainerAssigner(qm)
+            result = assigner.assign(sessions, capacity=limits)
+            candidates = [assigner.eligible_trainers(s['course_id'], s['date']) for s in sessions]
+            assert len(result['assignments']) == max_matching_size(candidates, limits)
+
+            counts = {}
+            for s in sessions:
+                trainer = result['assignments'].get(s['session_id'])
+                if trainer is not None:
+                    assert trainer in candidates[sessions.index(s)]
+                    counts[trainer] = counts.get(trainer, 0) + 1
+            assert all(counts[t] <= limits[t] for t in counts)
+
+    def test_overlapping_sessions(self):
+        """Test that a trainer is never given sessions on the same days."""
+        qm = QualificationManager()
+        qm.add_qualification('TRAINER-001', 'AZ-900', qual('2027-01-01'))
+        qm.add_qualification('TRAINER-001', 'AZ-104', qual('2027-01-01'))
+        assigner = TrainerAssigner(qm)
+        sessions = [
+            session('S1', 'AZ-900', '2025-03-03', days=3),
+            session('S2', 'AZ-104', '2025-03-05', days=2),
+            session('S3', 'AZ-104', '2025-03-06', days=1),
+        ]
+        result = assigner.assign(sessions, capacity=3)
+        assert result['assignments'] == {'S1': 'TRAINER-001', 'S3': 'TRAINER-001'}
+        assert result['unassigned'] == ['S2']
+
+    def test_reassigns_around_overlaps(self):
+        """Test that augmenting paths move the session blocking the needed days."""
+        qm = QualificationManager()
+        # Greedy gives TRAINER-001 both S1 and S2; S3 overlaps S1 and only
+        # TRAINER-001 can deliver it, so S1 must move to TRAINER-002
+        qm.add_qualification('TRAINER-001', 'AZ-900', qual('2027-01-01'))
+        qm.add_qualification('TRAINER-001', 'AZ-104', qual('2027-01-01'))
+        qm.add_qualification('TRAINER-002', 'AZ-900', qual('2026-01-01'))
+        result = TrainerAssigner(qm).assign([
+            session('S1', 'AZ-900', '2025-03-03', days=2),
+            session('S2', 'AZ-900', '2025-03-10', days=2),
+            session('S3', 'AZ-104', '2025-03-04', days=1),
+        ], capacity=2)
+        assert result['assignments'] == {
+            'S1': 'TRAINER-002', 'S2': 'TRAINER-001', 'S3': 'TRAINER-001'}
+
+    def test_displaces_several_overlapping_sessions(self):
+        """Test moving every session that overlaps a longer one."""
+        qm = QualificationManager()
+        # Greedy gives B both Z sessions and A the Y session; R overlaps both
+        # Z sessions and only B can deliver it, so both must move to A
+        qm.add_qualification('B', 'AZ-900', qual('2027-01-01'))
+        qm.add_qualification('B', 'SC-900', qual('2027-01-01'))
+        qm.add_qualification('A', 'AZ-900', qual('2026-01-01'))
+        qm.add_qualification('A', 'AZ-104', qual('2026-01-01'))
+        result = TrainerAssigner(qm).assign([
+            session('Z1', 'AZ-900', '2025-03-03'),
+            session('Z2', 'AZ-900', '2025-03-05'),
+            session('Y', 'AZ-104', '2025-03-07'),
+            session('R', 'SC-900', '2025-03-03', days=3),
+        ], capacity={'A': 3, 'B': 2})
+        assert result['assignments'] == {'Z1': 'A', 'Z2': 'A', 'Y': 'A', 'R': 'B'}
+        assert result['unassigned'] == []
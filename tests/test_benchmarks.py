@@ -0,0 +1,82 @@
+"""
+Tests for the benchmark suite and synthetic catalog generator
+"""
+
+import json
+import pytest
+from benchmarks.generator import CatalogGenerator, course_ids
+from benchmarks.run import compare_results, run_benchmarks, main
+from benchmarks.suite import BENCHMARKS
+
+
+class TestCatalogGenerator:
+    """Test cases for CatalogGenerator class."""
+
+    def test_course_ids_unique(self):
+        """Test that generated course IDs are unique."""
+        ids = course_ids(5000)
+        assert len(ids) == len(set(ids)) == 5000
+
+    def test_same_seed_is_reproducible(self):
+        """Test that the same seed produces the same catalog."""
+        first = list(CatalogGenerator(scale=50, seed=7).summaries())
+        second = list(CatalogGenerator(scale=50, seed=7).summaries())
+        assert first == second
+
+    def test_different_seed_differs(self):
+        """Test that a different seed produces a different catalog."""
+        first = list(CatalogGenerator(scale=50, seed=7).courses())
+        second = list(CatalogGenerator(scale=50, seed=8).courses())
+        assert first != second
+
+    def test_build_populates_managers(self):
+        """Test that every generated record passes manager validation."""
+        catalog = CatalogGenerator(scale=100, seed=1).build()
+        assert len(catalog['course_details'].courses) == 100
+        assert len(catalog['summary_info'].summaries) == 100
+        assert len(catalog['lecture_prep'].prep_materials) == 100
+        assert len(catalog['qual_manager'].qualifications) == 10
+        assert len(catalog['tech_learning'].technologies) == 10
+        qm = catalog['qual_manager']
+        coverage = qm.get_course_coverage(list(catalog['course_details'].courses))
+        assert sum(1 for count in coverage.values() if count) > 10
+
+
+class TestBenchmarkRunner:
+    """Test cases for running and comparing benchmarks."""
+
+    def test_run_benchmarks(self):
+        """Test that a run produces timings for the selected benchmarks."""
+        document = run_benchmarks(scale=20, repeat=2, min_time=0.0,
+                                  pattern='course_details.*')
+        assert document['meta']['scale'] == 20
+        assert 'course_details.search_courses' in document['results']
+        assert 'qual_manager.check_expiry' not in document['results']
+        assert document['results']['course_details.get_course']['median'] > 0
+
+    @pytest.mark.parametrize('name', ['query.execute',
+                                      'qual_manager.get_trainers_qualified_for_all'])
+    def test_benchmark_results_not_empty(self, name):
+        """Test that a benchmark times non-empty results at the default scale."""
+        generator = CatalogGenerator(scale=1000, seed=42)
+        run = BENCHMARKS[name](generator.build(), generator)
+        assert run()
+
+    def test_compare_flags_regression(self):
+        """Test that slowdowns beyond the threshold are flagged."""
+        baseline = {'results': {'a': {'median': 1.0}, 'b': {'median': 1.0}}}
+        current = {'results': {'a': {'median': 1.05}, 'b': {'median': 1.5}}}
+        rows = {row['name']: row for row in compare_results(baseline, current, threshold=0.1)}
+        assert rows['a']['regression'] is False
+        assert rows['b']['regression'] is True
+        assert rows['b']['ratio'] == pytest.approx(1.5)
+
+    def test_compare_command_exit_code(self, tmp_path, capsys):
+        """Test that the compare command exits non-zero on regressions."""
+        baseline = tmp_path / 'baseline.json'
+        current = tmp_path / 'current.json'
+        baseline.write_text(json.dumps({'results': {'a': {'median': 1.0}}}))
+        current.write_text(json.dumps({'results': {'a': {'median': 2.0}}}))
+        assert main(['compare', str(baseline), str(current)]) == 1
+        assert main(['compare', str(baseline), str(baseline)]) == 0
+        assert 'REGRESSION' in capsys.readouterr().out
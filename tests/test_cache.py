@@ -0,0 +1,159 @@
+"""
+Tests for cache module
+"""
+
+import pytest
+from mcthelper.modules.cache import CachedManager, LRUCache, estimate_size
+from mcthelper.modules.course_details import CourseDetails
+from mcthelper.modules.qualifications import QualificationManager
+from mcthelper.modules.tech_learning import TechLearning
+
+
+COURSE = {
+    'name': 'Azure Fundamentals',
+    'description': 'Introduction to Azure',
+    'duration': 1,
+    'level': 'Beginner',
+    'topics': ['Cloud Concepts']
+}
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingCourses(CourseDetails):
+    """CourseDetails that counts backing store reads."""
+
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+
+    def get_course(self, course_id):
+        self.reads += 1
+        return super().get_course(course_id)
+
+
+class TestLRUCache:
+    """Test cases for LRUCache class."""
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest untouched entry is evicted first."""
+        cache = LRUCache(max_entries=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        assert cache.get('a') == 1
+        cache.put('c', 3)
+        assert 'b' not in cache
+        assert cache.get('a') == 1 and cache.get('c') == 3
+        assert cache.stats()['evictions'] == 1
+
+    def test_ttl_and_negative_ttl(self):
+        """Test that entries and cached misses expire separately."""
+        clock = FakeClock()
+        cache = LRUCache(ttl=10, negative_ttl=2, clock=clock)
+        cache.put('hit', 'value')
+        cache.put('miss', None, negative=True)
+        clock.now = 3
+        assert cache.get('hit') == 'value'
+        assert cache.get('miss', 'default') == 'default'
+        clock.now = 10
+        assert cache.get('hit') is None
+        assert cache.stats()['expirations'] == 2
+
+    def test_negative_caching_disabled(self):
+        """Test that a zero negative TTL stores no misses."""
+        cache = LRUCache(negative_ttl=0)
+        assert cache.put('miss', None, negative=True) is False
+        assert len(cache) == 0
+
+    def test_byte_budget(self):
+        """Test that the cache stays within its memory budget."""
+        value = 'x' * 1000
+        size = estimate_size(value)
+        cache = LRUCache(max_bytes=size * 3)
+        for i in range(10):
+            cache.put(i, value)
+        assert len(cache) == 3
+        assert cache.bytes <= size * 3
+        assert cache.put('huge', 'x' * 10000) is False
+        cache.clear()
+        assert cache.bytes == 0
+
+    def test_stats_hit_rate(self):
+        """Test hit, negative hit and miss counting."""
+        cache = LRUCache()
+        cache.put('a', 1)
+        cache.put('b', None, negative=True)
+        cache.get('a')
+        cache.get('b')
+        cache.get('c')
+        stats = cache.stats()
+        assert (stats['hits'], stats['negative_hits'], stats['misses']) == (1, 1, 1)
+        assert stats['hit_rate'] == pytest.approx(2 / 3)
+
+
+class TestCachedManager:
+    """Test cases for CachedManager class."""
+
+    def test_hot_reads_served_from_cache(self):
+        """Test that repeated lookups read the backing store once."""
+        cd = CountingCourses()
+        cd.add_course('AZ-900', COURSE)
+        cached = CachedManager(cd)
+        for _ in range(5):
+            assert cached.get_course('AZ-900')['name'] == 'Azure Fundamentals'
+        assert cd.reads == 1
+        assert cached.stats()['hits'] == 4
+
+    def test_negative_cache_invalidated_on_add(self):
+        """Test that a cached miss is dropped when the record is added."""
+        cd = CountingCourses()
+        cached = CachedManager(cd)
+        assert cached.get_course('AZ-900') is None
+        assert cached.get_course('AZ-900') is None
+        assert cd.reads == 1
+        cached.add_course('AZ-900', COURSE)
+        assert cached.get_course('AZ-900')['name'] == 'Azure Fundamentals'
+        assert cd.reads == 2
+
+    def test_passes_through_other_attributes(self):
+        """Test that writes and uncached methods reach the manager."""
+        cd = CourseDetails()
+        cached = CachedManager(cd)
+        assert cached.add_course('AZ-900', COURSE) is True
+        assert cached.search_courses('Azure')[0]['id'] == 'AZ-900'
+        assert cached.courses is cd.courses
+
+    def test_qualification_changes_invalidate_trainer(self):
+        """Test invalidation from (trainer, course) notification keys."""
+        qm = QualificationManager()
+        cached = CachedManager(qm)
+        assert cached.get_qualifications('TRAINER-001') == {}
+        qm.add_qualification('TRAINER-001', 'AZ-900', {
+            'certification_date': '2024-01-01', 'expiry_date': '2026-01-01', 'status': 'active'})
+        assert 'AZ-900' in cached.get_qualifications('TRAINER-001')
+
+    def test_technology_changes_invalidate(self):
+        """Test invalidation from (kind, id) notification keys."""
+        tl = TechLearning()
+        cached = CachedManager(tl)
+        assert cached.get_technology('TECH-1') is None
+        tl.add_technology('TECH-1', {
+            'name': 'Azure AI', 'category': 'AI', 'description': 'AI services',
+            'latest_version': '1.0', 'resources': []})
+        assert cached.get_technology('TECH-1')['name'] == 'Azure AI'
+
+    def test_evicted_keys_are_forgotten(self):
+        """Test that the invalidation index does not outgrow the cache."""
+        cd = CourseDetails()
+        cached = CachedManager(cd, max_entries=10)
+        for i in range(100):
+            cached.get_course(f'AZ-{i}')
+        assert len(cached._keys_by_record) == 10
@@ -0,0 +1,32 @@
+"""
+Tests for clock module
+"""
+
+import pytest
+from datetime import date, datetime
+from mcthelper.modules.clock import ManualClock, SystemClock
+
+
+class TestClocks:
+    """Test cases for SystemClock and ManualClock classes."""
+
+    def test_system_clock(self):
+        """Test that the system clock reports today's date."""
+        assert SystemClock().today() == date.today()
+
+    def test_manual_clock_set(self):
+        """Test setting a manual clock from strings and dates."""
+        clock = ManualClock('2025-01-01')
+        assert clock.today() == date(2025, 1, 1)
+        clock.set(date(2025, 2, 1))
+        assert clock.now() == datetime(2025, 2, 1)
+
+    def test_manual_clock_advance(self):
+        """Test fast-forwarding a manual clock."""
+        clock = ManualClock('2025-01-01')
+        clock.advance(days=30)
+        assert clock.today() == date(2025, 1, 31)
+        clock.advance(hours=23)
+        assert clock.today() == date(2025, 1, 31)
+        clock.advance(hours=1)
+        assert clock.today() == date(2025, 2, 1)
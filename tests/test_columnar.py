@@ -0,0 +1,100 @@
+"""
+Tests for columnar module
+"""
+
+import json
+import struct
+import pytest
+from benchmarks.generator import CatalogGenerator
+from mcthelper.modules.columnar import (
+    MAGIC, read_qualification_columns, write_qualification_columns)
+from mcthelper.modules.qualifications import QualificationManager
+
+
+@pytest.fixture(scope='module')
+def qual_manager():
+    """Synthetic qualifications for a few hundred trainers."""
+    return CatalogGenerator(scale=3000, seed=11).build()['qual_manager']
+
+
+def read_header(path):
+    """Decode the JSON header of a columnar file."""
+    with open(path, 'rb') as handle:
+        data = handle.read()
+    (length,) = struct.unpack_from('<I', data, len(MAGIC))
+    start = len(MAGIC) + 4
+    return json.loads(data[start:start + length])
+
+
+class TestColumnar:
+    """Test cases for the columnar qualification format."""
+
+    @pytest.mark.parametrize('compress', [True, False])
+    def test_round_trip(self, tmp_path, qual_manager, compress):
+        """Test that every row reads back unchanged."""
+        path = str(tmp_path / 'quals.col')
+        rows = write_qualification_columns(qual_manager, path, compress=compress)
+        columns = read_qualification_columns(path)
+        assert rows == len(columns) == sum(len(c) for c in qual_manager.qualifications.values())
+        assert columns.to_manager().qualifications == qual_manager.qualifications
+
+    def test_header_describes_columns(self, tmp_path, qual_manager):
+        """Test the self-describing header and narrow column types."""
+        path = str(tmp_path / 'quals.col')
+        write_qualification_columns(qual_manager, path)
+        header = read_header(path)
+        assert header['format'] == 'mcthelper-qualifications'
+        types = {s['name']: s.get('type') for s in header['sections'] if s['kind'] == 'column'}
+        assert types == {'trainer': 'H', 'course': 'H', 'certification_date': 'i',
+                         'expiry_date': 'i', 'status': 'B'}
+        columns = read_qualification_columns(path)
+        assert columns.certification_date.itemsize == 4
+        assert columns.status.typecode == 'B'
+
+    def test_compression_shrinks_file(self, tmp_path, qual_manager):
+        """Test that compressed columns are much smaller than raw ones."""
+        raw = tmp_path / 'raw.col'
+        packed = tmp_path / 'packed.col'
+        write_qualification_columns(qual_manager, str(raw), compress=False)
+        write_qualification_columns(qual_manager, str(packed))
+        assert packed.stat().st_size < raw.stat().st_size / 2
+
+    def test_aggregates(self, tmp_path, qual_manager):
+        """Test status and per-course counts computed on the columns."""
+        path = str(tmp_path / 'quals.col')
+        write_qualification_columns(qual_manager, path)
+        columns = read_qualification_columns(path)
+        quals = [(t, c, q) for t, courses in qual_manager.qualifications.items()
+                 for c, q in courses.items()]
+        expected_status = {}
+        expected_active = {}
+        for _, course_id, qual in quals:
+            expected_status[qual['status']] = expected_status.get(qual['status'], 0) + 1
+            if qual['status'] == 'active':
+                expected_active[course_id] = expected_active.get(course_id, 0) + 1
+        assert columns.status_counts() == expected_status
+        assert columns.trainers_per_course() == expected_active
+        assert sum(columns.trainers_per_course(None).values()) == len(quals)
+        assert columns.trainers_per_course('revoked') == {}
+
+    def test_bad_dates_and_statuses(self, tmp_path):
+        """Test that unparsable dates read back as None and odd statuses as text."""
+        qm = QualificationManager()
+        qm.add_qualification('T-1', 'AZ-900', {'certification_date': 'soon',
+                                               'expiry_date': '2025-06-30', 'status': None})
+        path = str(tmp_path / 'quals.col')
+        write_qualification_columns(qm, path)
+        assert read_qualification_columns(path).row(0) == (
+            'T-1', 'AZ-900',
+            {'certification_date': None, 'expiry_date': '2025-06-30', 'status': ''})
+
+    def test_empty_and_invalid_files(self, tmp_path):
+        """Test empty exports and rejection of other files."""
+        path = str(tmp_path / 'empty.col')
+        assert write_qualification_columns(QualificationManager(), path) == 0
+        columns = read_qualification_columns(path)
+        assert len(columns) == 0 and columns.status_counts() == {}
+        other = tmp_path / 'other.bin'
+        other.write_bytes(b'PK\x03\x04 not ours')
+        with pytest.raises(ValueError):
+            read_qualification_columns(str(other))
@@ -0,0 +1,108 @@
+"""
+Tests for completion module
+"""
+
+import shutil
+import subprocess
+import pytest
+from mcthelper.modules.completion import (
+    CompletionCache, completion_script, default_cache_directory)
+from mcthelper.modules.course_details import CourseDetails
+from mcthelper.modules.tech_learning import TechLearning
+
+
+COMMANDS = {'list-courses': 'List all available courses', 'course-details': 'Show course details',
+            'summary': 'Show course summary'}
+ID_COMMANDS = {'course-details': 'courses', 'summary': 'courses'}
+
+
+def add_course(cd, course_id):
+    """Add a course with the required fields."""
+    cd.add_course(course_id, {'name': course_id, 'description': '', 'duration': 1,
+                              'level': 'Beginner', 'topics': []})
+
+
+class TestCompletionCache:
+    """Test cases for CompletionCache."""
+
+    def test_write_read_and_complete(self, tmp_path):
+        """Test sorted, de-duplicated files and prefix search."""
+        cache = CompletionCache(str(tmp_path / 'cache'))
+        cache.write('courses', ['DP-100', 'AZ-900', 'AZ-104', 'AZ-104', 'bad\nid', 'Ünïcode'])
+        assert cache.read('courses') == ['AZ-104', 'AZ-900', 'DP-100', 'Ünïcode']
+        assert cache.complete('courses', 'AZ') == ['AZ-104', 'AZ-900']
+        assert cache.complete('courses', 'AZ-9') == ['AZ-900']
+        assert cache.complete('courses', '') == cache.read('courses')
+        assert cache.complete('courses', 'ZZ') == []
+        assert cache.complete('technologies', '') == []
+
+    def test_refresh_follows_catalog_changes(self, tmp_path):
+        """Test that files are rewritten only when the IDs change."""
+        cd = CourseDetails()
+        tl = TechLearning()
+        add_course(cd, 'AZ-900')
+        cache = CompletionCache(str(tmp_path))
+        assert cache.attach('courses', cd)
+        assert cache.attach('technologies', tl)
+        assert not cache.attach('trainers', cd)
+        assert cache.refresh() == ['courses', 'technologies']
+        assert cache.refresh() == []
+        add_course(cd, 'AZ-104')
+        add_course(cd, 'AZ-900')
+        assert cache.refresh() == ['courses']
+        assert cache.read('courses') == ['AZ-104', 'AZ-900']
+        add_course(cd, 'AZ-900')
+        assert cache.refresh() == []
+        tl.add_technology('azure-ai', {'name': 'Azure AI', 'category': 'AI', 'description': '',
+                                       'latest_version': '1', 'resources': []})
+        cd.remove_course('AZ-104')
+        assert cache.refresh() == ['courses', 'technologies']
+        assert cache.read('technologies') == ['azure-ai']
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['courses', 'technologies']
+
+    def test_default_directory(self, monkeypatch, tmp_path):
+        """Test the environment variables choosing the cache directory."""
+        monkeypatch.setenv('MCTHELPER_CACHE_DIR', str(tmp_path / 'explicit'))
+        assert default_cache_directory() == str(tmp_path / 'explicit')
+        monkeypatch.delenv('MCTHELPER_CACHE_DIR')
+        monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+        assert default_cache_directory() == str(tmp_path / 'mcthelper')
+
+
+class TestCompletionScript:
+    """Test cases for generated completion scripts."""
+
+    @pytest.mark.parametrize('shell', ['bash', 'zsh', 'fish'])
+    def test_scripts_name_commands_and_cache(self, shell):
+        """Test that each script lists the commands and reads the cache directory."""
+        script = completion_script(shell, COMMANDS, ID_COMMANDS, "/tmp/it's here")
+        assert 'course-details' in script and 'list-courses' in script
+        assert 'look --' in script and 'awk' in script
+        assert 'here' in script and '@' not in script
+        if shell == 'fish':
+            assert "-d 'Show course details'" in script
+
+    def test_unsupported_shell(self):
+        """Test rejection of shells without a template."""
+        with pytest.raises(ValueError):
+            completion_script('tcsh', COMMANDS, ID_COMMANDS)
+
+    @pytest.mark.skipif(shutil.which('bash') is None, reason='bash is not installed')
+    def test_bash_completes_from_cache(self, tmp_path):
+        """Test the bash function against a real cache file."""
+        CompletionCache(str(tmp_path)).write('courses', ['AZ-104', 'AZ-900', 'DP-100'])
+        script = tmp_path / 'mcthelper.bash'
+        script.write_text(completion_script('bash', COMMANDS, ID_COMMANDS, str(tmp_path)))
+
+        def complete(*words):
+            probe = (f'source "{script}"; COMP_WORDS=({" ".join(repr(w) for w in words)}); '
+                     f'COMP_CWORD={len(words) - 1}; _mcthelper; printf "%s\\n" "${{COMPREPLY[@]}}"')
+            result = subprocess.run(['bash', '-c', probe], capture_output=True, text=True,
+                                    check=True)
+            return [line for line in result.stdout.splitlines() if line]
+
+        assert complete('mcthelper', 'co') == ['course-details']
+        assert complete('mcthelper', 'course-details', 'AZ') == ['AZ-104', 'AZ-900']
+        assert complete('mcthelper', '--metrics', 'm.json', 'summary', 'D') == ['DP-100']
+        assert complete('mcthelper', 'summary', 'AZ-104', '') == []
+        assert complete('mcthelper', 'list-courses', '') == []
@@ -0,0 +1,106 @@
+"""
+Tests for compression module
+"""
+
+import pytest
+from mcthelper.modules.compression import CompressedField, FieldCompressor
+from mcthelper.modules.course_details import CourseDetails
+from mcthelper.modules.interning import InternPool
+from mcthelper.modules.summary_info import SummaryInfo
+
+
+LONG_TEXT = 'Administer Azure subscriptions, identities and governance. ' * 20
+
+
+def course(description=LONG_TEXT):
+    """Build course info with the given description."""
+    return {
+        'name': 'Azure Administrator',
+        'description': description,
+        'duration': 4,
+        'level': 'Intermediate',
+        'topics': ['Identity', 'Governance']
+    }
+
+
+class TestCompressedField:
+    """Test cases for CompressedField class."""
+
+    @pytest.mark.parametrize('codec', ['zlib', 'lzma'])
+    def test_round_trip(self, codec):
+        """Test compressing and decoding text and lists."""
+        assert CompressedField(LONG_TEXT, codec).decode() == LONG_TEXT
+        points = ['Point one', 'Point two']
+        assert CompressedField(points, codec).decode() == points
+
+    def test_smaller_than_text(self):
+        """Test that repetitive text is stored smaller."""
+        assert len(CompressedField(LONG_TEXT).data) < len(LONG_TEXT) / 4
+
+
+class TestFieldCompressor:
+    """Test cases for FieldCompressor class."""
+
+    def test_unknown_codec(self):
+        """Test that unknown codecs are rejected."""
+        with pytest.raises(ValueError):
+            FieldCompressor(codec='brotli')
+
+    def test_small_fields_untouched(self):
+        """Test that records below the threshold are stored as given."""
+        compressor = FieldCompressor(threshold=256)
+        record = course('Short description')
+        assert compressor.pack(record, ['description']) is record
+
+    def test_decoded_cache(self):
+        """Test that hot records are decoded once."""
+        compressor = FieldCompressor(threshold=16, cache_size=1)
+        packed = compressor.pack(course(), ['description'])
+        assert isinstance(packed['description'], CompressedField)
+        first = compressor.unpack('AZ-104', packed)
+        assert compressor.unpack('AZ-104', packed) is first
+        assert compressor.stats == {'hits': 1, 'decodes': 1}
+
+        other = compressor.pack(course(), ['description'])
+        compressor.unpack('AZ-305', other)
+        compressor.unpack('AZ-104', packed)
+        assert compressor.stats['decodes'] == 3
+
+
+class TestManagerCompression:
+    """Test cases for managers storing compressed fields."""
+
+    def test_course_details(self):
+        """Test that compressed courses read back unchanged."""
+        cd = CourseDetails(compressor=FieldCompressor(threshold=64))
+        info = course()
+        cd.add_course('AZ-104', info)
+        assert isinstance(cd.courses['AZ-104']['description'], CompressedField)
+        assert cd.get_course('AZ-104') == info
+        assert cd.get_course('NOTFOUND') is None
+        assert cd.search_courses('governance')[0]['description'] == LONG_TEXT
+        assert cd.list_all_courses()[0]['id'] == 'AZ-104'
+
+    def test_course_update_refreshes_cache(self):
+        """Test that replacing a course does not serve stale cached text."""
+        cd = CourseDetails(compressor=FieldCompressor(threshold=64))
+        cd.add_course('AZ-104', course())
+        cd.get_course('AZ-104')
+        cd.add_course('AZ-104', course('Updated. ' * 20))
+        assert cd.get_course('AZ-104')['description'].startswith('Updated.')
+
+    def test_summary_info_with_interning(self):
+        """Test compression combined with an intern pool."""
+        pool = InternPool()
+        si = SummaryInfo(intern_pool=pool, compressor=FieldCompressor(threshold=64))
+        points = ['Configure role-based access control for subscriptions'] * 3
+        si.add_summary('AZ-104', {
+            'overview': LONG_TEXT,
+            'key_points': points,
+            'prerequisites': ['AZ-900'],
+            'target_audience': 'Administrators'
+        })
+        assert LONG_TEXT not in pool
+        assert si.get_key_points('AZ-104') == points
+        assert si.get_summary('AZ-104')['overview'] == LONG_TEXT
+        assert si.get_prerequisites('AZ-104') == ('AZ-900',)
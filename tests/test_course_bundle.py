@@ -0,0 +1,117 @@
+"""
+Tests for CourseCatalog module
+"""
+
+import pytest
+from datetime import date, timedelta
+from mcthelper.modules.course_details import CourseDetails
+from mcthelper.modules.summary_info import SummaryInfo
+from mcthelper.modules.lecture_prep import LecturePreparation
+from mcthelper.modules.qualifications import QualificationManager
+from mcthelper.modules.course_bundle import CourseCatalog
+
+
+COURSE = {
+    'name': 'Test Course',
+    'description': 'Test Description',
+    'duration': 3,
+    'level': 'Intermediate',
+    'topics': ['Topic1']
+}
+
+
+def make_catalog(cache_size=256):
+    """Build a catalog with one fully populated course."""
+    cd = CourseDetails()
+    si = SummaryInfo()
+    lp = LecturePreparation()
+    qm = QualificationManager()
+    cd.add_course('TEST-001', COURSE)
+    si.add_summary('TEST-001', {
+        'overview': 'Overview',
+        'key_points': ['Point 1'],
+        'prerequisites': [],
+        'target_audience': 'Everyone'
+    })
+    lp.add_prep_material('TEST-001', {
+        'slides': ['Slide 1'],
+        'labs': [],
+        'demos': [],
+        'resources': [],
+        'timing': {'Module 1': '1 hour'}
+    })
+    qm.add_qualification('TRAINER-001', 'TEST-001', {
+        'certification_date': '2024-01-01',
+        'expiry_date': (date.today() + timedelta(days=365)).isoformat(),
+        'status': 'active'
+    })
+    return CourseCatalog(cd, si, lp, qm, cache_size=cache_size)
+
+
+class TestCourseCatalog:
+    """Test cases for CourseCatalog class."""
+
+    def test_get_course_bundle(self):
+        """Test that a bundle contains every component."""
+        catalog = make_catalog()
+        bundle = catalog.get_course_bundle('TEST-001')
+        assert bundle['course_id'] == 'TEST-001'
+        assert bundle['course']['name'] == 'Test Course'
+        assert bundle['summary']['overview'] == 'Overview'
+        assert bundle['prep_materials']['slides'] == ['Slide 1']
+        assert len(bundle['checklist']) > 0
+        assert bundle['qualified_trainers'] == ['TRAINER-001']
+
+    def test_get_course_bundle_not_found(self):
+        """Test that unknown courses return None and are not cached."""
+        catalog = make_catalog()
+        assert catalog.get_course_bundle('NOTFOUND') is None
+        assert 'NOTFOUND' not in catalog._cache
+
+    def test_cache_hit(self):
+        """Test that repeated reads are served from the cache."""
+        catalog = make_catalog()
+        catalog.get_course_bundle('TEST-001')
+        catalog.course_details.courses.clear()
+        assert catalog.get_course_bundle('TEST-001')['course']['name'] == 'Test Course'
+        assert catalog.stats['hits'] == 1
+        assert catalog.stats['misses'] == 1
+
+    def test_component_invalidation(self):
+        """Test that a manager change refreshes only its component."""
+        catalog = make_catalog()
+        catalog.get_course_bundle('TEST-001')
+        catalog.summary_info.add_summary('TEST-001', {
+            'overview': 'Updated',
+            'key_points': [],
+            'prerequisites': [],
+            'target_audience': 'Everyone'
+        })
+        entry = catalog._cache['TEST-001']
+        assert 'summary' not in entry
+        assert 'course' in entry
+
+        bundle = catalog.get_course_bundle('TEST-001')
+        assert bundle['summary']['overview'] == 'Updated'
+        assert catalog.stats['refreshes'] == 1
+
+    def test_qualification_invalidation(self):
+        """Test that new qualifications refresh the trainer list."""
+        catalog = make_catalog()
+        catalog.get_course_bundle('TEST-001')
+        catalog.qual_manager.add_qualification('TRAINER-002', 'TEST-001', {
+            'certification_date': '2024-01-01',
+            'expiry_date': (date.today() + timedelta(days=30)).isoformat(),
+            'status': 'active'
+        })
+        bundle = catalog.get_course_bundle('TEST-001')
+        assert bundle['qualified_trainers'] == ['TRAINER-001', 'TRAINER-002']
+
+    def test_lru_eviction(self):
+        """Test that the cache is bounded and evicts least recently used."""
+        catalog = make_catalog(cache_size=1)
+        catalog.course_details.add_course('TEST-002', COURSE)
+        catalog.get_course_bundle('TEST-001')
+        catalog.get_course_bundle('TEST-002')
+        assert list(catalog._cache) == ['TEST-002']
+        assert catalog.stats['evictions'] == 1
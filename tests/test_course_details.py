@@ -124,3 +124,18 @@ class TestCourseDetails:
         assert len(results) == 2
         assert any(c['id'] == 'TEST-001' for c in results)
         assert any(c['id'] == 'TEST-002' for c in results)
+        
+    def test_remove_course(self):
+        """Test removing a course."""
+        cd = CourseDetails()
+        cd.add_course('TEST-001', {
+            'name': 'Test Course',
+            'description': 'Test Description',
+            'duration': 1,
+            'level': 'Beginner',
+            'topics': []
+        })
+        assert cd.remove_course('TEST-001') is True
+        assert cd.get_course('TEST-001') is None
+        assert cd.remove_course('TEST-001') is False
+    
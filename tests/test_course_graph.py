@@ -0,0 +1,139 @@
+"""
+Tests for course graph module
+"""
+
+import pytest
+from mcthelper.modules.course_details import CourseDetails
+from mcthelper.modules.summary_info import SummaryInfo
+from mcthelper.modules.course_graph import CoursePrerequisiteGraph
+
+
+def summary(*prerequisites):
+    """Build a minimal summary with the given prerequisites."""
+    return {
+        'overview': 'Overview',
+        'key_points': ['Point'],
+        'prerequisites': list(prerequisites),
+        'target_audience': 'Everyone',
+    }
+
+
+def course(name):
+    """Build a minimal course with the given name."""
+    return {
+        'name': name,
+        'description': 'Description',
+        'duration': 1,
+        'level': 'Beginner',
+        'topics': ['Topic'],
+    }
+
+
+@pytest.fixture
+def catalog():
+    """AZ-104 -> AZ-900, AZ-305 -> AZ-104 (by ID) and AZ-900 (by name)."""
+    details = CourseDetails()
+    info = SummaryInfo()
+    details.add_course('AZ-900', course('Microsoft Azure Fundamentals'))
+    details.add_course('AZ-104', course('Microsoft Azure Administrator'))
+    details.add_course('AZ-305', course('Designing Azure Infrastructure Solutions'))
+    info.add_summary('AZ-900', summary('Basic IT knowledge'))
+    info.add_summary('AZ-104', summary('AZ-900 or equivalent experience'))
+    info.add_summary('AZ-305', summary('Completed az-104', 'Azure Fundamentals'))
+    return details, info
+
+
+class TestCoursePrerequisiteGraph:
+    """Test cases for CoursePrerequisiteGraph class."""
+
+    def test_resolves_ids_and_names(self, catalog):
+        """Test that IDs and course names in free text resolve to courses."""
+        details, info = catalog
+        graph = CoursePrerequisiteGraph(info, details)
+        assert graph.direct_prerequisites('AZ-104') == {'AZ-900'}
+        assert graph.direct_prerequisites('AZ-305') == {'AZ-104', 'AZ-900'}
+        assert graph.unresolved == {'AZ-900': ['Basic IT knowledge']}
+
+    def test_unknown_ids_are_unresolved(self):
+        """Test that IDs not in the catalog are not turned into edges."""
+        info = SummaryInfo()
+        info.add_summary('AZ-104', summary('AZ-999'))
+        graph = CoursePrerequisiteGraph(info)
+        assert graph.direct_prerequisites('AZ-104') == frozenset()
+        assert graph.unresolved['AZ-104'] == ['AZ-999']
+
+    def test_late_resolution(self):
+        """Test that a prerequisite resolves once its course is added."""
+        details = CourseDetails()
+        info = SummaryInfo()
+        info.add_summary('AZ-104', summary('AZ-900', 'Azure Fundamentals'))
+        graph = CoursePrerequisiteGraph(info, details)
+        assert graph.direct_prerequisites('AZ-104') == frozenset()
+
+        info.add_summary('AZ-900', summary())
+        assert graph.direct_prerequisites('AZ-104') == {'AZ-900'}
+        assert graph.unresolved['AZ-104'] == ['Azure Fundamentals']
+
+        details.add_course('AZ-900', course('Microsoft Azure Fundamentals'))
+        assert 'AZ-104' not in graph.unresolved
+
+    def test_transitive_queries(self, catalog):
+        """Test prerequisite chains and unlocked courses."""
+        details, info = catalog
+        graph = CoursePrerequisiteGraph(info, details)
+        assert graph.all_prerequisites('AZ-305') == {'AZ-104', 'AZ-900'}
+        assert graph.unlocked_by('AZ-900') == {'AZ-104', 'AZ-305'}
+        assert graph.unlocked_by('AZ-104', transitive=False) == {'AZ-305'}
+        assert graph.all_prerequisites('AZ-305') is graph.all_prerequisites('AZ-305')
+
+    def test_study_order(self, catalog):
+        """Test that prerequisites come before the courses needing them."""
+        details, info = catalog
+        graph = CoursePrerequisiteGraph(info, details)
+        assert graph.study_order('AZ-305') == ['AZ-900', 'AZ-104', 'AZ-305']
+        assert graph.study_order('AZ-900') == ['AZ-900']
+
+    def test_cycle_detection(self, catalog):
+        """Test that mutually dependent courses are reported as a cycle."""
+        details, info = catalog
+        graph = CoursePrerequisiteGraph(info, details)
+        assert graph.find_cycles() == []
+
+        info.add_summary('AZ-900', summary('AZ-305'))
+        assert graph.find_cycles() == [['AZ-104', 'AZ-305', 'AZ-900']]
+        assert graph.has_cycle('AZ-104')
+        assert graph.study_order('AZ-104')[-1] == 'AZ-104'
+
+    def test_update_invalidates_only_affected_closures(self, catalog):
+        """Test that changing a summary keeps unrelated cached closures."""
+        details, info = catalog
+        details.add_course('MS-900', course('Microsoft 365 Fundamentals'))
+        info.add_summary('MS-900', summary())
+        info.add_summary('MS-102', summary('MS-900'))
+        graph = CoursePrerequisiteGraph(info, details)
+        unrelated = graph.all_prerequisites('MS-102')
+        graph.all_prerequisites('AZ-305')
+
+        info.add_summary('AZ-104', summary('Basic IT knowledge'))
+        assert graph._closures.get('MS-102') is unrelated
+        assert graph.all_prerequisites('AZ-305') == {'AZ-104', 'AZ-900'}
+        assert graph.all_prerequisites('AZ-104') == frozenset()
+        assert graph.unlocked_by('AZ-900') == {'AZ-305'}
+
+    def test_removed_summary_drops_edges(self, catalog):
+        """Test that removing a summary removes its prerequisite edges."""
+        details, info = catalog
+        graph = CoursePrerequisiteGraph(info, details)
+        info.remove_summary('AZ-305')
+        assert graph.direct_prerequisites('AZ-305') == frozenset()
+        assert graph.unlocked_by('AZ-104') == frozenset()
+
+    def test_deep_chain(self):
+        """Test that long chains are handled without recursion."""
+        info = SummaryInfo()
+        info.add_summary('AZ-1000', summary())
+        for i in range(1001, 2500):
+            info.add_summary(f'AZ-{i}', summary(f'AZ-{i - 1}'))
+        graph = CoursePrerequisiteGraph(info)
+        assert len(graph.all_prerequisites('AZ-2499')) == 1499
+        assert graph.find_cycles() == []
@@ -0,0 +1,30 @@
+"""
+Tests for durations module
+"""
+
+import pytest
+from mcthelper.modules.durations import parse_duration_minutes
+
+
+class TestParseDurationMinutes:
+    """Test cases for parse_duration_minutes function."""
+
+    @pytest.mark.parametrize('text, minutes', [
+        ('1 hour', 60),
+        ('2 hours', 120),
+        ('1.5 hours', 90),
+        ('90 minutes', 90),
+        ('45 min', 45),
+        ('2 hrs', 120),
+        ('1h 30m', 90),
+        ('1 hour 15 minutes', 75),
+        ('About 3 Hours', 180),
+    ])
+    def test_parses_units(self, text, minutes):
+        """Test hour and minute units, alone and combined."""
+        assert parse_duration_minutes(text) == minutes
+
+    @pytest.mark.parametrize('text', ['', 'TBD', '2 months', None, 3])
+    def test_unparseable(self, text):
+        """Test that text without a duration gives None."""
+        assert parse_duration_minutes(text) is None
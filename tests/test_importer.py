@@ -0,0 +1,191 @@
+"""
+Tests for importer module
+"""
+
+import json
+import pytest
+from benchmarks.generator import CatalogGenerator
+from mcthelper.modules.course_details import CourseDetails
+from mcthelper.modules.importer import (
+    CatalogImporter, chunk_ranges, export_catalog, normalize_record, parse_chunk)
+from mcthelper.modules.lecture_prep import LecturePreparation
+from mcthelper.modules.qualifications import QualificationManager
+from mcthelper.modules.summary_info import SummaryInfo
+from mcthelper.modules.tech_learning import TechLearning
+
+
+def empty_managers():
+    """Build one empty manager of each kind."""
+    return {
+        'course_details': CourseDetails(),
+        'summary_info': SummaryInfo(),
+        'lecture_prep': LecturePreparation(),
+        'qual_manager': QualificationManager(),
+        'tech_learning': TechLearning(),
+    }
+
+
+def state(managers):
+    """Snapshot the records held by the managers."""
+    return (
+        managers['course_details'].courses,
+        managers['summary_info'].summaries,
+        managers['lecture_prep'].prep_materials,
+        {c: list(m) for c, m in managers['lecture_prep'].timing_minutes.items()},
+        managers['qual_manager'].qualifications,
+        managers['tech_learning'].technologies,
+        managers['tech_learning'].learning_paths,
+    )
+
+
+@pytest.fixture(scope='module')
+def export_path(tmp_path_factory):
+    """Export of a synthetic catalog followed by invalid and duplicate lines."""
+    catalog = CatalogGenerator(scale=300, seed=5).build()
+    path = tmp_path_factory.mktemp('import') / 'catalog.jsonl'
+    export_catalog(str(path), **catalog)
+    bad_lines = [
+        '{not json',
+        '',
+        json.dumps({'type': 'course', 'id': 'XX-1', 'data': {'name': 'No fields'}}),
+        json.dumps({'type': 'widget', 'id': 'W-1', 'data': {}}),
+        json.dumps({'type': 'qualification', 'trainer_id': 'T-1', 'course_id': 'AZ-100',
+                    'data': {'certification_date': '2024-02-30', 'expiry_date': '2025-01-01',
+                             'status': 'active'}}),
+        json.dumps({'type': 'qualification', 'trainer_id': ' T-2 ', 'course_id': 'AZ-100',
+                    'data': {'certification_date': '2024-2-3', 'expiry_date': '2025-02-03',
+                             'status': ' Active'}}),
+        json.dumps({'type': 'prep_material', 'id': 'AZ-100',
+                    'data': {'slides': [], 'labs': [], 'demos': [], 'resources': [],
+                             'timing': {'Module 1': 'a while'}}}),
+        json.dumps({'type': 'technology', 'id': 'loop',
+                    'data': {'name': 'Loop', 'category': 'AI', 'description': 'x',
+                             'latest_version': '1', 'resources': [], 'prerequisites': ['loop']}}),
+        json.dumps({'type': 'course', 'id': 'AZ-100',
+                    'data': {'name': 'Replaced', 'description': 'Later lines win', 'duration': 2,
+                             'level': 'Advanced', 'topics': ['Azure']}}),
+    ]
+    with open(path, 'a', encoding='utf-8') as handle:
+        handle.write('\n'.join(bad_lines) + '\n')
+    return str(path), catalog
+
+
+class TestCatalogImporter:
+    """Test cases for CatalogImporter."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that an export imports back to the same state."""
+        catalog = CatalogGenerator(scale=50, seed=2).build()
+        path = str(tmp_path / 'catalog.jsonl')
+        written = export_catalog(path, **catalog)
+        managers = empty_managers()
+        report = CatalogImporter(**managers, workers=1).import_file(path)
+        assert report['errors'] == report['warnings'] == []
+        assert report['lines'] == written == sum(report['imported'].values())
+        assert state(managers) == state(catalog)
+
+    def test_errors_and_normalization(self, export_path):
+        """Test the error and warning reports and normalized qualification fields."""
+        path, _ = export_path
+        managers = empty_managers()
+        report = CatalogImporter(**managers, workers=1).import_file(path)
+        errors = report['errors']
+        lines = report['lines']
+        assert [error['line'] for error in errors] == sorted(error['line'] for error in errors)
+        assert [(e['line'] - lines, e['type'], e['id']) for e in errors] == [
+            (-8, None, None), (-6, 'course', 'XX-1'), (-5, 'widget', 'W-1'),
+            (-4, 'qualification', 'T-1/AZ-100'), (-1, 'technology', 'loop')]
+        assert errors[0]['error'].startswith('invalid JSON')
+        assert [(w['line'] - lines, w['id'], w['warning']) for w in report['warnings']] == [
+            (-2, 'AZ-100', "unparsable timing for 'Module 1': 'a while'")]
+        assert managers['lecture_prep'].get_timing_minutes('AZ-100') == {'Module 1': None}
+        assert 'missing required fields' in errors[1]['error']
+        assert errors[-1]['error'] == 'rejected by TechLearning'
+        assert managers['qual_manager'].get_qualifications('T-2')['AZ-100'] == {
+            'certification_date': '2024-02-03', 'expiry_date': '2025-02-03', 'status': 'active'}
+        assert managers['course_details'].get_course('AZ-100')['name'] == 'Replaced'
+
+    def test_parallel_matches_serial(self, export_path):
+        """Test that a multi-process import gives the same state and report."""
+        path, _ = export_path
+        serial = empty_managers()
+        serial_report = CatalogImporter(**serial, workers=1).import_file(path)
+        parallel = empty_managers()
+        importer = CatalogImporter(**parallel, workers=3, chunk_bytes=8 * 1024)
+        assert len(chunk_ranges(path, importer.chunk_bytes)) > 3
+        assert importer.import_file(path) == serial_report
+        assert state(parallel) == state(serial)
+
+    def test_missing_managers_are_skipped(self, export_path):
+        """Test that records without a receiving manager are counted as skipped."""
+        path, catalog = export_path
+        report = CatalogImporter(course_details=CourseDetails(), workers=1).import_file(path)
+        assert report['skipped']['summary'] == len(catalog['summary_info'].summaries)
+        assert report['imported']['summary'] == 0
+        assert report['imported']['course'] == len(catalog['course_details'].courses) + 1
+
+    def test_unparsed_timing_round_trip(self, tmp_path):
+        """Test that prep materials with unparsed timing survive export and import."""
+        lp = LecturePreparation()
+        assert lp.add_prep_material('AZ-900', {'slides': [], 'labs': [], 'demos': [],
+                                               'resources': [], 'timing': {'Intro': 'TBD'}})
+        path = str(tmp_path / 'prep.jsonl')
+        export_catalog(path, lecture_prep=lp)
+        imported = LecturePreparation()
+        report = CatalogImporter(lecture_prep=imported, workers=1).import_file(path)
+        assert report['errors'] == []
+        assert report['imported']['prep_material'] == 1
+        assert [w['warning'] for w in report['warnings']] == [
+            "unparsable timing for 'Intro': 'TBD'"]
+        assert imported.prep_materials == lp.prep_materials
+        assert list(imported.timing_minutes['AZ-900']) == list(lp.timing_minutes['AZ-900'])
+
+    def test_null_line_is_not_invalid_json(self, tmp_path):
+        """Test that valid JSON that is not an object gets its own message."""
+        path = tmp_path / 'lines.jsonl'
+        path.write_text('null\n{bad\n')
+        _, records, errors = parse_chunk(str(path), 0, path.stat().st_size)
+        assert records == []
+        assert errors[0] == (1, None, None, 'line is not a JSON object')
+        assert errors[1][3].startswith('invalid JSON')
+
+    def test_chunk_ranges_cover_lines(self, export_path):
+        """Test that byte ranges split on line boundaries and cover the file."""
+        path, _ = export_path
+        ranges = chunk_ranges(path, 5000)
+        assert ranges[0][0] == 0
+        assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+        total = sum(parse_chunk(path, start, end)[0] for start, end in ranges)
+        with open(path, 'rb') as handle:
+            assert total == sum(1 for _ in handle)
+
+    @pytest.mark.parametrize('entry, message', [
+        ([], 'not a JSON object'),
+        ({'type': 'course', 'id': '', 'data': {}}, 'id must be'),
+        ({'type': 'summary', 'id': 'A', 'data': []}, 'data must be'),
+        ({'type': 'course', 'id': 'A', 'data': {'name': 'n', 'description': 'd', 'duration': '1',
+                                                'level': 'l', 'topics': []}}, 'duration'),
+        ({'type': 'course', 'id': 'A', 'data': {'name': 'n', 'description': 'd', 'duration': 1,
+                                                'level': 'l', 'topics': 'x'}}, 'topics must be'),
+        ({'type': 'qualification', 'trainer_id': 'T', 'course_id': 'C',
+          'data': {'certification_date': '2025-01-01', 'expiry_date': '2024-01-01',
+                   'status': 'active'}}, 'before'),
+        ({'type': 'qualification', 'trainer_id': 'T', 'course_id': 'C',
+          'data': {'certification_date': '2024-01-01', 'expiry_date': '2025-01-01',
+                   'status': 'lapsed'}}, 'status'),
+    ])
+    def test_normalize_record_errors(self, entry, message):
+        """Test validation messages for invalid records."""
+        with pytest.raises(ValueError, match=message):
+            normalize_record(entry)
+
+    def test_prep_timing_is_parsed_once(self):
+        """Test that prep materials carry their parsed module minutes."""
+        record_type, key, data, minutes = normalize_record({
+            'type': 'prep_material', 'id': 'AZ-900',
+            'data': {'slides': [], 'labs': [], 'demos': [], 'resources': [],
+                     'timing': {'Module 1': '2 hours', 'Module 2': '1h 30m'}}})
+        assert (record_type, key, minutes) == ('prep_material', 'AZ-900', [120, 90])
+        lp = LecturePreparation()
+        assert lp.add_prep_material(key, data, minutes)
+        assert lp.get_total_minutes('AZ-900') == 210
@@ -0,0 +1,105 @@
+"""
+Tests for interning module
+"""
+
+import pytest
+from benchmarks.memory import memory_report
+from mcthelper.modules.course_details import CourseDetails
+from mcthelper.modules.interning import InternPool
+from mcthelper.modules.tech_learning import TechLearning
+
+
+def tech(resources):
+    """Build technology info with the given resources."""
+    return {
+        'name': 'Tech',
+        'category': 'Cloud',
+        'description': 'Description',
+        'latest_version': '1.0',
+        'resources': resources
+    }
+
+
+class TestInternPool:
+    """Test cases for InternPool class."""
+
+    def test_strings_are_shared(self):
+        """Test that equal strings resolve to one instance."""
+        pool = InternPool()
+        first = pool.intern(''.join(['Microsoft ', 'Learn']))
+        second = pool.intern(''.join(['Microsoft ', 'Learn']))
+        assert first is second
+        assert pool.refcount('Microsoft Learn') == 2
+
+    def test_lists_become_shared_tuples(self):
+        """Test that equal lists resolve to one tuple."""
+        pool = InternPool()
+        first = pool.intern(['A', 'B'])
+        second = pool.intern(['A', 'B'])
+        assert first == ('A', 'B')
+        assert first is second
+        assert pool.refcount('A') == 1
+
+    def test_release_frees_unused_values(self):
+        """Test that values leave the pool when no longer referenced."""
+        pool = InternPool()
+        record = pool.intern_record({'topics': ['A', 'B'], 'name': 'X', 'duration': 3})
+        other = pool.intern_record({'topics': ['A', 'B'], 'name': 'Y', 'duration': 1})
+        pool.release_record(record)
+        assert 'X' not in pool
+        assert ('A', 'B') in pool
+        pool.release_record(other)
+        assert len(pool) == 0
+
+    def test_unhashable_items_are_kept(self):
+        """Test that lists holding unhashable items are stored unchanged."""
+        pool = InternPool()
+        value = [{'a': 1}]
+        assert pool.intern(value) is value
+        pool.release(value)
+
+    def test_memory_report(self):
+        """Test the savings estimate."""
+        pool = InternPool()
+        for _ in range(10):
+            pool.intern(''.join(['Azure ', 'Documentation']))
+        report = pool.memory_report()
+        assert report['distinct_values'] == 1
+        assert report['references'] == 10
+        assert report['saved_bytes'] == report['pooled_bytes'] * 9
+
+
+class TestManagerInterning:
+    """Test cases for managers sharing an InternPool."""
+
+    def test_shared_resources_across_records(self):
+        """Test that repeated resources are stored once."""
+        pool = InternPool()
+        tl = TechLearning(intern_pool=pool)
+        tl.add_technology('a', tech([''.join(['Microsoft ', 'Learn'])]))
+        tl.add_technology('b', tech([''.join(['Microsoft ', 'Learn'])]))
+        assert tl.get_technology('a')['resources'] is tl.get_technology('b')['resources']
+
+    def test_replace_and_remove_release_values(self):
+        """Test that overwritten and removed records release their values."""
+        pool = InternPool()
+        cd = CourseDetails(intern_pool=pool)
+        course = {
+            'name': 'Old Name',
+            'description': 'Description',
+            'duration': 1,
+            'level': 'Beginner',
+            'topics': ['Cloud']
+        }
+        cd.add_course('TEST-001', course)
+        cd.add_course('TEST-001', dict(course, name='New Name'))
+        assert 'Old Name' not in pool
+        assert pool.refcount('Cloud') == 1
+        cd.remove_course('TEST-001')
+        assert len(pool) == 0
+
+    def test_memory_report_on_synthetic_catalog(self):
+        """Test that interning reduces memory on realistic data."""
+        report = memory_report(scale=300)
+        assert report['saved_bytes'] > 0
+        assert report['interned']['pool']['saved_bytes'] > 0
@@ -0,0 +1,87 @@
+"""
+Tests for learning graph module
+"""
+
+import pytest
+from mcthelper.modules.learning_graph import PrerequisiteGraph
+
+
+def make_chain():
+    """Build: advanced -> intermediate -> basics, advanced -> tooling."""
+    graph = PrerequisiteGraph()
+    graph.add_dependency('intermediate', 'basics')
+    graph.add_dependency('advanced', 'intermediate')
+    graph.add_dependency('advanced', 'tooling')
+    return graph
+
+
+class TestPrerequisiteGraph:
+    """Test cases for PrerequisiteGraph class."""
+
+    def test_transitive_prerequisites(self):
+        """Test the full transitive prerequisite set."""
+        graph = make_chain()
+        assert graph.prerequisites('advanced') == {'intermediate', 'basics', 'tooling'}
+        assert graph.prerequisites('basics') == frozenset()
+        assert graph.prerequisites('unknown') == frozenset()
+
+    def test_closure_is_memoized(self):
+        """Test that repeated queries return the cached closure."""
+        graph = make_chain()
+        first = graph.prerequisites('advanced')
+        assert graph.prerequisites('advanced') is first
+
+    def test_closure_updated_incrementally(self):
+        """Test that cached closures of dependents grow when edges are added."""
+        graph = make_chain()
+        graph.prerequisites('advanced')
+        graph.add_dependency('basics', 'it-literacy')
+        assert 'it-literacy' in graph._closures['advanced']
+        assert graph.prerequisites('intermediate') == {'basics', 'it-literacy'}
+
+    def test_cycle_rejected(self):
+        """Test that a dependency creating a cycle is rejected."""
+        graph = make_chain()
+        assert graph.add_dependency('basics', 'advanced') is False
+        assert graph.add_dependency('basics', 'basics') is False
+        assert 'advanced' not in graph.requires['basics']
+
+    def test_set_dependencies_removal(self):
+        """Test that removing a dependency invalidates dependent closures."""
+        graph = make_chain()
+        graph.prerequisites('advanced')
+        assert graph.set_dependencies('intermediate', []) is True
+        assert graph.prerequisites('advanced') == {'intermediate', 'tooling'}
+
+    def test_study_order(self):
+        """Test that prerequisites always come before their dependents."""
+        graph = make_chain()
+        order = graph.study_order(['advanced'])
+        assert set(order) == {'advanced', 'intermediate', 'basics', 'tooling'}
+        assert order.index('basics') < order.index('intermediate') < order.index('advanced')
+        assert order.index('tooling') < order.index('advanced')
+
+    def test_study_order_after_change(self):
+        """Test that the cached order is rebuilt after a structural change."""
+        graph = make_chain()
+        graph.study_order(['advanced'])
+        graph.add_dependency('basics', 'tooling')
+        order = graph.study_order(['advanced'])
+        assert order.index('tooling') < order.index('basics')
+
+    def test_shortest_path(self):
+        """Test the shortest chain between two skills."""
+        graph = make_chain()
+        graph.add_dependency('expert', 'advanced')
+        graph.add_dependency('expert', 'basics')
+        assert graph.shortest_path('basics', 'expert') == ['basics', 'expert']
+        assert graph.shortest_path('basics', 'advanced') == ['basics', 'intermediate', 'advanced']
+        assert graph.shortest_path('advanced', 'basics') is None
+        assert graph.shortest_path('missing', 'basics') is None
+
+    def test_deep_chain(self):
+        """Test closures along a long prerequisite chain."""
+        graph = PrerequisiteGraph()
+        for i in range(1500):
+            graph.add_dependency(f'n{i + 1}', f'n{i}')
+        assert len(graph.prerequisites('n1500')) == 1500
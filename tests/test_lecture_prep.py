@@ -112,3 +112,64 @@ class TestLecturePreparation:
         lp = LecturePreparation()
         result = lp.get_timing_guide('NOTFOUND')
         assert result == {}
+        
+    def test_remove_prep_material(self):
+        """Test removing preparation materials."""
+        lp = LecturePreparation()
+        lp.add_prep_material('TEST-001', {
+            'slides': [],
+            'labs': [],
+            'demos': [],
+            'resources': [],
+            'timing': {}
+        })
+        assert lp.remove_prep_material('TEST-001') is True
+        assert lp.get_prep_materials('TEST-001') is None
+        assert lp.remove_prep_material('TEST-001') is False
+    
+    
+    def test_timing_parsed_at_insert(self):
+        """Test that module timings are stored as minutes."""
+        lp = LecturePreparation()
+        lp.add_prep_material('TEST-001', {
+            'slides': [], 'labs': [], 'demos': [], 'resources': [],
+            'timing': {'Module 1': '2 hours', 'Module 2': '45 minutes', 'Module 3': 'TBD'}
+        })
+        assert lp.get_timing_minutes('TEST-001') == {
+            'Module 1': 120, 'Module 2': 45, 'Module 3': None}
+        assert lp.get_total_minutes('TEST-001') == 165
+        assert lp.get_prep_hours('TEST-001') == 2.75
+        assert lp.get_total_minutes('NOTFOUND') is None
+        assert lp.get_timing_minutes('NOTFOUND') == {}
+    
+    def test_prep_hours_aggregates(self):
+        """Test catalog-wide and per-level totals through updates and removals."""
+        from mcthelper.modules.course_details import CourseDetails
+        cd = CourseDetails()
+        lp = LecturePreparation()
+        for course_id, level, hours in [('A-100', 'Beginner', '2 hours'),
+                                        ('A-200', 'Advanced', '3 hours'),
+                                        ('A-300', 'Beginner', '1 hour')]:
+            cd.add_course(course_id, {'name': course_id, 'description': '', 'duration': 1,
+                                      'level': level, 'topics': []})
+            lp.add_prep_material(course_id, {
+                'slides': [], 'labs': [], 'demos': [], 'resources': [],
+                'timing': {'Module 1': hours}
+            })
+        assert lp.get_catalog_prep_hours() == 6
+        assert lp.get_prep_hours_by_level(cd) == {'Beginner': 3, 'Advanced': 3}
+        
+        lp.add_prep_material('A-200', {
+            'slides': [], 'labs': [], 'demos': [], 'resources': [],
+            'timing': {'Module 1': '30 minutes'}
+        })
+        lp.remove_prep_material('A-300')
+        assert lp.get_catalog_prep_hours() == 2.5
+        assert lp.get_prep_hours_by_level(cd) == {'Beginner': 2, 'Advanced': 0.5}
+        
+        lp.add_prep_material('A-400', {
+            'slides': [], 'labs': [], 'demos': [], 'resources': [],
+            'timing': {'Module 1': '1 hour'}
+        })
+        assert len(lp._total_minutes) == 3
+        assert lp.get_prep_hours_by_level(cd)['Unknown'] == 1
@@ -0,0 +1,143 @@
+"""
+Tests for localization module
+"""
+
+import json
+import pytest
+from mcthelper.modules.course_details import CourseDetails
+from mcthelper.modules.summary_info import SummaryInfo
+from mcthelper.modules.localization import LocalizedCatalog, fallback_chain
+
+
+PACKS = {
+    'ko': {
+        'courses': {'AZ-900': {'name': 'Azure 기초', 'description': '클라우드 개념 소개'}},
+        'summaries': {'AZ-900': {'overview': '클라우드 개념과 Azure 서비스'}},
+    },
+    'ko-KR': {
+        'courses': {'AZ-900': {'name': 'Microsoft Azure 기초'}},
+    },
+    'ja-JP': {
+        'courses': {'AZ-900': {'name': 'Azure の基礎'}},
+    },
+}
+
+
+@pytest.fixture
+def managers():
+    """Default-locale course and summary managers."""
+    cd = CourseDetails()
+    si = SummaryInfo()
+    cd.add_course('AZ-900', {'name': 'Azure Fundamentals', 'description': 'Cloud concepts',
+                             'duration': 1, 'level': 'Beginner', 'topics': ['Cloud']})
+    cd.add_course('AZ-104', {'name': 'Azure Administrator', 'description': 'Manage Azure',
+                             'duration': 4, 'level': 'Intermediate', 'topics': ['Identity']})
+    si.add_summary('AZ-900', {'overview': 'Cloud concepts and Azure services',
+                              'key_points': ['Cloud models'], 'prerequisites': [],
+                              'target_audience': 'Beginners'})
+    return cd, si
+
+
+class CountingLoader:
+    """Loader recording which locales were requested."""
+
+    def __init__(self):
+        self.loaded = []
+
+    def __call__(self, locale):
+        self.loaded.append(locale)
+        return json.loads(json.dumps(PACKS.get(locale))) if locale in PACKS else None
+
+
+class TestLocalizedCatalog:
+    """Test cases for LocalizedCatalog class."""
+
+    def test_fallback_chain(self):
+        """Test locale fallback order."""
+        assert fallback_chain('ko-KR') == ['ko-KR', 'ko', 'en-US']
+        assert fallback_chain('en-US') == ['en-US', 'en']
+        assert fallback_chain('zh_Hant_TW') == ['zh-Hant-TW', 'zh-Hant', 'zh', 'en-US']
+
+    def test_field_level_fallback(self, managers):
+        """Test that each field falls back independently."""
+        catalog = LocalizedCatalog(*managers, loader=CountingLoader())
+        course = catalog.get_course('AZ-900', 'ko-KR')
+        assert course['name'] == 'Microsoft Azure 기초'
+        assert course['description'] == '클라우드 개념 소개'
+        assert course['topics'] == ['Cloud']
+        assert catalog.get_summary('AZ-900', 'ko-KR')['overview'] == '클라우드 개념과 Azure 서비스'
+        assert catalog.get_course('AZ-104', 'ko-KR')['name'] == 'Azure Administrator'
+        assert catalog.get_course('AZ-900')['name'] == 'Azure Fundamentals'
+        assert catalog.get_course('NOTFOUND', 'ko-KR') is None
+
+    def test_base_records_unchanged(self, managers):
+        """Test that localized reads do not modify the base records."""
+        cd, si = managers
+        catalog = LocalizedCatalog(cd, si, loader=CountingLoader())
+        catalog.get_course('AZ-900', 'ko-KR')
+        assert cd.get_course('AZ-900')['name'] == 'Azure Fundamentals'
+
+    def test_packs_load_lazily(self, managers):
+        """Test that only the requested locales are loaded, once each."""
+        loader = CountingLoader()
+        catalog = LocalizedCatalog(*managers, loader=loader)
+        assert loader.loaded == []
+        catalog.get_course('AZ-900', 'ko-KR')
+        catalog.get_course('AZ-104', 'ko-KR')
+        catalog.search('기초', 'ko-KR')
+        assert loader.loaded == ['ko-KR', 'ko']
+        assert 'ja-JP' not in catalog.loaded_locales()
+        assert sorted(catalog._indexes) == ['en-US', 'ko-KR']
+
+    def test_per_locale_search(self, managers):
+        """Test that each locale searches its own index."""
+        catalog = LocalizedCatalog(*managers, loader=CountingLoader())
+        results = catalog.search('기초', 'ko-KR')
+        assert [(r['id'], r['locale']) for r in results] == [('AZ-900', 'ko-KR')]
+        assert catalog.search('개념', 'ko')[0]['locale'] == 'ko'
+        assert catalog.search('기초', 'ja-JP') == []
+        assert sorted(r['id'] for r in catalog.search('azure')) == ['AZ-104', 'AZ-900']
+
+    def test_search_falls_back_to_default_text(self, managers):
+        """Test that untranslated records and fields match in the default locale text."""
+        cd, si = managers
+        catalog = LocalizedCatalog(cd, si, loader={'ko-KR': PACKS['ko-KR']}.get)
+        # Only AZ-900's name is translated; its topics and summary are not
+        assert [(r['id'], r['locale']) for r in catalog.search('cloud', 'ko-KR')] == [
+            ('AZ-900', 'ko-KR')]
+        assert [(r['id'], r['locale']) for r in catalog.search('administrator', 'ko-KR')] == [
+            ('AZ-104', 'en-US')]
+        assert catalog.search('fundamentals', 'ko-KR') == []
+        cd.add_course('AZ-900', {'name': 'Azure Fundamentals', 'description': 'Cloud concepts',
+                                 'duration': 1, 'level': 'Beginner', 'topics': ['Pricing']})
+        assert [r['id'] for r in catalog.search('pricing', 'ko-KR')] == ['AZ-900']
+        assert sorted(r['id'] for r in catalog.search('azure', 'ko-KR')) == ['AZ-104', 'AZ-900']
+
+    def test_set_translation_updates_loaded_index(self, managers):
+        """Test that new translations are searchable immediately."""
+        catalog = LocalizedCatalog(*managers, loader=CountingLoader())
+        catalog.search('관리자', 'ko')
+        assert catalog.set_translation('ko', 'courses', 'AZ-104', {'name': 'Azure 관리자'})
+        assert catalog.search('관리자', 'ko')[0]['id'] == 'AZ-104'
+        assert catalog.get_course('AZ-104', 'ko-KR')['name'] == 'Azure 관리자'
+        assert catalog.set_translation('ko', 'courses', 'AZ-104', {'level': 'x'}) is False
+        assert catalog.set_translation('ko', 'labs', 'AZ-104', {}) is False
+        assert catalog.set_translation('en-US', 'courses', 'AZ-104', {'name': 'x'}) is False
+
+    def test_default_index_follows_base_changes(self, managers):
+        """Test that the default-locale index tracks manager updates."""
+        cd, si = managers
+        catalog = LocalizedCatalog(cd, si)
+        assert catalog.search('security') == []
+        cd.add_course('SC-900', {'name': 'Security Fundamentals', 'description': '',
+                                 'duration': 1, 'level': 'Beginner', 'topics': []})
+        assert catalog.search('security')[0]['id'] == 'SC-900'
+        cd.remove_course('SC-900')
+        assert catalog.search('security') == []
+
+    def test_directory_loader(self, managers, tmp_path):
+        """Test loading packs from JSON files."""
+        (tmp_path / 'ko.json').write_text(json.dumps(PACKS['ko']), encoding='utf-8')
+        catalog = LocalizedCatalog(*managers, loader=str(tmp_path))
+        assert catalog.get_course('AZ-900', 'ko-KR')['name'] == 'Azure 기초'
+        assert catalog.get_course('AZ-900', 'fr-FR')['name'] == 'Azure Fundamentals'
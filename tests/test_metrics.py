@@ -0,0 +1,116 @@
+"""
+Tests for metrics module
+"""
+
+import json
+import pytest
+from mcthelper.modules.course_details import CourseDetails
+from mcthelper.modules.metrics import MetricsRegistry, public_methods
+from mcthelper.cli import MCTHelperCLI
+
+
+COURSE = {
+    'name': 'Test Course',
+    'description': 'Test Description',
+    'duration': 3,
+    'level': 'Intermediate',
+    'topics': ['Topic1', 'Topic2']
+}
+
+
+class TestMetricsRegistry:
+    """Test cases for MetricsRegistry class."""
+
+    def test_public_methods(self):
+        """Test discovery of public manager methods."""
+        names = public_methods(CourseDetails())
+        assert names == ['add_course', 'get_course', 'list_all_courses', 'remove_course',
+                         'search_courses', 'subscribe', 'unsubscribe']
+
+    def test_counts_calls_misses_and_errors(self):
+        """Test that calls, misses and rejected calls are counted."""
+        registry = MetricsRegistry()
+        cd = registry.instrument(CourseDetails())
+        cd.add_course('TEST-001', COURSE)
+        cd.add_course('', COURSE)
+        cd.get_course('TEST-001')
+        cd.get_course('NOTFOUND')
+
+        snapshot = registry.snapshot()
+        assert snapshot['CourseDetails.add_course']['calls'] == 2
+        assert snapshot['CourseDetails.add_course']['errors'] == 1
+        assert snapshot['CourseDetails.get_course']['calls'] == 2
+        assert snapshot['CourseDetails.get_course']['misses'] == 1
+        buckets = snapshot['CourseDetails.get_course']['latency_buckets']
+        assert buckets[-1] == {'le': '+Inf', 'count': 2}
+
+    def test_exception_counted_as_error(self):
+        """Test that raised exceptions are counted and propagated."""
+        registry = MetricsRegistry()
+        cd = registry.instrument(CourseDetails())
+        with pytest.raises(AttributeError):
+            cd.search_courses(42)
+        assert registry.snapshot()['CourseDetails.search_courses']['errors'] == 1
+
+    def test_disable_and_enable(self):
+        """Test that disabling removes wrappers and enabling restores them."""
+        registry = MetricsRegistry()
+        cd = registry.instrument(CourseDetails())
+        registry.disable()
+        assert 'get_course' not in cd.__dict__
+        assert cd.get_course.__func__ is CourseDetails.get_course
+        cd.get_course('NOTFOUND')
+        assert registry.snapshot()['CourseDetails.get_course']['calls'] == 0
+
+        registry.enable()
+        cd.get_course('NOTFOUND')
+        assert registry.snapshot()['CourseDetails.get_course']['calls'] == 1
+
+    def test_reset(self):
+        """Test clearing recorded values."""
+        registry = MetricsRegistry()
+        cd = registry.instrument(CourseDetails())
+        cd.get_course('NOTFOUND')
+        registry.reset()
+        cd.get_course('NOTFOUND')
+        assert registry.snapshot()['CourseDetails.get_course']['calls'] == 1
+
+    def test_prometheus_export(self):
+        """Test Prometheus text exposition output."""
+        registry = MetricsRegistry()
+        cd = registry.instrument(CourseDetails(), prefix='courses')
+        cd.get_course('NOTFOUND')
+        text = registry.to_prometheus()
+        assert '# TYPE mcthelper_calls_total counter' in text
+        assert 'mcthelper_calls_total{method="courses.get_course"} 1' in text
+        assert 'mcthelper_misses_total{method="courses.get_course"} 1' in text
+        assert 'mcthelper_call_duration_seconds_bucket{method="courses.get_course",le="+Inf"} 1' in text
+        assert 'mcthelper_call_duration_seconds_count{method="courses.get_course"} 1' in text
+
+    def test_json_export(self, tmp_path):
+        """Test writing JSON and Prometheus files."""
+        registry = MetricsRegistry()
+        registry.instrument(CourseDetails()).get_course('NOTFOUND')
+
+        json_path = tmp_path / 'metrics.json'
+        registry.write(str(json_path))
+        data = json.loads(json_path.read_text())
+        assert data['CourseDetails.get_course']['calls'] == 1
+
+        prom_path = tmp_path / 'metrics.prom'
+        registry.write(str(prom_path))
+        assert prom_path.read_text().startswith('# HELP')
+
+    def test_cli_instrumentation(self, capsys):
+        """Test that the CLI instruments its managers and commands."""
+        registry = MetricsRegistry()
+        cli = MCTHelperCLI(metrics=registry)
+        cli.show_course_details('AZ-900')
+        capsys.readouterr()
+
+        snapshot = registry.snapshot()
+        assert snapshot['CourseDetails.add_course']['calls'] == 1
+        assert snapshot['CourseDetails.get_course']['calls'] == 1
+        assert snapshot['cli.show_course_details']['calls'] == 1
+        assert snapshot['cli.show_course_details']['misses'] == 0
+        assert snapshot['cli.show_course_details']['errors'] == 0
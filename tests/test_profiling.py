@@ -0,0 +1,110 @@
+"""
+Tests for profiling module
+"""
+
+import pstats
+import sys
+import time
+import pytest
+from mcthelper import cli
+from mcthelper.modules.profiling import Profiler, SamplingProfiler, read_methods
+from mcthelper.modules.summary_info import SummaryInfo
+
+
+class FakeTimer:
+    """Timer advanced by hand."""
+
+    def __init__(self):
+        """Start at zero."""
+        self.now = 0.0
+
+    def __call__(self):
+        """Return the current time."""
+        return self.now
+
+
+def busy_loop(seconds):
+    """Spin for a while so the sampler sees this frame."""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class TestProfiler:
+    """Test cases for Profiler and SamplingProfiler."""
+
+    def test_nested_phases_are_exclusive(self):
+        """Test that inner phase time is not counted for the outer phase."""
+        timer = FakeTimer()
+        profiler = Profiler(mode='sample', timer=timer)
+        profiler.start()
+        with profiler.phase('rendering'):
+            timer.now = 1.0
+            with profiler.phase('querying'):
+                timer.now = 4.0
+            timer.now = 5.0
+        timer.now = 6.0
+        profiler.stop()
+        assert profiler.breakdown() == {
+            'loading': 0.0, 'indexing': 0.0, 'querying': 3.0, 'rendering': 2.0,
+            'other': 1.0, 'total': 6.0}
+
+    def test_instrument_attributes_method_time(self):
+        """Test that instrumented methods run inside their phase."""
+        profiler = Profiler()
+        si = SummaryInfo()
+        seen = []
+        original = si.get_summary
+        si.get_summary = lambda course_id: seen.append(profiler.current_phase()) or original(course_id)
+        profiler.instrument(si, 'querying', ['get_summary'])
+        assert si.get_summary('AZ-900') is None
+        assert seen == ['querying']
+        assert profiler.current_phase() == 'other'
+
+    def test_read_methods(self):
+        """Test that write methods are not instrumented as queries."""
+        methods = read_methods(SummaryInfo())
+        assert 'get_summary' in methods and 'search' in methods
+        assert not any(name.startswith(('add_', 'remove_', 'subscribe')) for name in methods)
+
+    def test_unknown_mode(self):
+        """Test that an unknown mode is rejected."""
+        with pytest.raises(ValueError):
+            Profiler(mode='perf')
+
+    def test_sampling_collapsed_stacks(self, tmp_path):
+        """Test that samples are written as collapsed stacks with the phase root."""
+        profiler = Profiler(mode='sample', interval=0.001)
+        profiler.start()
+        with profiler.phase('querying'):
+            busy_loop(0.1)
+        profiler.stop()
+        path = tmp_path / 'profile.txt'
+        profiler.write(str(path))
+        lines = path.read_text().splitlines()
+        assert lines
+        stack, count = lines[0].rsplit(' ', 1)
+        assert int(count) > 0
+        assert any(line.startswith('querying;') and 'busy_loop' in line for line in lines)
+
+    def test_sampler_sample_once(self):
+        """Test taking one sample of the calling thread."""
+        sampler = SamplingProfiler()
+        sampler.sample()
+        (stack, count), = sampler.samples.items()
+        assert count == 1
+        assert stack[-1].endswith(':sample')
+
+    def test_cli_profile(self, tmp_path, monkeypatch, capsys, completion_cache_dir):
+        """Test the --profile option writes pstats and prints a breakdown."""
+        path = tmp_path / 'cli.prof'
+        monkeypatch.setattr(sys, 'argv', ['mcthelper', '--profile', str(path),
+                                          'query', 'level = Beginner'])
+        cli.main()
+        captured = capsys.readouterr()
+        assert 'AZ-900' in captured.out
+        for phase in ('loading', 'indexing', 'querying', 'rendering', 'total'):
+            assert phase in captured.err
+        functions = {name for _, _, name in pstats.Stats(str(path)).stats}
+        assert '_load_sample_data' in functions
+        assert sorted(p.name for p in completion_cache_dir.iterdir()) == ['courses', 'technologies']
@@ -2,8 +2,10 @@
 Tests for QualificationManager module
 """
 
+import random
 import pytest
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from mcthelper.modules.clock import ManualClock
 from mcthelper.modules.qualifications import QualificationManager
 
 
@@ -124,3 +126,191 @@ class TestQualificationManager:
         assert 'requirements' in result
         assert isinstance(result['requirements'], list)
         assert len(result['requirements']) > 0
+    
+    def test_get_qualified_trainers(self):
+        """Test listing active, non-expired trainers for a course."""
+        qm = QualificationManager()
+        future_date = (datetime.now() + timedelta(days=180)).strftime('%Y-%m-%d')
+        past_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
+        qm.add_qualification('TRAINER-002', 'TEST-001', {
+            'certification_date': '2024-01-01',
+            'expiry_date': future_date,
+            'status': 'active'
+        })
+        qm.add_qualification('TRAINER-001', 'TEST-001', {
+            'certification_date': '2024-01-01',
+            'expiry_date': future_date,
+            'status': 'active'
+        })
+        qm.add_qualification('TRAINER-003', 'TEST-001', {
+            'certification_date': '2023-01-01',
+            'expiry_date': past_date,
+            'status': 'active'
+        })
+        qm.add_qualification('TRAINER-004', 'TEST-001', {
+            'certification_date': '2024-01-01',
+            'expiry_date': future_date,
+            'status': 'pending'
+        })
+        assert qm.get_qualified_trainers('TEST-001') == ['TRAINER-001', 'TRAINER-002']
+        assert qm.get_qualified_trainers('NOTFOUND') == []
+    
+    def test_check_expiry_with_clock(self):
+        """Test that expiry is evaluated against the injected clock."""
+        qm = QualificationManager(clock=ManualClock('2025-01-01'))
+        qm.add_qualification('TRAINER-001', 'TEST-001', {
+            'certification_date': '2024-01-01',
+            'expiry_date': '2025-03-01',
+            'status': 'active'
+        })
+        assert qm.check_expiry('TRAINER-001', 'TEST-001') == {
+            'status': 'expiring_soon', 'days_remaining': 59}
+        qm.clock.advance(days=60)
+        assert qm.check_expiry('TRAINER-001', 'TEST-001')['status'] == 'expired'
+    
+    def test_check_expiry_as_of(self):
+        """Test evaluating expiry on a specific date."""
+        qm = QualificationManager(clock=ManualClock('2025-01-01'))
+        qm.add_qualification('TRAINER-001', 'TEST-001', {
+            'certification_date': '2024-01-01',
+            'expiry_date': '2025-12-31',
+            'status': 'active'
+        })
+        assert qm.check_expiry('TRAINER-001', 'TEST-001')['status'] == 'valid'
+        result = qm.check_expiry('TRAINER-001', 'TEST-001', as_of='2025-10-02')
+        assert result == {'status': 'expiring_soon', 'days_remaining': 90}
+        assert qm.check_expiry('TRAINER-001', 'TEST-001',
+                               as_of=datetime(2026, 1, 1, 12))['status'] == 'expired'
+        assert qm.get_qualified_trainers('TEST-001', as_of=date(2026, 1, 1)) == []
+    
+    def test_check_expiry_cached_per_day(self):
+        """Test that results are cached per day and refreshed on re-add."""
+        qm = QualificationManager(clock=ManualClock('2025-01-01'))
+        qual_data = {
+            'certification_date': '2024-01-01',
+            'expiry_date': '2025-12-31',
+            'status': 'active'
+        }
+        qm.add_qualification('TRAINER-001', 'TEST-001', qual_data)
+        qm.check_expiry('TRAINER-001', 'TEST-001')
+        qual_data['expiry_date'] = '2025-01-15'
+        assert qm.check_expiry('TRAINER-001', 'TEST-001')['status'] == 'valid'
+        
+        qm.add_qualification('TRAINER-001', 'TEST-001', qual_data)
+        assert qm.check_expiry('TRAINER-001', 'TEST-001')['status'] == 'expiring_soon'
+    
+    def test_check_expiry_invalid_date(self):
+        """Test checking expiry for a malformed expiry date."""
+        qm = QualificationManager()
+        qm.add_qualification('TRAINER-001', 'TEST-001', {
+            'certification_date': '2024-01-01',
+            'expiry_date': '01/01/2025',
+            'status': 'active'
+        })
+        assert qm.check_expiry('TRAINER-001', 'TEST-001') == {
+            'status': 'error', 'days_remaining': None}
+        
+    def test_remove_qualification(self):
+        """Test removing a qualification."""
+        qm = QualificationManager()
+        qm.add_qualification('TRAINER-001', 'TEST-001', {
+            'certification_date': '2024-01-01',
+            'expiry_date': '2025-01-01',
+            'status': 'active'
+        })
+        assert qm.remove_qualification('TRAINER-001', 'TEST-001') is True
+        assert qm.get_qualifications('TRAINER-001') == {}
+        assert qm.check_expiry('TRAINER-001', 'TEST-001')['status'] == 'not_found'
+        assert qm.remove_qualification('TRAINER-001', 'TEST-001') is False
+    
+
+def add_active(qm, trainer_id, course_id, expiry_date='2025-12-31', status='active'):
+    """Add a qualification with the given expiry date and status."""
+    qm.add_qualification(trainer_id, course_id, {
+        'certification_date': '2024-01-01',
+        'expiry_date': expiry_date,
+        'status': status
+    })
+
+
+class TestQualificationCoverage:
+    """Test cases for the per-course trainer bitsets."""
+    
+    def test_qualified_for_all(self):
+        """Test trainers covering every course of a set."""
+        qm = QualificationManager()
+        for course_id in ('AZ-104', 'AZ-305', 'AZ-500'):
+            add_active(qm, 'T-1', course_id)
+        add_active(qm, 'T-2', 'AZ-104')
+        add_active(qm, 'T-2', 'AZ-305')
+        add_active(qm, 'T-2', 'AZ-500', status='pending')
+        add_active(qm, 'T-3', 'AZ-104')
+        add_active(qm, 'T-3', 'AZ-305', expiry_date='2024-06-30')
+        add_active(qm, 'T-3', 'AZ-500')
+        bootcamp = ['AZ-104', 'AZ-305', 'AZ-500']
+        assert qm.get_trainers_qualified_for_all(bootcamp, as_of='2025-01-01') == ['T-1']
+        assert qm.get_trainers_qualified_for_all(bootcamp, as_of='2024-06-30') == ['T-1', 'T-3']
+        assert qm.get_trainers_qualified_for_all(['AZ-104'], as_of='2025-01-01') == [
+            'T-1', 'T-2', 'T-3']
+        assert qm.get_trainers_qualified_for_all(['XX-1'], as_of='2025-01-01') == []
+        assert qm.get_trainers_qualified_for_all([], as_of='2025-01-01') == []
+    
+    def test_missing_one_and_coverage(self):
+        """Test trainers one qualification short and per-course counts."""
+        qm = QualificationManager()
+        add_active(qm, 'T-1', 'AZ-104')
+        add_active(qm, 'T-1', 'AZ-305')
+        add_active(qm, 'T-2', 'AZ-104')
+        add_active(qm, 'T-2', 'AZ-500', expiry_date='not a date')
+        add_active(qm, 'T-3', 'AZ-900')
+        courses = ['AZ-104', 'AZ-305', 'AZ-500']
+        assert qm.get_trainers_missing_one(courses, as_of='2025-01-01') == {'T-1': 'AZ-500'}
+        assert qm.get_trainers_missing_one(courses[:2], as_of='2025-01-01') == {'T-2': 'AZ-305'}
+        assert qm.get_course_coverage(courses, as_of='2025-01-01') == {
+            'AZ-104': 2, 'AZ-305': 1, 'AZ-500': 0}
+    
+    def test_bitsets_follow_changes(self):
+        """Test that re-added and removed qualifications update the bitsets."""
+        qm = QualificationManager(clock=ManualClock(date(2025, 1, 1)))
+        add_active(qm, 'T-1', 'AZ-104')
+        add_active(qm, 'T-2', 'AZ-104')
+        assert qm.get_qualified_trainers('AZ-104') == ['T-1', 'T-2']
+        add_active(qm, 'T-1', 'AZ-104', status='expired')
+        assert qm.get_qualified_trainers('AZ-104') == ['T-2']
+        qm.remove_qualification('T-2', 'AZ-104')
+        assert qm.get_qualified_trainers('AZ-104') == []
+        assert qm.get_trainers_missing_one(['AZ-104']) == {'T-1': 'AZ-104'}
+        add_active(qm, 'T-2', 'AZ-104')
+        assert qm.get_course_coverage(['AZ-104']) == {'AZ-104': 1}
+    
+    def test_matches_nested_lookups(self):
+        """Test bitset answers against loops over the qualification dictionaries."""
+        rng = random.Random(4)
+        qm = QualificationManager()
+        courses = [f'C-{c:02d}' for c in range(30)]
+        for t in range(200):
+            for course_id in rng.sample(courses, rng.randint(3, 10)):
+                expiry = date(2025, 1, 1) + timedelta(days=rng.randint(0, 540))
+                add_active(qm, f'T-{t:03d}', course_id, expiry.isoformat(),
+                           rng.choice(['active', 'active', 'active', 'pending', 'expired']))
+        day = date(2025, 6, 1)
+        
+        def qualified(trainer_id, course_id):
+            qual = qm.qualifications[trainer_id].get(course_id)
+            return (qual is not None and qual['status'] == 'active'
+                    and qm.check_expiry(trainer_id, course_id, day)['status'] != 'expired')
+        
+        found = 0
+        for quals in list(qm.qualifications.values())[:20]:
+            courses = sorted(quals)[:3]
+            expected_all = sorted(t for t in qm.qualifications
+                                  if all(qualified(t, c) for c in courses))
+            expected_missing = {}
+            for trainer_id in qm.qualifications:
+                missing = [c for c in courses if not qualified(trainer_id, c)]
+                if len(missing) == 1:
+                    expected_missing[trainer_id] = missing[0]
+            assert qm.get_trainers_qualified_for_all(courses, as_of=day) == expected_all
+            assert qm.get_trainers_missing_one(courses, as_of=day) == expected_missing
+            found += len(expected_all) + len(expected_missing)
+        assert found
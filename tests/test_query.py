@@ -0,0 +1,167 @@
+"""
+Tests for query module
+"""
+
+import random
+import pytest
+from benchmarks.generator import CatalogGenerator
+from mcthelper.modules.clock import ManualClock
+from mcthelper.modules.query import QueryEngine, QueryError, parse_query
+
+
+@pytest.fixture(scope='module')
+def catalog():
+    """Synthetic catalog with qualifications evaluated on a fixed day."""
+    catalog = CatalogGenerator(scale=400, seed=7).build()
+    catalog['qual_manager'].clock = ManualClock('2025-01-01')
+    return catalog
+
+
+@pytest.fixture
+def engine(catalog):
+    """Query engine over the synthetic catalog."""
+    return QueryEngine(catalog['course_details'], catalog['summary_info'],
+                       catalog['qual_manager'], catalog['lecture_prep'])
+
+
+def naive(catalog, level=None, topic=None, summary_word=None, min_trainers=None, max_duration=None):
+    """Reference implementation with nested loops over every manager."""
+    results = []
+    qm = catalog['qual_manager']
+    for course_id, course in catalog['course_details'].courses.items():
+        if level and course['level'].lower() != level.lower():
+            continue
+        if topic and topic.lower() not in (t.lower() for t in course['topics']):
+            continue
+        if max_duration is not None and course['duration'] > max_duration:
+            continue
+        if summary_word:
+            summary = catalog['summary_info'].get_summary(course_id)
+            text = ' '.join([summary['overview'], summary['target_audience'],
+                             *summary['key_points'], *summary['prerequisites']]).lower()
+            if summary_word.lower() not in text.split():
+                continue
+        if min_trainers is not None and len(qm.get_qualified_trainers(course_id)) < min_trainers:
+            continue
+        results.append(course_id)
+    return sorted(results)
+
+
+class TestQuery:
+    """Test cases for the query language and planner."""
+
+    def test_parse(self):
+        """Test parsing conditions joined by 'and'."""
+        conditions = parse_query("level = Intermediate AND topics = 'Machine Learning' "
+                                 'and summary ~ "data engineers" and trainers >= 3')
+        assert [repr(c) for c in conditions] == [
+            'level = "Intermediate"', 'topic = "Machine Learning"',
+            'summary ~ "data engineers"', 'trainers >= 3']
+
+    @pytest.mark.parametrize('text', [
+        '', 'level', 'level = ', 'level Intermediate', 'colour = red',
+        'level ~ Inter', 'duration > long', 'level = A or level = B', 'level = A and',
+    ])
+    def test_parse_errors(self, text):
+        """Test that invalid queries raise QueryError."""
+        with pytest.raises(QueryError):
+            parse_query(text)
+
+    def test_missing_manager(self, catalog):
+        """Test that conditions on managers not given are rejected."""
+        engine = QueryEngine(catalog['course_details'])
+        with pytest.raises(QueryError):
+            engine.query('trainers >= 1')
+        with pytest.raises(QueryError):
+            engine.query().where('summary', '~', 'azure')
+
+    def test_matches_naive_loops(self, catalog, engine):
+        """Test random queries against nested loops."""
+        rng = random.Random(3)
+        for _ in range(40):
+            level = rng.choice([None, 'Beginner', 'Intermediate', 'advanced'])
+            topic = rng.choice([None, 'Security', 'Data', 'Compliance'])
+            word = rng.choice([None, 'engineers', 'monitor', 'compliance'])
+            trainers = rng.choice([None, 1, 2])
+            duration = rng.choice([None, 2, 4])
+            query = engine.query()
+            if level:
+                query = query.where('level', '=', level)
+            if topic:
+                query = query.where('topic', '=', topic)
+            if word:
+                query = query.where('summary', '~', word)
+            if trainers is not None:
+                query = query.where('trainers', '>=', trainers)
+            if duration is not None:
+                query = query.where('duration', '<=', duration)
+            if not query.conditions:
+                continue
+            assert query.execute() == naive(catalog, level, topic, word, trainers, duration)
+
+    def test_text_and_numeric_conditions(self, catalog, engine):
+        """Test contains, inequality and prep hour conditions."""
+        courses = catalog['course_details'].courses
+        lp = catalog['lecture_prep']
+        result = engine.query("name ~ 'azure' and level != Beginner and prep_hours < 10").execute()
+        expected = sorted(c for c, info in courses.items()
+                          if 'azure' in info['name'].lower() and info['level'] != 'Beginner'
+                          and lp.get_prep_hours(c) < 10)
+        assert result == expected
+        assert engine.query('topic != Security and topic ~ data').execute() == sorted(
+            c for c, info in courses.items() if 'Security' not in info['topics']
+            and any('data' in t.lower() for t in info['topics']))
+
+    def test_plan_uses_smallest_index_first(self, engine):
+        """Test that the most selective index supplies the candidates."""
+        plan = engine.query('duration >= 2 and level = Beginner and id = AZ-100').plan()
+        assert [(s.kind, s.condition.field) for s in plan.steps] == [
+            ('index', 'id'), ('filter', 'level'), ('filter', 'duration')]
+
+    def test_plan_without_indexes_scans(self, catalog):
+        """Test the scan fallback when no index serves a condition."""
+        engine = QueryEngine(catalog['course_details'], indexed_fields=())
+        plan = engine.query('duration >= 2 and level = Beginner').plan()
+        assert [s.kind for s in plan.steps] == ['scan', 'filter', 'filter']
+        assert plan.steps[1].condition.field == 'level'
+        assert plan.execute() == sorted(
+            c for c, info in catalog['course_details'].courses.items()
+            if info['level'] == 'Beginner' and info['duration'] >= 2)
+
+    def test_trainer_index_is_rechecked(self, engine):
+        """Test that the holder index is followed by an active-trainer check."""
+        plan = engine.query('trainers >= 2').plan()
+        assert [s.kind for s in plan.steps] == ['index', 'filter']
+        plan.execute()
+        assert plan.steps[1].actual <= plan.steps[0].actual
+
+    def test_explain(self, engine):
+        """Test the plan description before and after execution."""
+        plan = engine.query('level = Intermediate and summary ~ engineers').plan()
+        text = plan.explain()
+        assert text.startswith('Plan over 400 courses:')
+        assert 'via level index' in text or 'via summary search index' in text
+        assert 'actual' not in text
+        plan.execute()
+        assert 'actual' in plan.explain()
+
+    def test_indexes_follow_changes(self):
+        """Test that level, topic and trainer indexes track manager changes."""
+        catalog = CatalogGenerator(scale=10).build()
+        cd, qm = catalog['course_details'], catalog['qual_manager']
+        qm.clock = ManualClock('2025-01-01')
+        engine = QueryEngine(cd, qual_manager=qm)
+        cd.add_course('ZZ-999', {'name': 'New', 'description': 'New course', 'duration': 1,
+                                 'level': 'Expert', 'topics': ['Quantum']})
+        assert engine.query('level = expert and topic = quantum').execute() == ['ZZ-999']
+        qm.add_qualification('T-1', 'ZZ-999', {'certification_date': '2024-06-01',
+                                               'expiry_date': '2026-06-01', 'status': 'active'})
+        assert engine.query('trainers >= 1 and level = Expert').execute() == ['ZZ-999']
+        qm.remove_qualification('T-1', 'ZZ-999')
+        assert engine.query('trainers >= 1 and level = Expert').execute() == []
+        cd.add_course('ZZ-999', {'name': 'New', 'description': 'New course', 'duration': 1,
+                                 'level': 'Beginner', 'topics': ['Quantum']})
+        assert engine.query('level = expert').execute() == []
+        cd.remove_course('ZZ-999')
+        assert engine.query('topic = quantum').execute() == []
+        assert 'quantum' not in engine.indexes['topic']
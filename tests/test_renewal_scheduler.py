@@ -0,0 +1,96 @@
+"""
+Tests for RenewalScheduler module
+"""
+
+import pytest
+from datetime import date
+from mcthelper.modules.clock import ManualClock
+from mcthelper.modules.qualifications import QualificationManager
+from mcthelper.modules.renewal_scheduler import RenewalScheduler
+
+
+def qual(expiry_date, status='active'):
+    """Build qualification data expiring on the given date."""
+    return {
+        'certification_date': '2024-01-01',
+        'expiry_date': expiry_date,
+        'status': status
+    }
+
+
+class TestRenewalScheduler:
+    """Test cases for RenewalScheduler class."""
+
+    def test_schedules_existing_qualifications(self):
+        """Test that qualifications present at creation are scheduled."""
+        qm = QualificationManager()
+        qm.add_qualification('TRAINER-001', 'TEST-001', qual('2025-06-30'))
+        qm.add_qualification('TRAINER-002', 'TEST-001', qual('2025-03-31'))
+        scheduler = RenewalScheduler(qm, clock=ManualClock('2025-01-01'))
+        assert len(scheduler) == 2
+        reminder = scheduler.peek_next()
+        assert reminder['trainer_id'] == 'TRAINER-002'
+        assert reminder['notice_date'] == '2024-12-31'
+
+    def test_pop_due_with_fast_forward(self):
+        """Test that reminders become due as the clock advances."""
+        qm = QualificationManager()
+        clock = ManualClock('2025-01-01')
+        scheduler = RenewalScheduler(qm, clock=clock)
+        qm.add_qualification('TRAINER-001', 'TEST-001', qual('2025-06-30'))
+        qm.add_qualification('TRAINER-002', 'TEST-001', qual('2025-09-30'))
+
+        assert scheduler.pop_due() == []
+        clock.set(date(2025, 4, 1))
+        due = scheduler.pop_due()
+        assert [r['trainer_id'] for r in due] == ['TRAINER-001']
+        assert due[0]['days_remaining'] == 90
+
+        clock.advance(days=365)
+        assert [r['trainer_id'] for r in scheduler.pop_due()] == ['TRAINER-002']
+        assert len(scheduler) == 0
+        assert scheduler.peek_next() is None
+
+    def test_readded_qualification_reschedules(self):
+        """Test that re-adding a qualification replaces its reminder."""
+        qm = QualificationManager()
+        clock = ManualClock('2025-01-01')
+        scheduler = RenewalScheduler(qm, clock=clock)
+        qm.add_qualification('TRAINER-001', 'TEST-001', qual('2025-03-01'))
+        qm.add_qualification('TRAINER-001', 'TEST-001', qual('2026-03-01'))
+
+        assert len(scheduler) == 1
+        assert scheduler.pop_due() == []
+        assert scheduler.peek_next()['expiry_date'] == '2026-03-01'
+
+    def test_frequent_updates_keep_heap_bounded(self):
+        """Test that superseded reminders are compacted away."""
+        qm = QualificationManager()
+        scheduler = RenewalScheduler(qm, clock=ManualClock('2025-01-01'))
+        qm.add_qualification('TRAINER-002', 'TEST-001', qual('2025-12-31'))
+        for day in range(1, 29):
+            qm.add_qualification('TRAINER-001', 'TEST-001', qual(f'2025-02-{day:02d}'))
+        assert len(scheduler._heap) <= 2 * len(scheduler)
+        assert scheduler.peek_next()['expiry_date'] == '2025-02-28'
+        qm.add_qualification('TRAINER-001', 'TEST-001', qual('2025-02-28', status='expired'))
+        qm.add_qualification('TRAINER-002', 'TEST-001', qual('2025-12-31', status='expired'))
+        assert scheduler._heap == []
+
+    def test_inactive_qualification_unscheduled(self):
+        """Test that expired or invalid qualifications are not scheduled."""
+        qm = QualificationManager()
+        scheduler = RenewalScheduler(qm, clock=ManualClock('2025-01-01'))
+        qm.add_qualification('TRAINER-001', 'TEST-001', qual('2025-03-01'))
+        qm.add_qualification('TRAINER-001', 'TEST-001', qual('2025-03-01', status='expired'))
+        qm.add_qualification('TRAINER-002', 'TEST-001', qual('not-a-date'))
+        assert len(scheduler) == 0
+        assert scheduler.pop_due() == []
+
+    def test_custom_notice_period(self):
+        """Test a shorter notice period."""
+        qm = QualificationManager()
+        qm.add_qualification('TRAINER-001', 'TEST-001', qual('2025-01-31'))
+        scheduler = RenewalScheduler(qm, notice_days=30, clock=ManualClock('2024-12-31'))
+        assert len(scheduler.pop_due()) == 0
+        scheduler.clock.advance(days=1)
+        assert len(scheduler.pop_due()) == 1
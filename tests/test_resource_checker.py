@@ -0,0 +1,167 @@
+"""
+Tests for resource checker module
+"""
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from mcthelper.modules.lecture_prep import LecturePreparation
+from mcthelper.modules.resource_checker import ResourceChecker, check_resources, is_checkable
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Keep-alive handler with a few canned responses."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_HEAD(self):
+        if self.path.startswith('/slow'):
+            time.sleep(0.5)
+        if self.path == '/no-head':
+            self.send_response(405)
+        elif self.path == '/moved':
+            self.send_response(301)
+            self.send_header('Location', '/ok/moved')
+        elif self.path.startswith('/ok') or self.path.startswith('/slow'):
+            self.send_response(200)
+        else:
+            self.send_response(404)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'ok')
+
+    def log_message(self, *args):
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    """Threaded server with room for many simultaneous connections."""
+
+    daemon_threads = True
+    request_queue_size = 64
+
+
+@pytest.fixture
+def server():
+    """Local HTTP server counting accepted connections."""
+    httpd = StubServer(('127.0.0.1', 0), StubHandler)
+    httpd.lock = threading.Lock()
+    httpd.connections = 0
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield httpd, f'http://127.0.0.1:{httpd.server_address[1]}'
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def run(checker, coroutine):
+    """Run a coroutine and close the checker's connections afterwards."""
+    async def main():
+        try:
+            return await coroutine
+        finally:
+            await checker.close()
+    return asyncio.run(main())
+
+
+class TestResourceChecker:
+    """Test cases for ResourceChecker class."""
+
+    def test_status_codes(self, server):
+        """Test reachable, missing, redirected and HEAD-less resources."""
+        _, base = server
+        checker = ResourceChecker()
+        results = run(checker, checker.check_urls(
+            [f'{base}/ok', f'{base}/missing', f'{base}/moved', f'{base}/no-head']))
+        assert results[f'{base}/ok']['ok'] is True
+        assert results[f'{base}/missing']['status'] == 404
+        assert results[f'{base}/missing']['ok'] is False
+        assert results[f'{base}/moved']['status'] == 200
+        assert results[f'{base}/no-head']['status'] == 200
+
+    def test_connections_are_pooled(self, server):
+        """Test that many URLs on one host share a few connections."""
+        httpd, base = server
+        checker = ResourceChecker(per_host=2)
+        urls = [f'{base}/ok/{i}' for i in range(40)]
+        results = run(checker, checker.check_urls(urls))
+        assert all(result['ok'] for result in results.values())
+        assert httpd.connections <= 2
+
+    def test_timeout(self, server):
+        """Test that slow responses are reported as timeouts."""
+        _, base = server
+        checker = ResourceChecker(timeout=0.1)
+        result = run(checker, checker.check(f'{base}/slow'))
+        assert result['ok'] is False
+        assert result['error'] == 'timeout'
+
+    def test_concurrent_checks(self, server):
+        """Test that slow URLs are checked in parallel."""
+        _, base = server
+        checker = ResourceChecker(per_host=10)
+        start = time.perf_counter()
+        results = run(checker, checker.check_urls([f'{base}/slow/{i}' for i in range(10)]))
+        assert all(result['ok'] for result in results.values())
+        assert time.perf_counter() - start < 2
+
+    def test_results_cached_with_ttl(self, server):
+        """Test that cached results are reused until they expire."""
+        httpd, base = server
+        now = [0.0]
+        checker = ResourceChecker(ttl=60, clock=lambda: now[0])
+        run(checker, checker.check(f'{base}/ok'))
+        opened = httpd.connections
+        cached = run(checker, checker.check(f'{base}/ok'))
+        assert cached['elapsed'] == 0.0
+        assert httpd.connections == opened
+        now[0] = 61
+        assert checker.cached_result(f'{base}/ok') is None
+
+    def test_errors_cached_briefly(self):
+        """Test that connection errors expire after the shorter error TTL."""
+        now = [0.0]
+        checker = ResourceChecker(timeout=1, ttl=3600, error_ttl=30, clock=lambda: now[0])
+        run(checker, checker.check('http://127.0.0.1:1/'))
+        assert checker.cached_result('http://127.0.0.1:1/')['ok'] is False
+        now[0] = 31
+        assert checker.cached_result('http://127.0.0.1:1/') is None
+
+    def test_connection_errors(self):
+        """Test that unreachable hosts are reported, not raised."""
+        checker = ResourceChecker(timeout=1)
+        result = run(checker, checker.check('http://127.0.0.1:1/'))
+        assert result['ok'] is False
+        assert result['error']
+
+    def test_check_catalog(self, server):
+        """Test checking preparation resources and skipping plain names."""
+        _, base = server
+        lp = LecturePreparation()
+        lp.add_prep_material('AZ-900', {
+            'slides': [], 'labs': [], 'demos': [], 'timing': {},
+            'resources': ['Microsoft Learn', f'{base}/ok', f'{base}/gone']
+        })
+        report = check_resources(lp)
+        assert report['broken'] == [('course:AZ-900', f'{base}/gone')]
+        assert report['skipped'] == [('course:AZ-900', 'Microsoft Learn')]
+        assert len(report['results']) == 2
+
+    def test_is_checkable(self):
+        """Test URL detection."""
+        assert is_checkable('https://learn.microsoft.com')
+        assert not is_checkable('Azure Documentation')
+        assert not is_checkable(None)
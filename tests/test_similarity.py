@@ -0,0 +1,120 @@
+"""
+Tests for similarity module
+"""
+
+import math
+import pytest
+from benchmarks.generator import CatalogGenerator
+from mcthelper.modules.course_details import CourseDetails
+from mcthelper.modules.similarity import CourseSimilarity
+from mcthelper.modules.summary_info import SummaryInfo
+
+
+def course(name, description, topics):
+    """Build course data with the required fields."""
+    return {'name': name, 'description': description, 'duration': 1,
+            'level': 'Beginner', 'topics': topics}
+
+
+def brute_force(similarity, course_id, k):
+    """Score every other course by the dot product of normalized vectors."""
+    query = similarity.vector(course_id)
+    scores = []
+    for other in similarity.course_details.courses:
+        if other == course_id:
+            continue
+        vector = similarity.vector(other)
+        score = sum(weight * vector.get(term, 0.0) for term, weight in query.items())
+        if score > 0:
+            scores.append((-score, other))
+    return [(other, -negative) for negative, other in sorted(scores)[:k]]
+
+
+@pytest.fixture
+def catalog():
+    """A small catalog with summaries."""
+    cd = CourseDetails()
+    si = SummaryInfo()
+    cd.add_course('AZ-104', course('Azure Administrator', 'Manage Azure identities and storage',
+                                   ['Azure', 'Identity', 'Storage']))
+    cd.add_course('AZ-900', course('Azure Fundamentals', 'Cloud concepts and Azure services',
+                                   ['Azure', 'Cloud']))
+    cd.add_course('AZ-500', course('Azure Security Engineer', 'Secure Azure identities',
+                                   ['Azure', 'Security', 'Identity']))
+    cd.add_course('PL-300', course('Power BI Analyst', 'Model and visualize data',
+                                   ['Power BI', 'Data']))
+    si.add_summary('AZ-104', {'overview': 'Admin', 'key_points': ['Configure storage accounts'],
+                              'prerequisites': [], 'target_audience': 'Admins'})
+    return cd, si
+
+
+class TestCourseSimilarity:
+    """Test cases for CourseSimilarity."""
+
+    def test_similar_ranks_by_shared_terms(self, catalog):
+        """Test that courses sharing rare terms rank first and unrelated ones are omitted."""
+        cd, si = catalog
+        similarity = CourseSimilarity(cd, si)
+        results = similarity.similar('AZ-104')
+        assert [r['id'] for r in results] == ['AZ-500', 'AZ-900']
+        assert 0 < results[1]['score'] < results[0]['score'] < 1
+        assert similarity.similar('AZ-104', k=1) == results[:1]
+        similarity.clear_cache()
+        assert similarity.similar('AZ-104') == results
+        assert similarity.similar('XX-1') == []
+
+    def test_vectors_are_normalized(self, catalog):
+        """Test unit-length vectors built from all text fields."""
+        cd, si = catalog
+        similarity = CourseSimilarity(cd, si)
+        vector = similarity.vector('AZ-104')
+        assert math.isclose(sum(w * w for w in vector.values()), 1.0)
+        assert {'administrator', 'identities', 'storage', 'accounts'} <= set(vector)
+        assert 'and' not in vector
+        assert similarity.vector('XX-1') == {}
+
+    def test_matches_brute_force(self):
+        """Test that index queries agree with pairwise comparison."""
+        cd = CatalogGenerator(scale=400, seed=3).build()['course_details']
+        similarity = CourseSimilarity(cd)
+        for course_id in list(cd.courses)[:20]:
+            expected = brute_force(similarity, course_id, 5)
+            results = similarity.similar(course_id, k=5)
+            assert [r['id'] for r in results] == [other for other, _ in expected]
+            for result, (_, score) in zip(results, expected):
+                assert math.isclose(result['score'], score)
+
+    def test_incremental_updates(self, catalog):
+        """Test that added, changed and removed courses update results."""
+        cd, si = catalog
+        similarity = CourseSimilarity(cd, si, reweight_ratio=10)
+        assert similarity.similar('PL-300') == []
+        cd.add_course('PL-900', course('Power Platform', 'Build apps with data', ['Power BI']))
+        assert [r['id'] for r in similarity.similar('PL-300')] == ['PL-900']
+        cd.add_course('PL-900', course('Power Apps', 'Build apps', ['Power Apps']))
+        si.add_summary('PL-300', {'overview': 'BI', 'key_points': ['Build apps'],
+                                  'prerequisites': [], 'target_audience': 'Analysts'})
+        assert [r['id'] for r in similarity.similar('PL-300')] == ['PL-900']
+        cd.remove_course('PL-900')
+        assert similarity.similar('PL-300') == []
+        assert len(similarity) == 4
+
+    def test_reweight_after_growth(self, catalog):
+        """Test that IDF values are recomputed once the catalog grows enough."""
+        cd, _ = catalog
+        similarity = CourseSimilarity(cd, reweight_ratio=0.5)
+        idf = similarity._idf['azure']
+        cd.add_course('AZ-204', course('Azure Developer', 'Build on Azure', ['Azure']))
+        assert similarity._idf['azure'] == idf
+        cd.add_course('AZ-305', course('Azure Architect', 'Design Azure', ['Azure']))
+        cd.add_course('AZ-400', course('Azure DevOps', 'Ship with Azure', ['Azure']))
+        assert similarity._weighted_count == 7
+        assert similarity._idf['azure'] < idf
+
+    def test_accumulator_limit_keeps_top_results(self):
+        """Test that a small candidate limit still finds the closest courses."""
+        cd = CatalogGenerator(scale=400, seed=3).build()['course_details']
+        exact = CourseSimilarity(cd)
+        limited = CourseSimilarity(cd, accumulator_limit=50)
+        course_id = next(iter(cd.courses))
+        assert limited.similar(course_id, k=3)[0] == exact.similar(course_id, k=3)[0]
@@ -105,3 +105,70 @@ class TestSummaryInfo:
         si = SummaryInfo()
         result = si.get_prerequisites('NOTFOUND')
         assert result == []
+        
+    def test_remove_summary(self):
+        """Test removing a summary."""
+        si = SummaryInfo()
+        si.add_summary('TEST-001', {
+            'overview': 'Overview',
+            'key_points': [],
+            'prerequisites': [],
+            'target_audience': 'Everyone'
+        })
+        assert si.remove_summary('TEST-001') is True
+        assert si.get_summary('TEST-001') is None
+        assert si.remove_summary('TEST-001') is False
+    
+    
+    def test_search(self):
+        """Test ranked full-text search across summary fields."""
+        si = SummaryInfo()
+        si.add_summary('AZ-104', {
+            'overview': 'Administer Azure resources',
+            'key_points': ['Manage identities'],
+            'prerequisites': ['Azure Fundamentals', 'AZ-900'],
+            'target_audience': 'Administrators'
+        })
+        si.add_summary('DP-203', {
+            'overview': 'Build data pipelines on Azure',
+            'key_points': ['Design data storage'],
+            'prerequisites': ['SQL basics'],
+            'target_audience': 'Data engineers'
+        })
+        
+        results = si.search('"Azure Fundamentals"', fields=['prerequisites'])
+        assert [r['id'] for r in results] == ['AZ-104']
+        assert results[0]['overview'] == 'Administer Azure resources'
+        assert [r['id'] for r in si.search('data engineers')] == ['DP-203']
+        assert len(si.search('azure')) == 2
+        assert si.search('') == []
+    
+    def test_search_index_follows_updates(self):
+        """Test that the index is maintained by add and remove."""
+        si = SummaryInfo()
+        summary = {
+            'overview': 'Original overview',
+            'key_points': [],
+            'prerequisites': [],
+            'target_audience': 'Everyone'
+        }
+        si.add_summary('TEST-001', summary)
+        si.add_summary('TEST-001', dict(summary, overview='Revised overview'))
+        assert si.search('original') == []
+        assert [r['id'] for r in si.search('revised')] == ['TEST-001']
+        si.remove_summary('TEST-001')
+        assert si.search('revised') == []
+    
+    def test_add_summary_with_non_text_values(self):
+        """Test that non-string field values are stored but not indexed."""
+        si = SummaryInfo()
+        summary = {
+            'overview': None,
+            'key_points': ['Deploy containers', None, 5],
+            'prerequisites': 5,
+            'target_audience': ['Developers']
+        }
+        assert si.add_summary('TEST-001', summary) is True
+        assert si.get_summary('TEST-001')['overview'] is None
+        assert [r['id'] for r in si.search('containers')] == ['TEST-001']
+        assert [r['id'] for r in si.search('developers')] == ['TEST-001']
@@ -0,0 +1,119 @@
+"""
+Tests for sync module
+"""
+
+import pytest
+from benchmarks.generator import CatalogGenerator
+from mcthelper.modules.sync import (
+    CatalogSync, bucket_of, record_hash, read_delta, write_delta, BUCKET_COUNT
+)
+
+
+def make_instance(scale=50):
+    """Build a synthetic catalog and its CatalogSync."""
+    catalog = CatalogGenerator(scale=scale, seed=3).build()
+    return catalog, CatalogSync(**catalog)
+
+
+class TestRecordHashing:
+    """Test cases for record and key hashing."""
+
+    def test_record_hash_is_order_independent(self):
+        """Test that field order does not change the hash."""
+        assert record_hash({'a': 1, 'b': [1, 2]}) == record_hash({'b': [1, 2], 'a': 1})
+        assert record_hash({'a': 1}) != record_hash({'a': 2})
+
+    def test_bucket_of(self):
+        """Test that keys map to a stable bucket."""
+        assert bucket_of('AZ-900') == bucket_of('AZ-900')
+        assert 0 <= bucket_of('AZ-900') < BUCKET_COUNT
+
+
+class TestCatalogSync:
+    """Test cases for CatalogSync class."""
+
+    def test_identical_catalogs_have_no_diff(self):
+        """Test that identical instances produce equal digests."""
+        _, source = make_instance()
+        _, replica = make_instance()
+        assert source.digest() == replica.digest()
+        assert source.diff_buckets(replica.digest()) == {}
+
+    def test_hashes_follow_manager_changes(self):
+        """Test that record hashes are updated on add and remove."""
+        catalog, sync = make_instance()
+        root = sync.digest()['courses']['root']
+        cd = catalog['course_details']
+        info = dict(cd.get_course('AZ-100'), name='Renamed')
+        cd.add_course('AZ-100', info)
+        assert sync.record_hashes('courses')['AZ-100'] == record_hash(info)
+        assert sync.digest()['courses']['root'] != root
+
+        cd.remove_course('AZ-100')
+        assert 'AZ-100' not in sync.record_hashes('courses')
+
+    def test_delta_contains_only_changes(self):
+        """Test that the delta carries only changed records."""
+        source_catalog, source = make_instance()
+        _, replica = make_instance()
+        source_catalog['course_details'].add_course('NEW-001', {
+            'name': 'New', 'description': 'New course', 'duration': 1,
+            'level': 'Beginner', 'topics': []
+        })
+        source_catalog['summary_info'].remove_summary('AZ-100')
+        qm = source_catalog['qual_manager']
+        trainer_id, courses = next(iter(qm.qualifications.items()))
+        course_id = next(iter(courses))
+        qm.add_qualification(trainer_id, course_id, dict(courses[course_id], status='expired'))
+
+        replica_digest = replica.digest()
+        buckets = source.diff_buckets(replica_digest)
+        assert set(buckets) == {'courses', 'summaries', 'qualifications'}
+        delta = source.make_delta(replica_digest, replica.manifest(buckets))
+
+        assert list(delta['stores']['courses']['upsert']) == ['NEW-001']
+        assert delta['stores']['summaries'] == {'upsert': {}, 'delete': ['AZ-100']}
+        assert len(delta['stores']['qualifications']['upsert']) == 1
+
+    def test_sync_from_converges(self):
+        """Test that a replica matches the source after syncing."""
+        source_catalog, source = make_instance()
+        replica_catalog, replica = make_instance()
+        replica_catalog['course_details'].remove_course('AZ-100')
+        source_catalog['tech_learning'].add_learning_path('path-1', {
+            'title': 'Path', 'technologies': ['tech-000001'], 'modules': [],
+            'duration': '1 week', 'level': 'Beginner'
+        })
+        replica_catalog['lecture_prep'].add_prep_material('LOCAL-1', {
+            'slides': [], 'labs': [], 'demos': [], 'resources': [], 'timing': {}
+        })
+
+        counts = replica.sync_from(source)
+        assert counts['rejected'] == 0
+        assert counts['deleted'] == 1
+        assert replica.digest() == source.digest()
+        assert replica_catalog['course_details'].courses == source_catalog['course_details'].courses
+        assert replica_catalog['tech_learning'].get_learning_path('path-1') is not None
+        assert replica.sync_from(source) == {'upserted': 0, 'deleted': 0, 'rejected': 0}
+
+    def test_refresh_after_in_place_mutation(self):
+        """Test that refresh picks up records mutated without notification."""
+        catalog, sync = make_instance()
+        before = sync.digest()['courses']['root']
+        catalog['course_details'].courses['AZ-100']['level'] = 'Expert'
+        assert sync.digest()['courses']['root'] == before
+        sync.refresh()
+        assert sync.digest()['courses']['root'] != before
+
+    def test_delta_file_round_trip(self, tmp_path):
+        """Test writing and reading a compressed delta file."""
+        delta = {'version': 1, 'stores': {'courses': {'upsert': {'A': {'x': 1}}, 'delete': []}}}
+        path = tmp_path / 'delta.json.gz'
+        write_delta(delta, str(path))
+        assert read_delta(str(path)) == delta
+
+    def test_apply_delta_rejects_unknown_version(self):
+        """Test that unsupported delta versions raise ValueError."""
+        _, sync = make_instance(scale=5)
+        with pytest.raises(ValueError):
+            sync.apply_delta({'version': 99, 'stores': {}})
@@ -181,3 +181,75 @@ class TestTechLearning:
         updates = tl.get_latest_updates()
         assert len(updates) == 2
         assert all('name' in u and 'version' in u for u in updates)
+    
+    def test_learning_path_prerequisites(self):
+        """Test transitive prerequisites across paths and technologies."""
+        tl = TechLearning()
+        tl.add_technology('azure-ml', {
+            'name': 'Azure ML',
+            'category': 'AI',
+            'description': 'ML platform',
+            'latest_version': '2.0',
+            'resources': ['Doc'],
+            'prerequisites': ['python']
+        })
+        tl.add_learning_path('fundamentals', {
+            'title': 'Cloud Fundamentals',
+            'technologies': ['azure-basics'],
+            'modules': ['Module 1'],
+            'duration': '1 week',
+            'level': 'Beginner'
+        })
+        tl.add_learning_path('ai-engineer', {
+            'title': 'AI Engineer',
+            'technologies': ['azure-ml'],
+            'modules': ['Module 1'],
+            'duration': '4 weeks',
+            'level': 'Advanced',
+            'requires': ['fundamentals']
+        })
+        
+        assert tl.get_all_prerequisites('ai-engineer') == [
+            'azure-basics', 'azure-ml', 'fundamentals', 'python']
+        order = tl.get_study_order(['ai-engineer'])
+        assert order[-1] == 'ai-engineer'
+        assert order.index('python') < order.index('azure-ml')
+        assert tl.get_skill_path('python', 'ai-engineer') == ['python', 'azure-ml', 'ai-engineer']
+    
+    def test_add_learning_path_cycle_rejected(self):
+        """Test that a learning path requiring itself transitively is rejected."""
+        tl = TechLearning()
+        path = {
+            'title': 'Path',
+            'technologies': [],
+            'modules': [],
+            'duration': '1 week',
+            'level': 'Beginner'
+        }
+        assert tl.add_learning_path('a', {**path, 'requires': ['b']}) is True
+        assert tl.add_learning_path('b', {**path, 'requires': ['a']}) is False
+        assert 'b' not in tl.learning_paths
+        
+    def test_remove_technology_and_learning_path(self):
+        """Test removing technologies and learning paths."""
+        tl = TechLearning()
+        tl.add_technology('azure-ai', {
+            'name': 'Azure AI',
+            'category': 'AI',
+            'description': 'AI services',
+            'latest_version': '2024.1',
+            'resources': []
+        })
+        tl.add_learning_path('ai-path', {
+            'title': 'AI Path',
+            'technologies': ['azure-ai'],
+            'modules': [],
+            'duration': '1 week',
+            'level': 'Beginner'
+        })
+        assert tl.remove_learning_path('ai-path') is True
+        assert tl.get_all_prerequisites('ai-path') == []
+        assert tl.remove_technology('azure-ai') is True
+        assert tl.get_technology('azure-ai') is None
+        assert tl.remove_technology('azure-ai') is False
+    
@@ -0,0 +1,169 @@
+"""
+Tests for tenancy module
+"""
+
+import pytest
+from mcthelper.modules.course_details import CourseDetails
+from mcthelper.modules.lecture_prep import LecturePreparation
+from mcthelper.modules.metrics import public_methods
+from mcthelper.modules.summary_info import SummaryInfo
+from mcthelper.modules.tech_learning import TechLearning
+from mcthelper.modules.tenancy import TenantCatalog
+
+
+def course(name, description='Official course'):
+    """Build course data."""
+    return {'name': name, 'description': description, 'duration': 1,
+            'level': 'Beginner', 'topics': ['Cloud']}
+
+
+def summary(overview):
+    """Build summary data."""
+    return {'overview': overview, 'key_points': ['Point'],
+            'prerequisites': [], 'target_audience': 'Everyone'}
+
+
+@pytest.fixture
+def catalog():
+    """Tenant catalog over two shared courses with summaries."""
+    cd = CourseDetails()
+    si = SummaryInfo()
+    tl = TechLearning()
+    cd.add_course('AZ-900', course('Azure Fundamentals'))
+    cd.add_course('AZ-104', course('Azure Administrator'))
+    si.add_summary('AZ-900', summary('Cloud concepts and Azure services'))
+    si.add_summary('AZ-104', summary('Manage Azure identities and governance'))
+    tl.add_technology('azure-ai', {'name': 'Azure AI', 'category': 'AI', 'description': '',
+                                   'latest_version': '1', 'resources': []})
+    return TenantCatalog(course_details=cd, summary_info=si, tech_learning=tl, max_records=3)
+
+
+class TestTenantCatalog:
+    """Test cases for TenantCatalog class."""
+
+    def test_create_and_list_tenants(self, catalog):
+        """Test tenant registry operations."""
+        assert catalog.create_tenant('contoso') is not None
+        assert catalog.create_tenant('contoso') is None
+        catalog.create_tenant('fabrikam')
+        assert catalog.list_tenants() == ['contoso', 'fabrikam']
+        assert catalog.remove_tenant('fabrikam') is True
+        assert catalog.get_tenant('fabrikam') is None
+
+    def test_shared_records_visible_without_copying(self, catalog):
+        """Test that tenants read shared records without storing them."""
+        tenant = catalog.create_tenant('contoso')
+        shared = catalog.shared['course_details'].get_course('AZ-900')
+        assert tenant.course_details.get_course('AZ-900') is shared
+        assert len(tenant.course_details.list_all_courses()) == 2
+        assert tenant.stats()['records'] == 0
+
+    def test_overrides_are_isolated(self, catalog):
+        """Test that one tenant's changes are invisible to others and the base."""
+        contoso = catalog.create_tenant('contoso')
+        fabrikam = catalog.create_tenant('fabrikam')
+        assert contoso.course_details.add_course('AZ-900', course('Azure Fundamentals (Contoso)'))
+        assert contoso.course_details.add_course('CT-100', course('Contoso Onboarding'))
+
+        assert contoso.course_details.get_course('AZ-900')['name'] == 'Azure Fundamentals (Contoso)'
+        assert fabrikam.course_details.get_course('AZ-900')['name'] == 'Azure Fundamentals'
+        assert catalog.shared['course_details'].get_course('CT-100') is None
+        ids = sorted(c['id'] for c in contoso.course_details.list_all_courses())
+        assert ids == ['AZ-104', 'AZ-900', 'CT-100']
+        assert contoso.course_details.record_ids('courses') == {'AZ-104', 'AZ-900', 'CT-100'}
+
+    def test_remove_hides_shared_record(self, catalog):
+        """Test that removing a shared record hides it for the tenant only."""
+        tenant = catalog.create_tenant('contoso')
+        assert tenant.course_details.remove_course('AZ-104') is True
+        assert tenant.course_details.remove_course('AZ-104') is False
+        assert tenant.course_details.get_course('AZ-104') is None
+        assert tenant.course_details.search_courses('Administrator') == []
+        assert catalog.shared['course_details'].get_course('AZ-104') is not None
+        assert tenant.stats()['hidden'] == 1
+
+        assert tenant.course_details.add_course('AZ-104', course('Azure Administrator v2'))
+        assert tenant.course_details.get_course('AZ-104')['name'] == 'Azure Administrator v2'
+
+    def test_quota(self, catalog):
+        """Test that tenants cannot store more records than their quota."""
+        tenant = catalog.create_tenant('contoso')
+        small = catalog.create_tenant('small', max_records=1)
+        for i in range(3):
+            assert tenant.course_details.add_course(f'CT-{i}', course(f'Course {i}'))
+        assert tenant.summary_info.add_summary('CT-0', summary('Over quota')) is False
+        assert tenant.course_details.add_course('CT-0', course('Updated')) is True
+        assert small.course_details.add_course('SM-1', course('Small'))
+        assert small.has_room() is False
+        assert small.qual_manager.add_qualification('T-1', 'SM-1', {
+            'certification_date': '2024-01-01', 'expiry_date': '2026-01-01', 'status': 'active'})
+        assert small.stats()['records'] == 1
+
+    def test_per_tenant_search_index(self, catalog):
+        """Test that summary search merges the tenant and shared indexes."""
+        tenant = catalog.create_tenant('contoso')
+        other = catalog.create_tenant('fabrikam')
+        tenant.summary_info.add_summary('CT-100', summary('Contoso Azure onboarding'))
+        tenant.summary_info.add_summary('AZ-104', summary('Contoso administration track'))
+
+        ids = [result['id'] for result in tenant.summary_info.search('azure')]
+        assert sorted(ids) == ['AZ-900', 'CT-100']
+        assert len(tenant.summary_info.search('contoso', limit=1)) == 1
+        assert other.summary_info.search('contoso') == []
+        assert 'contoso' in tenant.summary_info.local.search_index.postings
+        assert 'contoso' not in catalog.shared['summary_info'].search_index.postings
+
+    def test_technology_lists_merged(self, catalog):
+        """Test merged and re-sorted technology listings."""
+        tenant = catalog.create_tenant('contoso')
+        tenant.tech_learning.add_technology('aa-tool', {
+            'name': 'AA Tool', 'category': 'AI', 'description': '',
+            'latest_version': '2', 'resources': []})
+        names = [t['name'] for t in tenant.tech_learning.get_latest_updates()]
+        assert names == ['AA Tool', 'Azure AI']
+        assert len(tenant.tech_learning.get_by_category('AI')) == 2
+
+    def test_overlays_cover_manager_methods(self, catalog):
+        """Test that each overlay offers every public method of its manager."""
+        tenant = catalog.create_tenant('contoso')
+        for overlay in tenant.overlays().values():
+            assert [m for m in public_methods(overlay.local) if not hasattr(overlay, m)] == []
+
+    def test_technology_graph_merged(self, catalog):
+        """Test prerequisites and study order across tenant and shared records."""
+        tenant = catalog.create_tenant('contoso')
+        tl = tenant.tech_learning
+        tl.add_technology('ct-bot', {'name': 'Contoso Bot', 'category': 'AI', 'description': '',
+                                     'latest_version': '1', 'resources': [],
+                                     'prerequisites': ['azure-ai']})
+        assert tl.get_all_prerequisites('ct-bot') == ['azure-ai']
+        assert tl.get_study_order(['ct-bot']) == ['azure-ai', 'ct-bot']
+        assert tl.get_skill_path('azure-ai', 'ct-bot') == ['azure-ai', 'ct-bot']
+        tl.add_technology('azure-ai', {'name': 'Azure AI', 'category': 'AI', 'description': '',
+                                       'latest_version': '2', 'resources': [],
+                                       'prerequisites': ['python']})
+        assert tl.get_all_prerequisites('ct-bot') == ['azure-ai', 'python']
+        assert catalog.shared['tech_learning'].get_all_prerequisites('azure-ai') == []
+
+    def test_prep_hours_merged(self):
+        """Test catalog prep totals over the records visible to the tenant."""
+        shared_prep = LecturePreparation()
+        for course_id, timing in (('AZ-900', '2 hours'), ('AZ-104', '3 hours')):
+            shared_prep.add_prep_material(course_id, {
+                'slides': [], 'labs': [], 'demos': [], 'resources': [],
+                'timing': {'Module 1': timing}})
+        cd = CourseDetails()
+        cd.add_course('AZ-900', course('Azure Fundamentals'))
+        catalog = TenantCatalog(course_details=cd, lecture_prep=shared_prep)
+        tenant = catalog.create_tenant('contoso')
+        tenant.lecture_prep.add_prep_material('AZ-900', {
+            'slides': [], 'labs': [], 'demos': [], 'resources': [],
+            'timing': {'Module 1': '4 hours'}})
+        tenant.lecture_prep.remove_prep_material('AZ-104')
+        tenant.lecture_prep.add_prep_material('CT-100', {
+            'slides': [], 'labs': [], 'demos': [], 'resources': [],
+            'timing': {'Module 1': '30m'}})
+        assert tenant.lecture_prep.get_catalog_prep_hours() == 4.5
+        assert tenant.lecture_prep.get_prep_hours_by_level(tenant.course_details) == {
+            'Beginner': 4.0, 'Unknown': 0.5}
+        assert shared_prep.get_catalog_prep_hours() == 5.0
@@ -0,0 +1,69 @@
+"""
+Tests for text index module
+"""
+
+import pytest
+from mcthelper.modules.text_index import InvertedIndex, parse_query, tokenize
+
+
+class TestTokenize:
+    """Test cases for tokenization and query parsing."""
+
+    def test_tokenize(self):
+        """Test that identifiers stay whole and case is folded."""
+        assert tokenize('Requires AZ-900, .NET 8.0!') == ['requires', 'az-900', 'net', '8.0']
+
+    def test_parse_query(self):
+        """Test splitting quoted phrases and words."""
+        assert parse_query('engineers "Azure Fundamentals"') == [
+            ['engineers'], ['azure', 'fundamentals']]
+        assert parse_query('""') == []
+
+
+class TestInvertedIndex:
+    """Test cases for InvertedIndex class."""
+
+    def make_index(self):
+        """Build an index with three small documents."""
+        index = InvertedIndex({'title': 2.0})
+        index.add_document('a', {'title': 'Azure Fundamentals', 'body': ['Cloud basics']})
+        index.add_document('b', {'title': 'Azure Data', 'body': ['Azure Fundamentals knowledge']})
+        index.add_document('c', {'title': 'Security', 'body': ['Fundamentals', 'Azure tooling']})
+        return index
+
+    def test_all_terms_required(self):
+        """Test that every query term must match."""
+        index = self.make_index()
+        assert {doc for doc, _ in index.search('azure fundamentals')} == {'a', 'b', 'c'}
+        assert index.search('azure missing') == []
+
+    def test_phrase_query(self):
+        """Test that phrases match consecutive tokens within one value."""
+        index = self.make_index()
+        assert [doc for doc, _ in index.search('"azure fundamentals"')] == ['a', 'b']
+
+    def test_field_weight_ranking(self):
+        """Test that matches in heavier fields rank first."""
+        index = self.make_index()
+        assert index.search('"azure fundamentals"')[0][0] == 'a'
+
+    def test_field_restriction(self):
+        """Test restricting matches to specific fields."""
+        index = self.make_index()
+        assert {doc for doc, _ in index.search('fundamentals', fields=['body'])} == {'b', 'c'}
+        assert index.search('security', fields=['body']) == []
+
+    def test_replace_and_remove(self):
+        """Test that re-adding replaces postings and removal cleans up."""
+        index = self.make_index()
+        index.add_document('a', {'title': 'Networking'})
+        assert [doc for doc, _ in index.search('networking')] == ['a']
+        assert 'a' not in {doc for doc, _ in index.search('azure')}
+        index.remove_document('a')
+        assert 'networking' not in index.postings
+        assert len(index) == 2
+
+    def test_limit(self):
+        """Test limiting the number of results."""
+        index = self.make_index()
+        assert len(index.search('azure', limit=2)) == 2
@@ -0,0 +1,128 @@
+"""
+Tests for versioning module
+"""
+
+import pytest
+from datetime import date, datetime
+from mcthelper.modules.clock import ManualClock
+from mcthelper.modules.compression import FieldCompressor
+from mcthelper.modules.course_details import CourseDetails
+from mcthelper.modules.summary_info import SummaryInfo
+from mcthelper.modules.versioning import VersionHistory
+
+
+def course(name, description='Introduction to Azure', topics=None):
+    """Build course data."""
+    return {'name': name, 'description': description, 'duration': 1,
+            'level': 'Beginner', 'topics': topics or ['Cloud Concepts', 'Azure Services']}
+
+
+@pytest.fixture
+def revised():
+    """CourseDetails with three revisions of AZ-900 on different days."""
+    clock = ManualClock('2024-01-10')
+    cd = CourseDetails(history=VersionHistory(clock))
+    cd.add_course('AZ-900', course('Azure Fundamentals'))
+    clock.set(datetime(2024, 6, 1, 9, 0))
+    cd.add_course('AZ-900', course('Microsoft Azure Fundamentals'))
+    clock.set(datetime(2024, 9, 15, 9, 0))
+    cd.add_course('AZ-900', course('Microsoft Azure Fundamentals', description='Cloud basics'))
+    return cd, clock
+
+
+class TestVersionHistory:
+    """Test cases for VersionHistory class."""
+
+    def test_read_by_version(self, revised):
+        """Test reading each revision by number."""
+        cd, _ = revised
+        assert cd.get_course('AZ-900', version=1)['name'] == 'Azure Fundamentals'
+        assert cd.get_course('AZ-900', version=2)['name'] == 'Microsoft Azure Fundamentals'
+        assert cd.get_course('AZ-900', version=3)['description'] == 'Cloud basics'
+        assert cd.get_course('AZ-900', version=4) is None
+        assert cd.get_course('AZ-900', version=0) is None
+        assert cd.get_course('AZ-900') == cd.get_course('AZ-900', version=3)
+
+    def test_read_as_of(self, revised):
+        """Test reading the revision current on a date."""
+        cd, _ = revised
+        assert cd.get_course('AZ-900', as_of='2024-01-09') is None
+        assert cd.get_course('AZ-900', as_of='2024-01-10')['name'] == 'Azure Fundamentals'
+        assert cd.get_course('AZ-900', as_of=date(2024, 6, 1))['name'] == 'Microsoft Azure Fundamentals'
+        assert cd.get_course('AZ-900', as_of=datetime(2024, 6, 1, 8, 0))['name'] == 'Azure Fundamentals'
+        assert cd.get_course('AZ-900', as_of='2030-01-01')['description'] == 'Cloud basics'
+
+    def test_unchanged_fields_are_shared(self, revised):
+        """Test that revisions share unchanged field objects."""
+        cd, _ = revised
+        first, second, third = (cd.get_course('AZ-900', version=v) for v in (1, 2, 3))
+        assert first['topics'] is second['topics'] is third['topics']
+        assert first['description'] is second['description']
+        assert second['name'] is third['name']
+
+    def test_versions_listing(self, revised):
+        """Test the revision summary."""
+        cd, _ = revised
+        versions = cd.history.versions('AZ-900')
+        assert [v['changed_fields'] for v in versions] == [
+            ['description', 'duration', 'level', 'name', 'topics'], ['name'], ['description']]
+        assert versions[1]['timestamp'] == '2024-06-01T09:00:00'
+        assert cd.history.latest_version('AZ-900') == 3
+
+    def test_edit_dict_and_readd(self):
+        """Test that revisions are snapshots, not the caller's dictionaries."""
+        cd = CourseDetails(history=VersionHistory(ManualClock('2024-01-10')))
+        info = course('Azure Fundamentals')
+        cd.add_course('AZ-900', info)
+        info['name'] = 'Microsoft Azure Fundamentals'
+        info['topics'].append('Pricing')
+        cd.add_course('AZ-900', info)
+        first = cd.get_course('AZ-900', version=1)
+        assert first['name'] == 'Azure Fundamentals'
+        assert first['topics'] == ('Cloud Concepts', 'Azure Services')
+        assert cd.get_course('AZ-900', version=2)['topics'] == (
+            'Cloud Concepts', 'Azure Services', 'Pricing')
+        assert [v['changed_fields'] for v in cd.history.versions('AZ-900')][1:] == [
+            ['name', 'topics']]
+        cd.get_course('AZ-900')['name'] = 'Edited'
+        cd.get_course('AZ-900', version=2)['name'] = 'Edited'
+        assert cd.get_course('AZ-900', version=2)['name'] == 'Microsoft Azure Fundamentals'
+
+    def test_removal_is_a_revision(self, revised):
+        """Test that removed courses stay readable in the past."""
+        cd, clock = revised
+        clock.advance(days=30)
+        cd.remove_course('AZ-900')
+        assert cd.get_course('AZ-900') is None
+        assert cd.get_course('AZ-900', as_of=clock.today()) is None
+        assert cd.get_course('AZ-900', as_of='2024-09-20')['description'] == 'Cloud basics'
+        assert cd.history.versions('AZ-900')[-1]['removed'] is True
+
+    def test_clock_set_back_keeps_order(self):
+        """Test that timestamps never decrease."""
+        clock = ManualClock('2024-05-01')
+        history = VersionHistory(clock)
+        history.record('X', {'a': 1})
+        clock.set(date(2024, 1, 1))
+        history.record('X', {'a': 2})
+        assert history.get('X', as_of='2024-05-01') == {'a': 2}
+
+    def test_without_history(self):
+        """Test that version reads need a history."""
+        cd = CourseDetails()
+        cd.add_course('AZ-900', course('Azure Fundamentals'))
+        assert cd.get_course('AZ-900', version=1) is None
+
+    def test_summary_history_with_compression(self):
+        """Test summary revisions with compressed fields."""
+        clock = ManualClock('2024-01-01')
+        si = SummaryInfo(compressor=FieldCompressor(threshold=10), history=VersionHistory(clock))
+        summary = {'overview': 'A long overview of Azure services ' * 3,
+                   'key_points': ['Point'], 'prerequisites': [], 'target_audience': 'All'}
+        si.add_summary('AZ-900', summary)
+        clock.advance(days=1)
+        si.add_summary('AZ-900', dict(summary, target_audience='Beginners'))
+        assert si.get_summary('AZ-900', version=1)['target_audience'] == 'All'
+        assert si.get_summary('AZ-900', as_of='2024-01-01')['overview'].startswith('A long')
+        assert si.summaries['AZ-900']['overview'] is si.history.get('AZ-900', 1)['overview']
+        assert si.history.versions('AZ-900')[1]['changed_fields'] == ['target_audience']